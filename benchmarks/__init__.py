@@ -0,0 +1 @@
+"""Benchmarks for JSON Translator."""
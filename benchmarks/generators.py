@@ -0,0 +1,119 @@
+"""Synthetic JSON documents for the JSON Translator benchmarks.
+
+Each generator is deterministic for a given scale and seed, so results can
+be compared from one run to the next.
+"""
+
+import random
+
+# Words used to build sentences
+WORDS = [
+    "account", "settings", "save", "cancel", "delete", "profile", "message", "search",
+    "upload", "download", "language", "password", "confirm", "welcome", "back", "next",
+    "error", "warning", "success", "loading", "please", "try", "again", "later",
+    "your", "the", "file", "was", "not", "found", "changes", "have", "been", "saved",
+]
+
+
+def make_sentence(rng, min_words=2, max_words=12):
+    """Build a random sentence.
+
+    Args:
+        rng (random.Random): Random number generator
+        min_words (int): Minimum number of words
+        max_words (int): Maximum number of words
+
+    Returns:
+        str: Sentence
+    """
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + "."
+
+
+def generate_wide(scale=1.0, seed=0):
+    """Generate a flat object with many keys (100k at scale 1).
+
+    Args:
+        scale (float): Size multiplier
+        seed (int): Random seed
+
+    Returns:
+        dict: JSON document
+    """
+    rng = random.Random(seed)
+    return {f"key_{i}": make_sentence(rng) for i in range(int(100000 * scale))}
+
+
+def generate_deep(scale=1.0, seed=0, depth=50):
+    """Generate chains of objects nested 50 levels deep.
+
+    Args:
+        scale (float): Size multiplier
+        seed (int): Random seed
+        depth (int): Nesting depth of each chain
+
+    Returns:
+        dict: JSON document
+    """
+    rng = random.Random(seed)
+    document = {}
+    for chain in range(max(1, int(2000 * scale))):
+        node = document[f"chain_{chain}"] = {}
+        for level in range(depth):
+            node["title"] = make_sentence(rng)
+            node = node.setdefault(f"level_{level}", {})
+        node["leaf"] = make_sentence(rng)
+    return document
+
+
+def generate_array_heavy(scale=1.0, seed=0):
+    """Generate lists of records mixing strings, numbers and nested lists.
+
+    Args:
+        scale (float): Size multiplier
+        seed (int): Random seed
+
+    Returns:
+        dict: JSON document
+    """
+    rng = random.Random(seed)
+    return {
+        f"list_{i}": [
+            {
+                "id": i * 100 + j,
+                "label": make_sentence(rng, 1, 4),
+                "enabled": rng.random() < 0.5,
+                "tags": [make_sentence(rng, 1, 2) for _ in range(rng.randint(0, 4))],
+            }
+            for j in range(50)
+        ]
+        for i in range(max(1, int(500 * scale)))
+    }
+
+
+def generate_high_duplication(scale=1.0, seed=0, unique_strings=200):
+    """Generate many keys sharing a small set of strings.
+
+    Args:
+        scale (float): Size multiplier
+        seed (int): Random seed
+        unique_strings (int): Number of distinct strings
+
+    Returns:
+        dict: JSON document
+    """
+    rng = random.Random(seed)
+    pool = [make_sentence(rng) for _ in range(unique_strings)]
+    return {
+        f"page_{i}": {f"label_{j}": rng.choice(pool) for j in range(20)}
+        for i in range(int(5000 * scale))
+    }
+
+
+# Generator of each benchmark document, by name
+GENERATORS = {
+    "wide": generate_wide,
+    "deep": generate_deep,
+    "array-heavy": generate_array_heavy,
+    "high-duplication": generate_high_duplication,
+}
@@ -0,0 +1,126 @@
+"""Benchmark the translation pipeline of JSON Translator.
+
+Runs translate_json on generated documents with the pseudo-localization
+backend, so no network access or API key is needed, and prints the time
+spent in each phase as JSON.
+
+Usage:
+    python -m benchmarks.run --documents wide,deep --languages 1,8,31 --output results.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.generators import GENERATORS
+from json_translator.translation.backends import PseudoBackend
+from json_translator.translation.metrics import TranslationMetrics
+from json_translator.translation.translator import translate_json
+from json_translator.utils.file_operations import load_json_file, save_json_file
+from json_translator.utils.language_utils import get_available_languages
+
+
+def run_benchmark(name, data, language_count, concurrency):
+    """Translate a document and time each phase.
+
+    Args:
+        name (str): Document name
+        data (dict): JSON document
+        language_count (int): Number of target languages
+        concurrency (int): Maximum number of batches translated at the same time
+
+    Returns:
+        dict: Benchmark result
+    """
+    target_languages = get_available_languages()[:language_count]
+    metrics = TranslationMetrics()
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_file = os.path.join(directory, f"{name}.json")
+        with open(input_file, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+        input_bytes = os.path.getsize(input_file)
+
+        started = time.perf_counter()
+        data = load_json_file(input_file)
+        load_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        translations = translate_json(data, target_languages, concurrency=concurrency,
+                                      backend=PseudoBackend(), quiet=True, metrics=metrics)
+        translate_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for lang, translated_data in translations.items():
+            save_json_file(translated_data, os.path.join(directory, f"{lang}.json"))
+        save_seconds = time.perf_counter() - started
+
+    phases = {"load": load_seconds, **metrics.phases, "save": save_seconds}
+    return {
+        "document": name,
+        "languages": language_count,
+        "input_bytes": input_bytes,
+        "strings": metrics.strings,
+        "unique_strings": metrics.unique_strings,
+        "requests": metrics.requests,
+        "seconds": round(load_seconds + translate_seconds + save_seconds, 3),
+        "phases": {phase: round(seconds, 3) for phase, seconds in phases.items()},
+    }
+
+
+def parse_args():
+    """Parse command-line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the JSON Translator pipeline")
+    parser.add_argument("--documents", default=",".join(GENERATORS),
+                        help=f"Comma-separated documents to generate ({', '.join(GENERATORS)})")
+    parser.add_argument("--languages", default="1,8,31",
+                        help="Comma-separated numbers of target languages to run with (default: 1,8,31)")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Size multiplier of the generated documents (default: 1.0)")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Maximum number of batches translated at the same time (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the generators (default: 0)")
+    parser.add_argument("--output", help="File to write the results to (default: standard output)")
+    return parser.parse_args()
+
+
+def main():
+    """Run the benchmarks and emit the results as JSON."""
+    args = parse_args()
+    documents = [name.strip() for name in args.documents.split(",") if name.strip()]
+    unknown = [name for name in documents if name not in GENERATORS]
+    if unknown:
+        sys.exit(f"Unknown documents: {', '.join(unknown)}")
+
+    max_languages = len(get_available_languages())
+    language_counts = [min(int(count), max_languages) for count in args.languages.split(",") if count.strip()]
+
+    results = []
+    for name in documents:
+        data = GENERATORS[name](scale=args.scale, seed=args.seed)
+        for language_count in language_counts:
+            result = run_benchmark(name, data, language_count, args.concurrency)
+            print(f"{name} x {language_count} languages: {result['seconds']}s", file=sys.stderr)
+            results.append(result)
+
+    output = {
+        "python": sys.version.split()[0],
+        "scale": args.scale,
+        "concurrency": args.concurrency,
+        "results": results,
+    }
+    if args.output:
+        save_json_file(output, args.output)
+    else:
+        print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Check the import cost of JSON Translator's command line.
+
+Imports json_translator.main in a fresh interpreter with ``-X importtime``
+and fails if a module that is only needed for translating is loaded at
+startup, or if the import takes longer than the budget. Prints the result
+as JSON.
+
+Usage:
+    python -m benchmarks.startup --budget-ms 250
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+
+# Modules that --help and --list-languages must not load
+DEFERRED_MODULES = [
+    "googleapiclient",
+    "google.cloud",
+    "grpc",
+    "requests",
+    "sqlite3",
+    "dotenv",
+    "rich.progress",
+    "json_translator.translation.translator",
+    "json_translator.utils.report",
+]
+
+_IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def measure_imports(module):
+    """Import a module in a fresh interpreter and collect its import times.
+
+    Args:
+        module (str): Module to import
+
+    Returns:
+        dict: Cumulative import time in microseconds, by module name
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+def parse_args():
+    """Parse command-line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Check the import cost of the JSON Translator command line")
+    parser.add_argument("--budget-ms", type=float, default=250.0,
+                        help="Maximum import time of json_translator.main in milliseconds (default: 250)")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="Number of measurements; the fastest is kept (default: 5)")
+    return parser.parse_args()
+
+
+def main():
+    """Measure the startup imports and exit with status 1 if they are over budget."""
+    args = parse_args()
+
+    runs = [measure_imports("json_translator.main") for _ in range(max(1, args.runs))]
+    times = min(runs, key=lambda run: run.get("json_translator.main", 0))
+    import_ms = times.get("json_translator.main", 0) / 1000
+
+    loaded = sorted(
+        name for name in times
+        if any(name == module or name.startswith(module + ".") for module in DEFERRED_MODULES)
+    )
+    result = {
+        "python": sys.version.split()[0],
+        "import_ms": round(import_ms, 1),
+        "budget_ms": args.budget_ms,
+        "deferred_modules_loaded": loaded,
+        "passed": not loaded and import_ms <= args.budget_ms,
+    }
+    print(json.dumps(result, indent=2))
+    if not result["passed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
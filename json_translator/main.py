@@ -1,38 +1,52 @@
 """Main module for JSON Translator."""
 
+import os
 import sys
+import time
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.prompt import Confirm
 from rich.text import Text
 
-# Load environment variables
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass  # python-dotenv not installed, will use os.environ directly
-
+# The translation pipeline, its progress bars and the translation backends'
+# SDKs are imported inside the functions that use them, so --help and
+# --list-languages don't pay for them.
 from json_translator.utils.file_operations import (
     load_json_file, 
-    save_json_file, 
+    save_json_files, 
     ensure_directory_exists
 )
 from json_translator.utils.language_utils import display_language_info
-from json_translator.translation.translator import translate_json
 from json_translator.ui.display import (
     display_app_header,
     display_comparison,
     display_translation_sample,
-    display_success_message
+    display_translation_samples,
+    get_translation_sample,
+    COMPARISON_PAGE_SIZE,
+    display_success_message,
+    display_cache_summary,
+    display_metrics_summary,
+    display_plan_summary,
+    display_save_summary
 )
 from json_translator.ui.cli import (
     parse_arguments,
+    parse_serve_arguments,
+    parse_worker_arguments,
+    load_supported_languages,
+    update_supported_languages,
     handle_list_languages_option,
     get_input_file,
+    get_input_files,
     get_target_languages,
     get_api_key,
+    get_translation_backend,
+    get_queue_backend,
+    get_work_queue,
+    get_translation_cache,
+    get_translation_journal,
+    get_skip_rules,
     get_output_directory,
     confirm_save_translations
 )
@@ -41,43 +55,138 @@ from json_translator.ui.cli import (
 console = Console(width=100, highlight=True)
 
 
-def main():
-    """Main function for the JSON Translator."""
-    # Display app header
-    display_app_header()
-
-    # Parse command line arguments
-    args = parse_arguments()
+def finish_journal(journal, translations, saved_files):
+    """Close the checkpoint journal, removing it once every translation is saved.
+    
+    Args:
+        journal (TranslationJournal or None): Checkpoint journal of the run
+        translations (list): Language codes with translations
+        saved_files (dict): Saved output path by language code
+    """
+    if journal is None:
+        return
+    if translations and all(lang in saved_files for lang in translations):
+        journal.remove()
+    else:
+        journal.close()
 
-    # Handle --list-languages option
-    if handle_list_languages_option(args):
-        sys.exit(0)
 
-    # Get input file
-    input_file = get_input_file(args)
+def get_skip_path_start(args):
+    """Return the number of leading keys left out of the paths the skip rules match.
     
-    # Load JSON with improved feedback
-    with console.status("[bold blue]Loading JSON file...", spinner="dots"):
-        data = load_json_file(input_file)
+    Directory mode translates one document keyed by file name, so the key
+    globs are matched against the paths inside each file.
     
-    console.print(f"[bold green]✓[/bold green] Loaded [bold]{len(data)}[/bold] translation keys from [bold cyan]{input_file}[/bold cyan]")
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        
+    Returns:
+        int: 1 in directory mode, 0 otherwise
+    """
+    return 1 if args.input_dir else 0
+
+
+def load_environment():
+    """Load environment variables from a .env file, if python-dotenv is installed."""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass  # python-dotenv not installed, will use os.environ directly
+
+
+def get_backend_and_languages(args):
+    """Configure the translation backend and get the target languages.
+
+    The backend answers from the work queue being merged with --merge. Its
+    supported languages are loaded first, so the target codes are checked
+    against them.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments
+
+    Returns:
+        tuple: (TranslationBackend, list of target language codes)
+    """
+    if args.merge:
+        backend = get_queue_backend(args)
+    else:
+        api_key = get_api_key(args) if args.backend in ("google", "rest") else None
+        backend = get_translation_backend(args, api_key)
 
-    # Get target languages
     target_languages = get_target_languages(args)
+    if not args.batch:
+        display_language_info(target_languages)
+    return backend, target_languages
+
+
+def run_translation(args, data, target_languages, backend, previous, cache, journal, **options):
+    """Run translate_json with the options of the command line, then close the cache and journal.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        data (dict): JSON data to translate
+        target_languages (list): Target language codes
+        backend (TranslationBackend): Translation backend
+        previous (dict or None): PreviousTranslation by language code, for incremental runs
+        cache (TranslationCache or None): Translation cache
+        journal (TranslationJournal or None): Checkpoint journal of the run
+        **options: Further translate_json arguments, overriding the ones taken from args
+
+    Returns:
+        dict: Result of translate_json
+    """
+    from json_translator.translation.translator import translate_json
+
+    options = {
+        "concurrency": args.concurrency,
+        "max_retries": args.max_retries,
+        "quiet": args.batch,
+        "skip_rules": get_skip_rules(args),
+        "skip_path_start": get_skip_path_start(args),
+        **options
+    }
+    try:
+        return translate_json(data, target_languages, cache=cache, previous=previous, backend=backend,
+                              journal=journal, **options)
+    finally:
+        if cache is not None:
+            cache.close()
+        if journal is not None:
+            journal.close()
+
+
+def finish_run(args, input_file, target_languages, metrics, translated_languages, saved_files,
+               failed_paths, timings, cache, backend):
+    """Write the run report and metrics if requested and exit with an error if nothing was translated.
     
-    # Display language information
-    display_language_info(target_languages)
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        input_file (str): Input file path
+        target_languages (list): Requested target language codes
+        metrics (TranslationMetrics): Metrics collected while translating
+        translated_languages (list): Language codes with at least one translated string
+        saved_files (dict): Saved output file path by language code
+        failed_paths (dict): Paths that could not be translated, by language code
+        timings (dict): Seconds spent in each phase of the run, by phase name
+        cache (TranslationCache or None): Translation cache used for the run
+        backend (TranslationBackend): Translation backend
+    """
+    from json_translator.utils.report import build_run_report, write_run_report
 
-    # Get API key
-    api_key = get_api_key(args)
+    if args.report:
+        report = build_run_report(input_file, target_languages, metrics, translated_languages, saved_files,
+                                  failed_paths=failed_paths, timings=timings, cache=cache,
+                                  backend_name=backend.name)
+        write_run_report(report, args.report)
 
-    # Translate the JSON
-    console.print()
-    translations = translate_json(data, target_languages, api_key)
-    console.print(f"[bold green]✓[/bold green] Translation complete! Translated to [bold]{len(translations)}[/bold] languages")
+    if args.prometheus:
+        from json_translator.utils.prometheus import write_prometheus_textfile
 
-    # If no translations were successful, exit
-    if not translations:
+        if not write_prometheus_textfile(metrics, args.prometheus, labels={"input": input_file}):
+            console.print(f"[bold yellow]Warning:[/bold yellow] Could not write metrics to {args.prometheus}")
+
+    if not translated_languages:
         console.print(Panel(
             "[bold red]No translations were completed successfully.[/bold red]\nPlease check your language codes and API credentials.",
             border_style="red",
@@ -85,52 +194,679 @@ def main():
         ))
         sys.exit(1)
 
-    # Show sample of translations
-    display_translation_sample(data, translations)
 
-    # Ask to view all translations
-    if Confirm.ask(Text("Show detailed comparison for all languages?", style="bold cyan")):
-        for lang, translated_data in translations.items():
-            from json_translator.utils.language_utils import get_language_name
-            language_name = get_language_name(lang)
-            
-            console.print()
-            display_comparison(data, translated_data, f"Complete {language_name} ({lang}) Translation Results")
+def plan_translation(args, input_path, data, target_languages, backend, previous, cache, journal):
+    """Plan a run without translating, then write the plan and exit.
+    
+    The plan goes through the same extraction, deduplication, reuse, journal
+    and cache lookups and batch packing as a real run. It is written as JSON
+    to the --plan file or standard output; the exit status is 2 when the
+    run would send more than --max-characters characters.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        input_path (str): Input file or directory path
+        data (dict): JSON data to translate
+        target_languages (list): Target language codes
+        backend (TranslationBackend): Translation backend
+        previous (dict or None): PreviousTranslation by language code, for incremental runs
+        cache (TranslationCache or None): Translation cache
+        journal (TranslationJournal or None): Journal of the run to resume
+    """
+    import json
+    from json_translator.translation.metrics import TranslationMetrics
+    from json_translator.translation.planner import build_translation_plan, load_past_latencies
+
+    past_latencies = None
+    if args.latency_report:
+        try:
+            past_latencies = load_past_latencies(args.latency_report)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            console.print(f"[bold yellow]Warning:[/bold yellow] Could not read latencies from "
+                          f"{args.latency_report}: {str(e)}")
+
+    metrics = TranslationMetrics()
+    work_units = []
+    run_translation(args, data, target_languages, backend, previous, cache, journal,
+                    quiet=True, metrics=metrics, plan=work_units)
+
+    plan = build_translation_plan(work_units, metrics, target_languages, args.concurrency,
+                                  backend_name=backend.name, past_latencies=past_latencies,
+                                  price_per_million=args.price_per_million)
+    plan = {"input": input_path, **plan}
+
+    if not args.batch:
+        console.print()
+        display_plan_summary(plan)
+
+    content = json.dumps(plan, indent=2, ensure_ascii=False)
+    if args.plan == "-":
+        print(content)
+    else:
+        try:
+            with open(args.plan, "w", encoding="utf-8") as file:
+                file.write(content + "\n")
+        except OSError as e:
+            console.print(Panel(f"[bold red]Error writing the plan:[/bold red] {str(e)}",
+                               border_style="red", title="Error"))
+            sys.exit(1)
+        if not args.batch:
+            console.print(f"[bold green]✓[/bold green] Plan written to [bold cyan]{args.plan}[/bold cyan]")
+
+    if args.max_characters is not None and plan["characters"] > args.max_characters:
+        console.print(Panel(f"[bold red]The run would send {plan['characters']:,} characters, more than the "
+                            f"limit of {args.max_characters:,}[/bold red]", border_style="red", title="Over Budget"))
+        sys.exit(2)
+
+
+def enqueue_translation(args, input_path, data, target_languages, backend, previous, cache, journal):
+    """Plan the batches of a run into a work queue for worker processes, then exit.
+    
+    The batches are planned as in a real run, so the strings found in the
+    previous translations, the journal or the cache are not queued. The
+    outputs are assembled once the workers are done by running the same
+    command with --merge.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        input_path (str): Input file or directory path
+        data (dict): JSON data to translate
+        target_languages (list): Target language codes
+        backend (TranslationBackend): Translation backend the workers will use
+        previous (dict or None): PreviousTranslation by language code, for incremental runs
+        cache (TranslationCache or None): Translation cache
+        journal (TranslationJournal or None): Journal of the run to resume
+    """
+    from json_translator.translation.metrics import TranslationMetrics
+    from json_translator.translation.translator import SOURCE_LANGUAGE
+
+    queue = get_work_queue(args.enqueue, create=True)
+    metrics = TranslationMetrics()
+    work_units = []
+    try:
+        run_translation(args, data, target_languages, backend, previous, cache, journal,
+                        metrics=metrics, plan=work_units)
+        queue.add_batches(work_units, {
+            "input": input_path,
+            "backend": backend.name,
+            "source_language": SOURCE_LANGUAGE,
+            "target_languages": target_languages,
+            "max_batch_size": backend.max_batch_size,
+            "max_batch_chars": backend.max_batch_chars,
+            "created_at": time.time(),
+        })
+    finally:
+        queue.close()
+
+    if not args.batch:
+        characters = sum(unit.characters for unit in work_units)
+        console.print(Panel(f"[bold green]Queued {len(work_units)} batches[/bold green] "
+                            f"({characters:,} characters, {len(target_languages)} languages) "
+                            f"in [bold cyan]{args.enqueue}[/bold cyan]\n"
+                            f"Run [bold]json-translator worker {args.enqueue}[/bold] on each worker, then this "
+                            f"command with [bold]--merge {args.enqueue}[/bold] instead of --enqueue",
+                            border_style="green", title="Work Queue"))
+
+
+def pipeline_translation(args, input_path, data, target_languages, backend, previous, cache, journal,
+                         output_dir, get_output_files, timings):
+    """Translate with each language saved and released as soon as it is complete.
+    
+    Completed languages are handed to a writer thread while the others are
+    still translating, so only the languages in flight are held in memory
+    and the first files are written after one language's worth of work.
+    Saving is confirmed up front and the preview shows samples kept from
+    each language.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        input_path (str): Input file or directory path
+        data (dict): JSON data to translate
+        target_languages (list): Target language codes
+        backend (TranslationBackend): Translation backend
+        previous (dict or None): PreviousTranslation by language code, for incremental runs
+        cache (TranslationCache or None): Translation cache
+        journal (TranslationJournal or None): Checkpoint journal of the run
+        output_dir (str): Output directory path
+        get_output_files (callable): Called with (language code, translated data, failed paths) and
+            returning (saved path, {output file: (translated data, source data, failed paths)})
+        timings (dict): Seconds spent in each phase of the run, by phase name; updated
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from json_translator.translation.incremental import save_source_snapshot
+    from json_translator.translation.leaf_index import LeafIndex
+    from json_translator.translation.metrics import TranslationMetrics
+
+    ensure_directory_exists(output_dir, quiet=args.batch)
+    if not confirm_save_translations(output_dir, assume_yes=args.batch):
+        if journal is not None:
+            journal.close()
+        return
+
+    failed_paths = {}
+    samples = {}
+    metrics = TranslationMetrics()
+    # Index of the original strings the samples are taken with
+    leaves = LeafIndex(data) if not args.batch else None
+
+    def save_language(files):
+        # Runs on the writer thread
+        for output_file in files:
+            ensure_directory_exists(os.path.dirname(output_file) or ".", quiet=True)
+
+        def on_saved(output_file, outcome):
+            if outcome is not None:
+                _, source, paths = files[output_file]
+                save_source_snapshot(source, output_file, paths)
+
+        return save_json_files({output_file: files[output_file][0] for output_file in files}, on_saved=on_saved)
+
+    def on_language_done(lang, document):
+        if not args.batch:
+            samples[lang] = get_translation_sample(leaves, document)
+        saved_path, files = get_output_files(lang, document, failed_paths.get(lang))
+        return saved_path, writer.submit(save_language, files)
+
+    if not args.batch:
+        console.print()
+    started = time.perf_counter()
+    writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="writer")
+    try:
+        pending_saves = run_translation(args, data, target_languages, backend, previous, cache, journal,
+                                        failed_paths=failed_paths, metrics=metrics,
+                                        on_language_done=on_language_done)
+    finally:
+        # Let the files already handed over finish writing
+        writer.shutdown()
+    timings["translate"] = time.perf_counter() - started
+
+    saved_files = {}
+    outcomes = {}
+    for lang, (saved_path, future) in pending_saves.items():
+        language_outcomes = future.result()
+        outcomes.update(language_outcomes)
+        if all(outcome is not None for outcome in language_outcomes.values()):
+            saved_files[lang] = saved_path
+
+    if not args.batch:
+        console.print(f"[bold green]✓[/bold green] Translation complete! Translated to [bold]{len(pending_saves)}[/bold] languages")
+        display_cache_summary(cache)
+        display_metrics_summary(metrics)
+        if samples:
+            display_translation_samples({lang: samples[lang] for lang in pending_saves if lang in samples})
+        display_save_summary(outcomes)
+        display_success_message([saved_files[lang] for lang in pending_saves if lang in saved_files])
+
+    finish_journal(journal, list(pending_saves), saved_files)
+    finish_run(args, input_path, target_languages, metrics, list(pending_saves), saved_files,
+               failed_paths, timings, cache, backend)
+
+
+def stream_translation(args, input_file):
+    """Translate an input file in streaming mode.
+    
+    The output files are written while translating, so there is no preview
+    and saving is confirmed up front.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        input_file (str): Input file path
+    """
+    from json_translator.translation.metrics import TranslationMetrics
+    from json_translator.translation.streaming import translate_json_stream
+
+    if args.incremental or args.plan or args.enqueue:
+        option = "--incremental" if args.incremental else "--plan" if args.plan else "--enqueue"
+        console.print(Panel(f"[bold red]Error:[/bold red] {option} can't be used with --stream",
+                           border_style="red", title="Error"))
+        sys.exit(1)
+
+    # Configure the translation backend and get the target languages
+    backend, target_languages = get_backend_and_languages(args)
 
     # Get output directory
-    console.print()
+    if not args.batch:
+        console.print()
     output_dir = get_output_directory(args)
+    ensure_directory_exists(output_dir, quiet=args.batch)
+    if not confirm_save_translations(output_dir, assume_yes=args.batch):
+        return
+
+    # Open the translation cache and the checkpoint journal
+    cache = get_translation_cache(args)
+    journal = get_translation_journal(args, output_dir, input_file, backend)
+
+    # Translate and save the JSON chunk by chunk
+    if not args.batch:
+        console.print()
+    output_files = {lang: f"{output_dir}/{lang}.json" for lang in target_languages}
+    failed_paths = {}
+    metrics = TranslationMetrics()
+    started = time.perf_counter()
+    try:
+        translated_languages = translate_json_stream(
+            input_file, output_files, target_languages, backend,
+            chunk_size=args.chunk_size, concurrency=args.concurrency, cache=cache,
+            max_retries=args.max_retries, failed_paths=failed_paths,
+            quiet=args.batch, metrics=metrics, journal=journal, skip_rules=get_skip_rules(args)
+        )
+    except ValueError as e:
+        console.print(Panel(f"[bold red]Error loading JSON file:[/bold red] {str(e)}", 
+                           border_style="red", title="Error"))
+        sys.exit(1)
+    finally:
+        if cache is not None:
+            cache.close()
+        if journal is not None:
+            journal.close()
+    timings = {"translate": time.perf_counter() - started}
+
+    if not args.batch:
+        console.print(f"[bold green]✓[/bold green] Translation complete! Translated to [bold]{len(translated_languages)}[/bold] languages")
+        display_cache_summary(cache)
+        display_metrics_summary(metrics)
+
+        for lang in translated_languages:
+            if failed_paths.get(lang):
+                console.print(f"[bold yellow]Warning:[/bold yellow] {len(failed_paths[lang])} strings could not be "
+                              f"translated to {lang} and keep their source text")
+
+    saved_files = {lang: output_files[lang] for lang in translated_languages}
+    finish_journal(journal, translated_languages, saved_files)
+    finish_run(args, input_file, target_languages, metrics, translated_languages, saved_files,
+               failed_paths, timings, cache, backend)
+
+    if not args.batch:
+        display_success_message(list(saved_files.values()))
+
+
+def translate_and_save(args, input_path, data, target_languages, backend, previous, output_dir,
+                       get_output_files, timings):
+    """Translate loaded input data and save the translations.
     
+    Opens the translation cache and the checkpoint journal, then plans,
+    enqueues, pipelines or translates the data as the options ask. After a
+    regular translation, the results are previewed and saved once confirmed.
+    File and directory mode only differ in how the input is collected and
+    which files each language is written to.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        input_path (str): Input file or directory path
+        data (dict): JSON data to translate
+        target_languages (list): Target language codes
+        backend (TranslationBackend): Translation backend
+        previous (dict or None): PreviousTranslation by language code, for incremental runs
+        output_dir (str): Output directory path
+        get_output_files (callable): Called with (language code, translated data, failed paths) and
+            returning (saved path, {output file: (translated data, source data, failed paths)})
+        timings (dict): Seconds spent in each phase of the run, by phase name; updated
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+    from json_translator.translation.incremental import save_source_snapshot
+    from json_translator.translation.leaf_index import LeafIndex
+    from json_translator.translation.metrics import TranslationMetrics
+
+    # Open the translation cache and the checkpoint journal
+    cache = get_translation_cache(args)
+    journal = get_translation_journal(args, output_dir, input_path, backend)
+
+    if args.plan:
+        plan_translation(args, input_path, data, target_languages, backend, previous, cache, journal)
+        return
+
+    if args.enqueue:
+        enqueue_translation(args, input_path, data, target_languages, backend, previous, cache, journal)
+        return
+
+    if args.pipeline:
+        pipeline_translation(args, input_path, data, target_languages, backend, previous, cache, journal,
+                             output_dir, get_output_files, timings)
+        return
+
+    # Translate the JSON
+    if not args.batch:
+        console.print()
+    failed_paths = {}
+    metrics = TranslationMetrics()
+    started = time.perf_counter()
+    translations = run_translation(args, data, target_languages, backend, previous, cache, journal,
+                                   failed_paths=failed_paths, metrics=metrics)
+    timings["translate"] = time.perf_counter() - started
+    if not args.batch:
+        console.print(f"[bold green]✓[/bold green] Translation complete! Translated to [bold]{len(translations)}[/bold] languages")
+        display_cache_summary(cache)
+        display_metrics_summary(metrics)
+
+    # If no translations were successful, report and exit
+    if not translations:
+        finish_run(args, input_path, target_languages, metrics, [], {}, failed_paths, timings, cache, backend)
+
+    if not args.batch:
+        # Index the original strings once for the sample and the comparisons
+        leaves = LeafIndex(data)
+
+        # Show sample of translations
+        display_translation_sample(data, translations, leaves=leaves)
+
+        # Ask to view all translations
+        if Confirm.ask(Text("Show detailed comparison for all languages?", style="bold cyan")):
+            for lang, translated_data in translations.items():
+                from json_translator.utils.language_utils import get_language_name
+                language_name = get_language_name(lang)
+                
+                console.print()
+                display_comparison(data, translated_data, f"Complete {language_name} ({lang}) Translation Results",
+                                   leaves=leaves, page_size=COMPARISON_PAGE_SIZE)
+
+        console.print()
+
     # Create directory if it doesn't exist
-    ensure_directory_exists(output_dir)
+    ensure_directory_exists(output_dir, quiet=args.batch)
     
-    # Save each translation to a separate file
-    if confirm_save_translations(output_dir):
+    # Save each translation to its output files
+    saved_files = {}
+    if confirm_save_translations(output_dir, assume_yes=args.batch):
+        started = time.perf_counter()
+        saved_paths = {}
+        files = {}
+        output_languages = {}
+        for lang, translated_data in translations.items():
+            saved_paths[lang], language_files = get_output_files(lang, translated_data, failed_paths.get(lang))
+            files.update(language_files)
+            output_languages.update(dict.fromkeys(language_files, lang))
+        for output_file in files:
+            ensure_directory_exists(os.path.dirname(output_file) or ".", quiet=True)
+
         with Progress(
             SpinnerColumn(style="green"),
             TextColumn("[bold blue]{task.description}"),
             BarColumn(bar_width=40),
             console=console,
+            disable=args.batch
         ) as progress:
-            save_task = progress.add_task("[bold green]Saving translations...", total=len(translations))
-            
-            saved_files = []
-            for lang, translated_data in translations.items():
-                output_file = f"{output_dir}/{lang}.json"
-                success = save_json_file(translated_data, output_file)
-                
-                if success:
-                    saved_files.append(output_file)
-                
+            save_task = progress.add_task("[bold green]Saving translations...", total=len(files))
+            failed_languages = set()
+
+            def on_saved(output_file, outcome):
+                if outcome is None:
+                    failed_languages.add(output_languages[output_file])
+                else:
+                    # Remember the source this file was translated from for incremental runs
+                    _, source, paths = files[output_file]
+                    save_source_snapshot(source, output_file, paths)
                 progress.update(save_task, advance=1)
+
+            outcomes = save_json_files({output_file: files[output_file][0] for output_file in files},
+                                       on_saved=on_saved)
+        # A language is saved once all of its files are
+        saved_files = {lang: saved_paths[lang] for lang in translations if lang not in failed_languages}
+        timings["save"] = time.perf_counter() - started
+        
+        if not args.batch:
+            display_save_summary(outcomes)
+            display_success_message(list(saved_files.values()))
+
+    finish_journal(journal, list(translations), saved_files)
+    finish_run(args, input_path, target_languages, metrics, list(translations), saved_files,
+               failed_paths, timings, cache, backend)
+
+
+def translate_file(args, input_file):
+    """Translate a JSON file, writing each language to ``<output>/<lang>.json``.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        input_file (str): Input file path
+    """
+    from json_translator.translation.incremental import load_previous_translation
+
+    # Load JSON with improved feedback
+    timings = {}
+    started = time.perf_counter()
+    if args.batch:
+        data = load_json_file(input_file)
+    else:
+        with console.status("[bold blue]Loading JSON file...", spinner="dots"):
+            data = load_json_file(input_file)
+        
+        console.print(f"[bold green]✓[/bold green] Loaded [bold]{len(data)}[/bold] translation keys from [bold cyan]{input_file}[/bold cyan]")
+    timings["load"] = time.perf_counter() - started
+
+    # Configure the translation backend and get the target languages
+    backend, target_languages = get_backend_and_languages(args)
+
+    # The output directory is needed up front for the checkpoint journal and,
+    # in incremental runs, to find the existing translations
+    output_dir = get_output_directory(args)
+    previous = None
+    if args.incremental:
+        previous = {}
+        for lang in target_languages:
+            previous_translation = load_previous_translation(f"{output_dir}/{lang}.json")
+            if previous_translation is not None:
+                previous[lang] = previous_translation
+
+    def get_output_files(lang, translated_data, paths):
+        output_file = f"{output_dir}/{lang}.json"
+        return output_file, {output_file: (translated_data, data, paths)}
+
+    translate_and_save(args, input_file, data, target_languages, backend, previous, output_dir,
+                       get_output_files, timings)
+
+
+def translate_directory(args):
+    """Translate every JSON file of the input directory in a single run.
+    
+    The files are translated as one document keyed by their relative path,
+    so batches are packed across file boundaries and share one backend
+    client and cache. Translations are written to a mirrored tree,
+    ``<output>/<lang>/<file>``.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+    """
+    from json_translator.translation.incremental import (
+        NO_SNAPSHOT,
+        PreviousTranslation,
+        load_previous_translation
+    )
+
+    if args.input or args.stream:
+        console.print(Panel("[bold red]Error:[/bold red] --input-dir can't be used with --input or --stream",
+                           border_style="red", title="Error"))
+        sys.exit(1)
+
+    input_dir = args.input_dir
+    input_files = get_input_files(args)
+
+    # Load every file
+    timings = {}
+    started = time.perf_counter()
+    if args.batch:
+        data = {file_name: load_json_file(os.path.join(input_dir, file_name)) for file_name in input_files}
+    else:
+        with console.status("[bold blue]Loading JSON files...", spinner="dots"):
+            data = {file_name: load_json_file(os.path.join(input_dir, file_name)) for file_name in input_files}
         
-        display_success_message(saved_files)
+        console.print(f"[bold green]✓[/bold green] Loaded [bold]{len(data)}[/bold] files from [bold cyan]{input_dir}[/bold cyan]")
+    timings["load"] = time.perf_counter() - started
+
+    # Configure the translation backend and get the target languages
+    backend, target_languages = get_backend_and_languages(args)
+
+    # The output directory is needed up front for the checkpoint journal and,
+    # in incremental runs, to find the existing translations
+    output_dir = get_output_directory(args)
+    previous = None
+    if args.incremental:
+        previous = {}
+        for lang in target_languages:
+            sources = {}
+            translations = {}
+            for file_name in input_files:
+                previous_translation = load_previous_translation(os.path.join(output_dir, lang, file_name))
+                if previous_translation is None:
+                    continue
+                # Without a snapshot, the existing translations of the file are kept unverified
+                sources[file_name] = (previous_translation.source if previous_translation.source is not None
+                                      else NO_SNAPSHOT)
+                translations[file_name] = previous_translation.translation
+            if translations:
+                previous[lang] = PreviousTranslation(sources, translations)
+
+    def get_output_files(lang, translated_data, paths):
+        # Paths of the combined document start with the file name
+        file_failed_paths = {}
+        for path in paths or []:
+            file_failed_paths.setdefault(path[0], []).append(path[1:])
+        return os.path.join(output_dir, lang), {
+            os.path.join(output_dir, lang, file_name):
+                (translated_data[file_name], data[file_name], file_failed_paths.get(file_name))
+            for file_name in input_files
+        }
+
+    translate_and_save(args, input_dir, data, target_languages, backend, previous, output_dir,
+                       get_output_files, timings)
+
+
+def serve(args):
+    """Run the translation service until interrupted.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments of the serve command
+    """
+    from json_translator.service import TranslationService, create_server
+
+    load_environment()
+    api_key = get_api_key(args) if args.backend in ("google", "rest") else None
+    backend = get_translation_backend(args, api_key)
+
+    service = TranslationService(backend, open_cache=lambda: get_translation_cache(args),
+                                 concurrency=args.concurrency, max_retries=args.max_retries,
+                                 batch_window=args.batch_window, skip_rules=get_skip_rules(args))
+    try:
+        server = create_server(service, host=args.host, port=args.port, socket_path=args.socket, quiet=args.quiet)
+    except OSError as e:
+        service.close()
+        console.print(Panel(f"[bold red]Error starting the service:[/bold red] {str(e)}",
+                           border_style="red", title="Error"))
+        sys.exit(1)
+
+    address = args.socket or f"http://{args.host}:{server.server_address[1]}"
+    console.print(Panel(f"[bold green]Translation service listening on[/bold green] [bold cyan]{address}[/bold cyan]\n"
+                        f"Backend: [bold]{backend.name}[/bold] · POST /translate · GET /health",
+                        border_style="green", title="JSON Translator Service"))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+    console.print("[bold yellow]Translation service stopped[/bold yellow]")
+
+
+def worker(args):
+    """Translate the batches of a work queue until none are left.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments of the worker command
+    """
+    from json_translator.translation.metrics import TranslationMetrics
+    from json_translator.translation.work_queue import DONE, FAILED
+    from json_translator.translation.worker import get_default_worker_id, run_worker
+
+    load_environment()
+    queue = get_work_queue(args.queue)
+    api_key = get_api_key(args) if args.backend in ("google", "rest") else None
+    backend = get_translation_backend(args, api_key)
+
+    # Translations of another backend would be cached under the wrong name when merged
+    queue_backend = queue.metadata.get("backend")
+    if backend.name != queue_backend:
+        queue.close()
+        console.print(Panel(f"[bold red]Error:[/bold red] The work queue was planned for the {queue_backend} "
+                            f"backend, not {backend.name}", border_style="red", title="Error"))
+        sys.exit(1)
+
+    worker_id = args.worker_id or get_default_worker_id()
+    if not args.quiet:
+        console.print(f"[bold blue]ℹ[/bold blue] Worker [bold]{worker_id}[/bold] translating batches "
+                      f"from [bold cyan]{args.queue}[/bold cyan]")
+
+    metrics = TranslationMetrics()
+    try:
+        translated_batches = run_worker(queue, backend, worker_id, concurrency=args.concurrency,
+                                        max_retries=args.max_retries, lease_seconds=args.lease,
+                                        max_attempts=args.max_attempts, metrics=metrics, quiet=args.quiet)
+        counts = queue.counts()
+    finally:
+        queue.close()
+
+    if not args.quiet:
+        display_metrics_summary(metrics)
+        console.print(f"[bold green]✓[/bold green] Translated [bold]{translated_batches}[/bold] batches; "
+                      f"[bold]{counts[DONE]}[/bold] of [bold]{sum(counts.values())}[/bold] batches of the queue "
+                      f"are done, [bold]{counts[FAILED]}[/bold] failed")
+
+
+def main():
+    """Main function for the JSON Translator."""
+    # The serve command runs the long-running translation service
+    if sys.argv[1:2] == ["serve"]:
+        serve(parse_serve_arguments(sys.argv[2:]))
+        return
+
+    # The worker command translates the batches of a shared work queue
+    if sys.argv[1:2] == ["worker"]:
+        worker(parse_worker_arguments(sys.argv[2:]))
+        return
+
+    # Parse command line arguments
+    args = parse_arguments()
+
+    # Display app header
+    if not args.batch:
+        display_app_header()
+
+    # Load the supported languages saved by earlier runs; with --update-languages,
+    # fetch them from the backend first
+    load_supported_languages(args)
+    if args.update_languages:
+        load_environment()
+        update_supported_languages(args)
+
+    # Handle --list-languages option
+    if handle_list_languages_option(args):
+        sys.exit(0)
+
+    # Load environment variables
+    load_environment()
+
+    # Directory mode translates many files in one run
+    if args.input_dir:
+        translate_directory(args)
+        return
+
+    # Get input file
+    input_file = get_input_file(args)
+
+    # Streaming mode translates and saves the input without loading it whole
+    if args.stream:
+        stream_translation(args, input_file)
+        return
+
+    translate_file(args, input_file)
 
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        console.print(Panel("\n[bold yellow]Translation canceled by user[/bold yellow]", 
+        console.print(Panel("\n[bold yellow]Translation canceled by user[/bold yellow]\n"
+                            "Completed batches are kept; run again with --resume to continue.", 
                            border_style="yellow", title="Canceled"))
         sys.exit(0) 
\ No newline at end of file
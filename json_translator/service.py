@@ -0,0 +1,276 @@
+"""Long-running translation service for JSON Translator.
+
+``json-translator serve`` keeps the translation backend, its worker threads
+and the translation cache warm between jobs. Jobs are JSON documents with
+their target languages, posted over HTTP on a TCP port or a Unix socket.
+Jobs arriving close together are coalesced: their documents are translated
+as one, so strings shared between jobs are translated once and batches are
+filled across jobs.
+
+Requests:
+    POST /translate  {"data": {...}, "target": ["fr", "de"]}
+        -> {"translations": {"fr": {...}, ...}, "failed_paths": {"fr": ["a.b"], ...}}
+    GET /health
+        -> {"status": "ok", "jobs": 12, "metrics": {...}}
+    GET /metrics
+        -> Service metrics in the Prometheus text format
+"""
+
+import json
+import os
+import queue
+import socketserver
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from json_translator.translation.metrics import TranslationMetrics
+from json_translator.translation.retry import DEFAULT_MAX_RETRIES
+from json_translator.translation.scheduler import DEFAULT_CONCURRENCY
+from json_translator.translation.translator import format_path, translate_json
+from json_translator.utils.language_utils import is_valid_language_code
+from json_translator.utils.prometheus import format_prometheus_metrics
+
+# Seconds to wait for more jobs before translating the queued ones together
+DEFAULT_BATCH_WINDOW = 0.05
+
+# Maximum number of jobs translated together
+MAX_COALESCED_JOBS = 100
+
+
+class TranslationJob:
+    """A document waiting to be translated by the service."""
+
+    def __init__(self, data, target_languages):
+        """Create a job.
+
+        Args:
+            data (dict or list): JSON data to translate
+            target_languages (list): Target language codes
+        """
+        self.data = data
+        self.target_languages = target_languages
+        self.translations = None
+        self.failed_paths = {}
+        self.error = None
+        self.done = threading.Event()
+
+
+class TranslationService:
+    """Translates queued jobs with a warm backend, worker pool and cache.
+
+    Jobs are translated on a single dispatcher thread, which also owns the
+    translation cache, so the cache is only used from one thread.
+    """
+
+    def __init__(self, backend, open_cache=None, concurrency=DEFAULT_CONCURRENCY,
+                 max_retries=DEFAULT_MAX_RETRIES, batch_window=DEFAULT_BATCH_WINDOW, skip_rules=None):
+        """Create the service.
+
+        Args:
+            backend (TranslationBackend): Translation backend
+            open_cache (callable, optional): Returns the TranslationCache to use, or None
+            concurrency (int): Maximum number of batches translated at the same time
+            max_retries (int): Maximum number of retries of a batch after a transient error
+            batch_window (float): Seconds to wait for more jobs before translating
+            skip_rules (SkipRules, optional): Rules for the strings to copy through without translating
+        """
+        self.backend = backend
+        self.max_retries = max_retries
+        self.batch_window = batch_window
+        self.skip_rules = skip_rules
+        self.metrics = TranslationMetrics()
+        self.completed_jobs = 0
+        self._open_cache = open_cache
+        self._executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+        self._queue = queue.Queue()
+        self._dispatcher = threading.Thread(target=self._run, name="translation-dispatcher", daemon=True)
+        self._dispatcher.start()
+
+    def translate(self, data, target_languages):
+        """Queue a job and wait for it to be translated.
+
+        Args:
+            data (dict or list): JSON data to translate
+            target_languages (list): Target language codes
+
+        Returns:
+            TranslationJob: The finished job
+        """
+        job = TranslationJob(data, target_languages)
+        self._queue.put(job)
+        job.done.wait()
+        return job
+
+    def close(self):
+        """Stop the dispatcher, the worker pool and close the cache."""
+        self._queue.put(None)
+        self._dispatcher.join()
+        self._executor.shutdown()
+
+    def _next_jobs(self):
+        # Wait for a job, then collect the jobs arriving within the batch window
+        job = self._queue.get()
+        if job is None:
+            return None
+        jobs = [job]
+        deadline = time.monotonic() + self.batch_window
+        while len(jobs) < MAX_COALESCED_JOBS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                job = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if job is None:
+                # Finish the collected jobs first
+                self._queue.put(None)
+                break
+            jobs.append(job)
+        return jobs
+
+    def _run(self):
+        cache = self._open_cache() if self._open_cache is not None else None
+        try:
+            while True:
+                jobs = self._next_jobs()
+                if jobs is None:
+                    break
+
+                # Jobs with the same target languages are translated as one document
+                groups = {}
+                for job in jobs:
+                    groups.setdefault(tuple(job.target_languages), []).append(job)
+                for target_languages, group in groups.items():
+                    self._translate_group(group, list(target_languages), cache)
+        finally:
+            if cache is not None:
+                cache.close()
+
+    def _translate_group(self, jobs, target_languages, cache):
+        combined = {str(position): job.data for position, job in enumerate(jobs)}
+        failed_paths = {}
+        try:
+            translations = translate_json(combined, target_languages, cache=cache, backend=self.backend,
+                                          max_retries=self.max_retries, failed_paths=failed_paths,
+                                          quiet=True, metrics=self.metrics, executor=self._executor,
+                                          skip_rules=self.skip_rules, skip_path_start=1)
+        except Exception as e:
+            translations = None
+            for job in jobs:
+                job.error = str(e)
+
+        for position, job in enumerate(jobs):
+            if translations is not None:
+                key = str(position)
+                job.translations = {lang: documents[key] for lang, documents in translations.items()}
+                # Paths of the combined document start with the job's key
+                for lang, paths in failed_paths.items():
+                    job_paths = [path[1:] for path in paths if path[0] == key]
+                    if job_paths:
+                        job.failed_paths[lang] = job_paths
+            self.completed_jobs += 1
+            job.done.set()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """HTTP interface of a TranslationService."""
+
+    server_version = "json-translator"
+
+    def _send_json(self, status, body):
+        content = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        service = self.server.service
+        if self.path == "/metrics":
+            content = format_prometheus_metrics(service.metrics).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+            return
+        if self.path != "/health":
+            self._send_json(404, {"error": "Not found"})
+            return
+        self._send_json(200, {
+            "status": "ok",
+            "backend": service.backend.name,
+            "jobs": service.completed_jobs,
+            "metrics": service.metrics.to_dict(),
+        })
+
+    def do_POST(self):
+        if self.path != "/translate":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            data = request["data"]
+            target_languages = request["target"]
+        except (ValueError, KeyError, TypeError):
+            self._send_json(400, {"error": 'Expected a JSON body with "data" and "target"'})
+            return
+        if isinstance(target_languages, str):
+            target_languages = target_languages.split(",")
+        invalid = [lang for lang in target_languages if not is_valid_language_code(lang)]
+        if invalid or not target_languages:
+            self._send_json(400, {"error": f"Invalid language codes: {', '.join(invalid)}"})
+            return
+
+        job = self.server.service.translate(data, target_languages)
+        if job.error is not None:
+            self._send_json(502, {"error": job.error})
+            return
+        self._send_json(200, {
+            "translations": job.translations,
+            "failed_paths": {
+                lang: [format_path(path) for path in paths] for lang, paths in job.failed_paths.items()
+            },
+        })
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def create_server(service, host="127.0.0.1", port=8765, socket_path=None, quiet=False):
+    """Create the HTTP server of a translation service.
+
+    Args:
+        service (TranslationService): Service translating the jobs
+        host (str): Address to listen on
+        port (int): TCP port to listen on
+        socket_path (str, optional): Listen on this Unix socket instead of TCP
+        quiet (bool): Don't log requests
+
+    Returns:
+        socketserver.BaseServer: Server; call serve_forever() to start it
+    """
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = _UnixHTTPServer(socket_path, _RequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), _RequestHandler)
+        server.daemon_threads = True
+    server.service = service
+    server.quiet = quiet
+    return server
@@ -0,0 +1,295 @@
+"""Translation backends for JSON Translator.
+
+A backend translates one batch of strings at a time and declares the limits
+of a single request. Backends must be safe to call from several threads.
+"""
+
+import gzip
+import json
+import random
+import threading
+import time
+from rich.console import Console
+from rich.panel import Panel
+
+# Initialize console
+console = Console(width=100, highlight=True)
+
+# Backends that can be selected on the command line
+BACKEND_NAMES = ["google", "rest", "pseudo"]
+
+
+class BackendError(Exception):
+    """Error returned by a translation backend."""
+
+    def __init__(self, message, status_code=None):
+        """Create a backend error.
+
+        Args:
+            message (str): Error message
+            status_code (int, optional): HTTP status code of the failed request
+        """
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class TranslationBackend:
+    """Base class for translation backends."""
+
+    # Name used to key the translation cache; backends that return the
+    # same translations share a name
+    name = None
+
+    # Maximum number of strings per request
+    max_batch_size = 100
+
+    # Maximum number of characters per request
+    max_batch_chars = 5000
+
+    def translate_batch(self, texts, target_language, source_language):
+        """Translate a batch of strings.
+
+        Args:
+            texts (list): Strings to translate
+            target_language (str): Target language code
+            source_language (str): Source language code
+
+        Returns:
+            list: Translated strings, in the same order as ``texts``
+        """
+        raise NotImplementedError
+
+    def get_supported_languages(self):
+        """Return the target languages the backend supports.
+
+        Returns:
+            dict or None: Language name in English by code, or None if the backend
+            has no list of supported languages
+        """
+        return None
+
+
+class GoogleApiKeyBackend(TranslationBackend):
+    """Google Translate v2 through googleapiclient, authenticated with an API key."""
+
+    name = "google-v2"
+    max_batch_size = 128
+    max_batch_chars = 5000
+
+    def __init__(self, api_key):
+        # Fails early with ImportError when googleapiclient is missing
+        from googleapiclient.discovery import build
+
+        self._build = build
+        self._api_key = api_key
+        self._local = threading.local()
+
+    def translate_batch(self, texts, target_language, source_language):
+        if not hasattr(self._local, "service"):
+            self._local.service = self._build('translate', 'v2', developerKey=self._api_key)
+        result = self._local.service.translations().list(
+            q=texts,
+            target=target_language,
+            source=source_language
+        ).execute()
+        return [translation['translatedText'] for translation in result.get('translations', [])]
+
+    def get_supported_languages(self):
+        service = self._build('translate', 'v2', developerKey=self._api_key)
+        result = service.languages().list(target="en").execute()
+        return {language["language"]: language["name"] for language in result.get("languages", [])}
+
+
+class GoogleCloudBackend(TranslationBackend):
+    """Google Translate v2 through google-cloud-translate, using application default credentials."""
+
+    name = "google-v2"
+    max_batch_size = 128
+    max_batch_chars = 5000
+
+    def __init__(self):
+        from google.cloud import translate_v2 as translate
+
+        self._client_class = translate.Client
+        self._local = threading.local()
+
+    def translate_batch(self, texts, target_language, source_language):
+        if not hasattr(self._local, "client"):
+            self._local.client = self._client_class()
+        results = self._local.client.translate(
+            texts, target_language=target_language, source_language=source_language
+        )
+        return [result["translatedText"] for result in results]
+
+    def get_supported_languages(self):
+        languages = self._client_class().get_languages(target_language="en")
+        return {language["language"]: language["name"] for language in languages}
+
+
+class GoogleRestBackend(TranslationBackend):
+    """Google Translate v2 over plain HTTPS with an API key.
+
+    Sends the same request as GoogleApiKeyBackend without the discovery
+    document machinery, on keep-alive connections pooled per worker thread.
+    """
+
+    name = "google-v2"
+    max_batch_size = 128
+    max_batch_chars = 5000
+
+    URL = "https://translation.googleapis.com/language/translate/v2"
+
+    # Seconds to wait for a connection and for a response
+    TIMEOUT = (10, 60)
+
+    def __init__(self, api_key, compress=False):
+        """Create the backend.
+
+        Args:
+            api_key (str): Google Translate API key
+            compress (bool): Send gzip-compressed request bodies
+        """
+        import requests
+
+        self._session_class = requests.Session
+        self._api_key = api_key
+        self._compress = compress
+        self._local = threading.local()
+
+    def _get_session(self):
+        if not hasattr(self._local, "session"):
+            session = self._session_class()
+            session.headers.update({"Content-Type": "application/json; charset=utf-8"})
+            if self._compress:
+                session.headers["Content-Encoding"] = "gzip"
+            self._local.session = session
+        return self._local.session
+
+    def translate_batch(self, texts, target_language, source_language):
+        body = json.dumps({"q": texts, "target": target_language, "source": source_language}).encode("utf-8")
+        if self._compress:
+            body = gzip.compress(body)
+        response = self._get_session().post(self.URL, params={"key": self._api_key}, data=body,
+                                            timeout=self.TIMEOUT)
+        if response.status_code != 200:
+            try:
+                message = response.json()["error"]["message"]
+            except (ValueError, KeyError, TypeError):
+                message = response.text
+            raise BackendError(f"HTTP {response.status_code}: {message}", status_code=response.status_code)
+        return [translation["translatedText"] for translation in response.json()["data"]["translations"]]
+
+    def get_supported_languages(self):
+        # The request has no body to compress
+        response = self._get_session().get(f"{self.URL}/languages", params={"key": self._api_key, "target": "en"},
+                                           headers={"Content-Encoding": None}, timeout=self.TIMEOUT)
+        if response.status_code != 200:
+            raise BackendError(f"HTTP {response.status_code}: {response.text}", status_code=response.status_code)
+        return {language["language"]: language["name"] for language in response.json()["data"]["languages"]}
+
+
+# Accented replacements used by the pseudo-localizer
+_PSEUDO_CHARACTERS = str.maketrans(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "àƀçđéƒĝĥîĵķļɱñöþǫŕšţûṽŵẋýžÀƁÇĐÉƑĜĤÎĴĶĻṀÑÖÞǪŔŠŢÛṼŴẊÝŽ"
+)
+
+
+def pseudo_localize(text, target_language):
+    """Pseudo-localize a string.
+
+    Letters are replaced with accented look-alikes and the result is tagged
+    with the target language. Placeholders in braces and HTML tags are left
+    untouched.
+
+    Args:
+        text (str): String to pseudo-localize
+        target_language (str): Target language code
+
+    Returns:
+        str: Pseudo-localized string
+    """
+    parts = []
+    protected = None
+    for char in text:
+        if protected is None and char in "{<":
+            protected = "}" if char == "{" else ">"
+        parts.append(char if protected is not None else char.translate(_PSEUDO_CHARACTERS))
+        if protected is not None and char == protected:
+            protected = None
+    return f"[{target_language}] {''.join(parts)}"
+
+
+class PseudoBackend(TranslationBackend):
+    """Offline backend returning pseudo-localized strings.
+
+    Useful for benchmarking and testing without network access or credentials.
+    Request latency and failures can be simulated.
+    """
+
+    name = "pseudo"
+
+    def __init__(self, latency=0.0, error_rate=0.0, seed=0):
+        """Create a pseudo-localization backend.
+
+        Args:
+            latency (float): Simulated seconds per request
+            error_rate (float): Fraction of requests that fail, between 0 and 1
+            seed (int): Seed for the simulated failures
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def translate_batch(self, texts, target_language, source_language):
+        if self.latency:
+            time.sleep(self.latency)
+        if self.error_rate:
+            with self._lock:
+                failed = self._random.random() < self.error_rate
+            if failed:
+                raise BackendError("Simulated translation failure", status_code=503)
+        return [pseudo_localize(text, target_language) for text in texts]
+
+
+def create_backend(name="google", api_key=None, quiet=False, **options):
+    """Create a translation backend.
+
+    Args:
+        name (str): Backend name ("google", "rest" or "pseudo")
+        api_key (str, optional): Google Translate API key
+        quiet (bool): Don't show which backend is used
+        **options: Extra arguments for the backend
+
+    Returns:
+        TranslationBackend: The backend
+    """
+    if name == "pseudo":
+        if not quiet:
+            console.print("[bold blue]ℹ[/bold blue] Using offline pseudo-localization backend")
+        return PseudoBackend(**options)
+
+    if name == "rest":
+        if not api_key:
+            raise ValueError("The rest backend needs a Google Translate API key")
+        if not quiet:
+            console.print("[bold green]✓[/bold green] Using Google Translate REST API with provided key")
+        return GoogleRestBackend(api_key, **options)
+
+    if name != "google":
+        raise ValueError(f"Unknown translation backend: {name}")
+
+    if api_key:
+        try:
+            backend = GoogleApiKeyBackend(api_key)
+            if not quiet:
+                console.print("[bold green]✓[/bold green] Using Google Translate API with provided key")
+            return backend
+        except ImportError:
+            console.print(Panel("[bold yellow]Warning:[/bold yellow] googleapiclient not installed. Falling back to application default credentials.",
+                               border_style="yellow", title="Warning"))
+    elif not quiet:
+        console.print("[bold blue]ℹ[/bold blue] Using Google Cloud application default credentials")
+
+    return GoogleCloudBackend()
@@ -0,0 +1,122 @@
+"""Batch planning for JSON Translator.
+
+Texts are packed into requests limited by both the number of strings and the
+total number of characters. Texts longer than a whole request are split into
+parts at sentence boundaries and reassembled after translation.
+"""
+
+import re
+from collections import namedtuple
+
+# A string sent for translation: a whole text, or one part of a split text.
+# ``index`` is the position of the text in the extracted text list and
+# ``part`` is the position of the part within the text, or None for whole texts.
+Segment = namedtuple("Segment", ["index", "part", "text"])
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。！？])(\s+)")
+_WORD_BOUNDARY = re.compile(r"(\s+)")
+
+
+def _pairs(tokens):
+    # re.split with a capturing group alternates pieces and separators
+    return zip(tokens[0::2], tokens[1::2] + [""])
+
+
+def split_text(text, max_chars):
+    """Split a text into parts no longer than max_chars.
+
+    The text is split at sentence boundaries where possible, then at
+    whitespace, and finally anywhere. Joining the parts with the returned
+    separators gives back the original text.
+
+    Args:
+        text (str): Text to split
+        max_chars (int): Maximum number of characters per part
+
+    Returns:
+        tuple: (parts, separators), with one separator between each pair of parts
+    """
+    # Break the text into pieces that each fit in a part
+    pieces = []
+    for sentence, sentence_separator in _pairs(_SENTENCE_BOUNDARY.split(text)):
+        if len(sentence) <= max_chars:
+            pieces.append((sentence, sentence_separator))
+            continue
+        for word, word_separator in _pairs(_WORD_BOUNDARY.split(sentence)):
+            chunks = [word[i : i + max_chars] for i in range(0, len(word), max_chars)] or [""]
+            pieces.extend((chunk, "") for chunk in chunks[:-1])
+            pieces.append((chunks[-1], word_separator))
+        pieces[-1] = (pieces[-1][0], sentence_separator)
+
+    # Merge consecutive pieces back together as long as they fit
+    parts = []
+    separators = []
+    current = None
+    current_separator = ""
+    for piece, separator in pieces:
+        if current is None:
+            current = piece
+        elif len(current) + len(current_separator) + len(piece) <= max_chars:
+            current += current_separator + piece
+        else:
+            parts.append(current)
+            separators.append(current_separator)
+            current = piece
+        current_separator = separator
+    parts.append(current)
+
+    return parts, separators
+
+
+def join_parts(parts, separators):
+    """Reassemble the parts of a split text.
+
+    Args:
+        parts (list): Translated parts
+        separators (list): Separators returned by split_text
+
+    Returns:
+        str: Reassembled text
+    """
+    pieces = []
+    for part, separator in zip(parts, separators + [""]):
+        pieces.append(part)
+        pieces.append(separator)
+    return "".join(pieces)
+
+
+def plan_batches(segments, max_batch_size, max_batch_chars):
+    """Pack segments into as few batches as possible.
+
+    Each batch starts with the longest remaining segments and is topped up
+    with the shortest ones, so both limits are used as fully as possible.
+    Every segment must be no longer than max_batch_chars.
+
+    Args:
+        segments (list): Segments to pack
+        max_batch_size (int): Maximum number of segments per batch
+        max_batch_chars (int): Maximum number of characters per batch
+
+    Returns:
+        list: List of batches, each a list of segments
+    """
+    ordered = sorted(segments, key=lambda segment: len(segment.text), reverse=True)
+    batches = []
+    longest = 0
+    shortest = len(ordered) - 1
+    while longest <= shortest:
+        batch = [ordered[longest]]
+        batch_chars = len(ordered[longest].text)
+        longest += 1
+        while (longest <= shortest and len(batch) < max_batch_size
+               and batch_chars + len(ordered[longest].text) <= max_batch_chars):
+            batch.append(ordered[longest])
+            batch_chars += len(ordered[longest].text)
+            longest += 1
+        while (longest <= shortest and len(batch) < max_batch_size
+               and batch_chars + len(ordered[shortest].text) <= max_batch_chars):
+            batch.append(ordered[shortest])
+            batch_chars += len(ordered[shortest].text)
+            shortest -= 1
+        batches.append(batch)
+    return batches
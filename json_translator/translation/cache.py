@@ -0,0 +1,191 @@
+"""Persistent translation memory for JSON Translator."""
+
+import hashlib
+import os
+import time
+from rich.console import Console
+from rich.panel import Panel
+
+# Initialize console
+console = Console(width=100, highlight=True)
+
+# Cache limits used when none are given on the command line
+DEFAULT_MAX_ENTRIES = 1000000
+DEFAULT_MAX_AGE_DAYS = 90
+
+CACHE_FILE_NAME = "translations.sqlite3"
+
+# Keep bulk queries under SQLite's host parameter limit
+_QUERY_CHUNK_SIZE = 500
+
+
+def get_default_cache_dir():
+    """Return the default directory for the translation cache.
+
+    Returns:
+        str: Cache directory path
+    """
+    base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base_dir, "json-translator")
+
+
+def _hash_text(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class TranslationCache:
+    """On-disk translation memory backed by SQLite in WAL mode.
+
+    Entries are keyed by (source text, source language, target language, backend).
+    The cache is meant to be used from a single thread.
+    """
+
+    def __init__(self, cache_dir, max_entries=DEFAULT_MAX_ENTRIES, max_age_days=DEFAULT_MAX_AGE_DAYS, refresh=False):
+        """Open (or create) the translation cache.
+
+        Args:
+            cache_dir (str): Directory holding the cache database
+            max_entries (int): Maximum number of entries kept after eviction
+            max_age_days (float): Entries older than this are evicted
+            refresh (bool): Ignore cached translations but still store new ones
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, CACHE_FILE_NAME)
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+
+        # Imported on first use, so commands that don't translate start faster
+        import sqlite3
+
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translations (
+                backend TEXT NOT NULL,
+                source_language TEXT NOT NULL,
+                target_language TEXT NOT NULL,
+                source_hash TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (backend, source_language, target_language, source_hash)
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS translations_accessed_at ON translations (accessed_at)"
+        )
+        self._connection.commit()
+        self.evict()
+
+    def get_many(self, texts, source_language, target_language, backend):
+        """Look up the cached translations of several texts.
+
+        Args:
+            texts (iterable): Source texts
+            source_language (str): Source language code
+            target_language (str): Target language code
+            backend (str): Name of the translation backend
+
+        Returns:
+            dict: Translated text by source text, for cached texts only
+        """
+        texts = list(texts)
+        if self.refresh:
+            self.misses += len(texts)
+            return {}
+
+        texts_by_hash = {}
+        for text in texts:
+            texts_by_hash.setdefault(_hash_text(text), []).append(text)
+
+        found = {}
+        hashes = list(texts_by_hash)
+        for i in range(0, len(hashes), _QUERY_CHUNK_SIZE):
+            chunk = hashes[i : i + _QUERY_CHUNK_SIZE]
+            rows = self._connection.execute(
+                "SELECT source_hash, translated_text FROM translations"
+                " WHERE backend = ? AND source_language = ? AND target_language = ?"
+                f" AND source_hash IN ({','.join('?' * len(chunk))})",
+                [backend, source_language, target_language] + chunk,
+            )
+            for source_hash, translated_text in rows:
+                for text in texts_by_hash[source_hash]:
+                    found[text] = translated_text
+
+        if found:
+            now = time.time()
+            self._connection.executemany(
+                "UPDATE translations SET accessed_at = ?"
+                " WHERE backend = ? AND source_language = ? AND target_language = ? AND source_hash = ?",
+                [(now, backend, source_language, target_language, _hash_text(text)) for text in found],
+            )
+            self._connection.commit()
+
+        self.hits += sum(1 for text in texts if text in found)
+        self.misses += sum(1 for text in texts if text not in found)
+        return found
+
+    def put_many(self, pairs, source_language, target_language, backend):
+        """Store several translations.
+
+        Args:
+            pairs (iterable): (source text, translated text) tuples
+            source_language (str): Source language code
+            target_language (str): Target language code
+            backend (str): Name of the translation backend
+        """
+        now = time.time()
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO translations"
+            " (backend, source_language, target_language, source_hash, translated_text, created_at, accessed_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (backend, source_language, target_language, _hash_text(text), translated_text, now, now)
+                for text, translated_text in pairs
+            ],
+        )
+        self._connection.commit()
+
+    def evict(self):
+        """Remove entries that are too old, then the least recently used ones above the size limit."""
+        if self.max_age_days is not None:
+            cutoff = time.time() - self.max_age_days * 86400
+            self._connection.execute("DELETE FROM translations WHERE created_at < ?", (cutoff,))
+        if self.max_entries is not None:
+            self._connection.execute(
+                "DELETE FROM translations WHERE rowid IN ("
+                " SELECT rowid FROM translations ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        self._connection.commit()
+
+    def close(self):
+        """Evict stale entries and close the database."""
+        self.evict()
+        self._connection.close()
+
+
+def open_translation_cache(cache_dir, **kwargs):
+    """Open the translation cache, warning instead of failing if it can't be used.
+
+    Args:
+        cache_dir (str): Directory holding the cache database
+        **kwargs: Extra arguments for TranslationCache
+
+    Returns:
+        TranslationCache or None: The cache, or None if it could not be opened
+    """
+    import sqlite3
+
+    try:
+        return TranslationCache(cache_dir, **kwargs)
+    except (OSError, sqlite3.Error) as e:
+        console.print(Panel(f"[bold yellow]Warning:[/bold yellow] Translation cache disabled: {str(e)}",
+                           border_style="yellow", title="Warning"))
+        return None
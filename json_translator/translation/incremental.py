@@ -0,0 +1,126 @@
+"""Incremental translation support for JSON Translator.
+
+An incremental run only translates the strings that were added or changed
+since the existing output files were written. To know what changed, a
+snapshot of the source document is stored next to every output file when
+it is saved.
+"""
+
+import copy
+import json
+import os
+from collections import namedtuple
+
+SNAPSHOT_DIR_NAME = ".snapshots"
+
+# Source document an output file was translated from, and the translated document.
+# ``source`` is None when no snapshot was stored for the output file.
+PreviousTranslation = namedtuple("PreviousTranslation", ["source", "translation"])
+
+# Stands in for the source of a part of a combined document that has no snapshot
+NO_SNAPSHOT = object()
+
+_MISSING = object()
+
+
+def get_snapshot_path(output_file):
+    """Return the path of the source snapshot stored for an output file.
+
+    Args:
+        output_file (str): Path of a translated output file
+
+    Returns:
+        str: Snapshot file path
+    """
+    directory, file_name = os.path.split(output_file)
+    return os.path.join(directory, SNAPSHOT_DIR_NAME, file_name)
+
+
+def _read_json(file_path):
+    try:
+        with open(file_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def load_previous_translation(output_file):
+    """Load an existing output file and the snapshot of the source it was translated from.
+
+    Args:
+        output_file (str): Path of a translated output file
+
+    Returns:
+        PreviousTranslation or None: Previous translation, or None if there is no usable output file
+    """
+    translation = _read_json(output_file)
+    if translation is None:
+        return None
+    return PreviousTranslation(_read_json(get_snapshot_path(output_file)), translation)
+
+
+def save_source_snapshot(data, output_file, untranslated_paths=None):
+    """Store a snapshot of the source document next to an output file.
+
+    Strings that could not be translated are left out of the snapshot, so
+    the next incremental run translates them again.
+
+    Args:
+        data (dict): Source JSON data the output file was translated from
+        output_file (str): Path of the translated output file
+        untranslated_paths (list, optional): Paths whose output value is still the source text
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if untranslated_paths:
+        data = copy.deepcopy(data)
+        for path in untranslated_paths:
+            target = data
+            for p in path[:-1]:
+                target = target[p]
+            target[path[-1]] = None
+
+    snapshot_path = get_snapshot_path(output_file)
+    try:
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        with open(snapshot_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+        return True
+    except OSError:
+        return False
+
+
+def _lookup(obj, path):
+    for p in path:
+        if obj is NO_SNAPSHOT:
+            return obj
+        try:
+            obj = obj[p]
+        except (KeyError, IndexError, TypeError):
+            return _MISSING
+    return obj
+
+
+def find_reusable_translation(previous, text, path):
+    """Find the existing translation of a text at one path, if it can be kept.
+
+    The translation is kept when the output file has a string at the path
+    and the source text there is unchanged since the snapshot. Without a
+    snapshot, changes can't be detected and the translation is kept
+    unverified.
+
+    Args:
+        previous (PreviousTranslation): Previous translation of the document
+        text (str): Current source text
+        path (list): Path of the text in the current source
+
+    Returns:
+        tuple: (existing translation or None if it can't be kept, True if it was checked against a snapshot)
+    """
+    source = NO_SNAPSHOT if previous.source is None else _lookup(previous.source, path)
+    verified = source is not NO_SNAPSHOT
+    if verified and source != text:
+        return None, True
+    translation = _lookup(previous.translation, path)
+    return (translation if isinstance(translation, str) else None), verified
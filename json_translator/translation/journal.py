@@ -0,0 +1,120 @@
+"""Checkpoint journal of completed batches for JSON Translator.
+
+Every batch translated during a run is appended to a journal file next to
+the output files as soon as it completes, and the journal is removed once
+the output files are saved. When a run is interrupted, the next run with
+``--resume`` reads the journal back and only translates what is left.
+
+Each line of the journal is a JSON object holding the backend, the target
+language and the (source text, translation) pairs of one batch. A line cut
+short by a crash is ignored.
+"""
+
+import json
+import os
+
+JOURNAL_DIR_NAME = ".journal"
+
+
+def get_journal_path(output_dir, input_path):
+    """Return the path of the journal of a run.
+
+    Args:
+        output_dir (str): Output directory of the run
+        input_path (str): Input file or directory of the run
+
+    Returns:
+        str: Journal file path
+    """
+    input_name = os.path.basename(os.path.normpath(input_path))
+    return os.path.join(output_dir, JOURNAL_DIR_NAME, f"{input_name}.jsonl")
+
+
+class TranslationJournal:
+    """Append-only journal of the translations completed during a run.
+
+    Like the translation cache, it is keyed by source text and meant to be
+    used from a single thread.
+    """
+
+    def __init__(self, path, backend_name, resume=False):
+        """Open the journal, starting a new one unless resuming.
+
+        Args:
+            path (str): Journal file path
+            backend_name (str): Name of the backend translating the run
+            resume (bool): Read back the existing journal and append to it
+        """
+        self.path = path
+        self.backend_name = backend_name
+        self._translations = {}
+
+        needs_newline = False
+        if resume and os.path.exists(path):
+            needs_newline = self._load()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+        if needs_newline:
+            # Don't append to a line cut short by a crash
+            self._file.write("\n")
+
+    def _load(self):
+        with open(self.path, "r", encoding="utf-8", errors="replace") as file:
+            content = file.read()
+        for line in content.splitlines():
+            try:
+                entry = json.loads(line)
+                if entry["backend"] != self.backend_name:
+                    continue
+                language = self._translations.setdefault(entry["language"], {})
+                for text, translation in entry["translations"]:
+                    language[text] = translation
+            except (ValueError, KeyError, TypeError):
+                continue
+        return bool(content) and not content.endswith("\n")
+
+    def __len__(self):
+        return sum(len(translations) for translations in self._translations.values())
+
+    def get_many(self, texts, target_language):
+        """Look up the journaled translations of several texts.
+
+        Args:
+            texts (list): Source texts
+            target_language (str): Target language code
+
+        Returns:
+            dict: Translation by source text, for the texts found in the journal
+        """
+        translations = self._translations.get(target_language, {})
+        return {text: translations[text] for text in texts if text in translations}
+
+    def record(self, pairs, target_language):
+        """Append the translations of a completed batch and flush them to disk.
+
+        Args:
+            pairs (list): (source text, translation) pairs
+            target_language (str): Target language code
+        """
+        if not pairs:
+            return
+        entry = {"backend": self.backend_name, "language": target_language, "translations": pairs}
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._translations.setdefault(target_language, {}).update(pairs)
+
+    def close(self):
+        """Close the journal, keeping it on disk for a later --resume."""
+        if not self._file.closed:
+            self._file.close()
+
+    def remove(self):
+        """Close and delete the journal once the output files are saved."""
+        self.close()
+        try:
+            os.remove(self.path)
+            os.rmdir(os.path.dirname(self.path))
+        except OSError:
+            pass  # Other journals are still in the directory
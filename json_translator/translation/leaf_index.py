@@ -0,0 +1,98 @@
+"""Flat index of the string leaves of a JSON document for JSON Translator.
+
+The index is built in a single pass and stores, for each string leaf, its
+text, the container holding it and its key in that container. Translated
+documents are built from the original document and a flat list of leaf
+values, instead of deep-copying the document and walking every path.
+"""
+
+
+def _iter_items(obj):
+    return iter(obj.items()) if isinstance(obj, dict) else enumerate(obj)
+
+
+class LeafIndex:
+    """String leaves of a JSON document, in document order."""
+
+    def __init__(self, data):
+        """Index the string leaves of a document.
+
+        Args:
+            data (dict or list): JSON data
+        """
+        self.data = data
+        # Text, parent container and key of each leaf
+        self.texts = []
+        self.parents = []
+        self.keys = []
+        # Parent container and key of each container; the root has no parent
+        self._container_parents = [None]
+        self._container_keys = [None]
+
+        if not isinstance(data, (dict, list)):
+            return
+
+        # Depth-first walk with an explicit stack, so deep documents don't hit the recursion limit
+        stack = [(0, _iter_items(data))]
+        while stack:
+            container, items = stack[-1]
+            for key, value in items:
+                if isinstance(value, (dict, list)):
+                    self._container_parents.append(container)
+                    self._container_keys.append(key)
+                    stack.append((len(self._container_parents) - 1, _iter_items(value)))
+                    break
+                if isinstance(value, str):
+                    self.texts.append(value)
+                    self.parents.append(container)
+                    self.keys.append(key)
+            else:
+                stack.pop()
+
+    def __len__(self):
+        return len(self.texts)
+
+    def path(self, leaf):
+        """Return the path of a leaf.
+
+        Args:
+            leaf (int): Leaf index
+
+        Returns:
+            list: Keys and list indices leading to the leaf
+        """
+        path = [self.keys[leaf]]
+        container = self.parents[leaf]
+        while self._container_parents[container] is not None:
+            path.append(self._container_keys[container])
+            container = self._container_parents[container]
+        path.reverse()
+        return path
+
+    def materialize(self, values):
+        """Build a copy of the document with its string leaves replaced.
+
+        Args:
+            values (list): New value of each leaf, in leaf order
+
+        Returns:
+            dict or list: New document; non-string values are shared with the original
+        """
+        values = iter(values)
+
+        def build(obj):
+            if isinstance(obj, dict):
+                return {
+                    key: build(value) if isinstance(value, (dict, list))
+                    else next(values) if isinstance(value, str) else value
+                    for key, value in obj.items()
+                }
+            return [
+                build(item) if isinstance(item, (dict, list))
+                else next(values) if isinstance(item, str) else item
+                for item in obj
+            ]
+
+        if not isinstance(self.data, (dict, list)):
+            return self.data
+        return build(self.data)
@@ -0,0 +1,314 @@
+"""Run metrics for JSON Translator."""
+
+import bisect
+import threading
+import time
+
+# Batch latency percentiles reported for each language
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+def percentile(values, percent):
+    """Return a percentile of a list of numbers, using the nearest-rank method.
+
+    Args:
+        values (list): Numbers, in any order
+        percent (float): Percentile between 0 and 100
+
+    Returns:
+        float: The percentile, or 0.0 for an empty list
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+class LatencyHistogram:
+    """Request latencies counted in fixed, geometrically spaced buckets.
+
+    Memory and the cost of reading percentiles stay constant however many
+    requests are recorded, so a long-running service can keep one for its
+    whole lifetime. Percentiles are the upper bound of the bucket holding
+    the nearest rank, within 10% of the exact value.
+    """
+
+    # Upper bounds of the buckets in seconds, 1ms to about 20 minutes
+    BOUNDS = tuple(0.001 * 1.1 ** i for i in range(147))
+
+    def __init__(self):
+        # The last bucket counts latencies above every bound
+        self.buckets = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        """Count one latency.
+
+        Args:
+            seconds (float): Latency in seconds
+        """
+        self.buckets[bisect.bisect_left(self.BOUNDS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def merge(self, other):
+        """Add the latencies counted by another histogram.
+
+        Args:
+            other (LatencyHistogram): Histogram to add
+        """
+        for bucket, count in enumerate(other.buckets):
+            self.buckets[bucket] += count
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent):
+        """Estimate a percentile of the latencies.
+
+        Args:
+            percent (float): Percentile between 0 and 100
+
+        Returns:
+            float: The percentile in seconds, or 0.0 without latencies
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                break
+        if bucket == len(self.BOUNDS):
+            return self.max
+        return min(self.BOUNDS[bucket], self.max)
+
+
+class LanguageMetrics:
+    """Counters for the translation of one language.
+
+    String counts are in distinct texts, as sent to the backend. Requests
+    count every attempt, including retries and failed requests.
+    """
+
+    def __init__(self):
+        self.cached = 0
+        self.reused = 0
+        # Reused translations that could not be checked against a source snapshot
+        self.unverified = 0
+        # Texts taken from the journal of an interrupted run
+        self.resumed = 0
+        self.translated = 0
+        self.failed = 0
+        self.requests = 0
+        self.retries = 0
+        # Characters of the successfully translated batches
+        self.characters_billed = 0
+        # Texts looked up in the translation cache and not found
+        self.cache_misses = 0
+        # Seconds taken by the requests
+        self.latency = LatencyHistogram()
+        # Leaves whose translation lost or duplicated a placeholder
+        self.placeholder_mismatches = 0
+        self.started = None
+        self.finished = None
+
+    @property
+    def seconds(self):
+        """Wall-clock seconds from the start of the run to the last finished request."""
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    def to_dict(self):
+        """Return the metrics as a JSON-serializable dictionary."""
+        return {
+            "cached": self.cached,
+            "reused": self.reused,
+            "unverified": self.unverified,
+            "resumed": self.resumed,
+            "translated": self.translated,
+            "failed": self.failed,
+            "requests": self.requests,
+            "retries": self.retries,
+            "characters_billed": self.characters_billed,
+            "cache_misses": self.cache_misses,
+            "placeholder_mismatches": self.placeholder_mismatches,
+            "seconds": round(self.seconds, 3),
+            "latency": {
+                **{f"p{percent}": round(self.latency.percentile(percent), 3) for percent in LATENCY_PERCENTILES},
+                "max": round(self.latency.max, 3),
+            },
+        }
+
+
+class TranslationMetrics:
+    """Counters collected by translate_json.
+
+    Calls for several documents, or several chunks of one document, can
+    share the same metrics to get totals for a whole run. Requests are
+    recorded from the worker threads; everything else is updated from the
+    thread calling translate_json. Other threads, such as the service's
+    HTTP handlers, read the metrics while holding ``lock``.
+    """
+
+    def __init__(self):
+        # Strings to translate, not counting the skipped ones
+        self.strings = 0
+        self.unique_strings = 0
+        # Strings copied through without translation, by skip rule
+        self.skipped = {}
+        self.skipped_characters = 0
+        self.languages = {}
+        # Seconds spent in each phase of translate_json, by phase name
+        self.phases = {}
+        # Reentrant, so languages can be created while recording a request
+        self.lock = threading.RLock()
+
+    def language(self, code):
+        """Return the metrics of a language, creating them if needed.
+
+        Args:
+            code (str): Language code
+
+        Returns:
+            LanguageMetrics: Metrics of the language
+        """
+        metrics = self.languages.get(code)
+        if metrics is None:
+            with self.lock:
+                metrics = self.languages.setdefault(code, LanguageMetrics())
+        return metrics
+
+    def start(self, codes):
+        """Mark the start of translation for several languages.
+
+        Args:
+            codes (list): Language codes
+        """
+        now = time.perf_counter()
+        for code in codes:
+            metrics = self.language(code)
+            if metrics.started is None:
+                metrics.started = now
+
+    def finish(self, code):
+        """Mark the end of a request for a language.
+
+        Args:
+            code (str): Language code
+        """
+        self.language(code).finished = time.perf_counter()
+
+    def record_request(self, code, seconds):
+        """Record a request sent to the backend. Safe to call from any thread.
+
+        Args:
+            code (str): Language code
+            seconds (float): Time taken by the request
+        """
+        with self.lock:
+            metrics = self.language(code)
+            metrics.requests += 1
+            metrics.latency.record(seconds)
+
+    def record_retry(self, code):
+        """Record the retry of a failed request. Safe to call from any thread.
+
+        Args:
+            code (str): Language code
+        """
+        with self.lock:
+            self.language(code).retries += 1
+
+    def record_skip(self, rule, characters):
+        """Record a string copied through by a skip rule.
+
+        Args:
+            rule (str): Name of the matching rule
+            characters (int): Length of the string
+        """
+        with self.lock:
+            self.skipped[rule] = self.skipped.get(rule, 0) + 1
+            self.skipped_characters += characters
+
+    def add_time(self, phase, seconds):
+        """Add time spent in a phase of translate_json.
+
+        Args:
+            phase (str): Phase name
+            seconds (float): Seconds spent
+        """
+        with self.lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @property
+    def requests(self):
+        """Total number of requests sent."""
+        return sum(metrics.requests for metrics in self.languages.values())
+
+    @property
+    def retries(self):
+        """Total number of retried requests."""
+        return sum(metrics.retries for metrics in self.languages.values())
+
+    @property
+    def characters_billed(self):
+        """Total number of characters successfully translated."""
+        return sum(metrics.characters_billed for metrics in self.languages.values())
+
+    @property
+    def cache_hits(self):
+        """Total number of texts found in the translation cache."""
+        return sum(metrics.cached for metrics in self.languages.values())
+
+    @property
+    def cache_misses(self):
+        """Total number of texts looked up in the translation cache and not found."""
+        return sum(metrics.cache_misses for metrics in self.languages.values())
+
+    @property
+    def cache_hit_rate(self):
+        """Fraction of cache lookups that found a translation."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+    @property
+    def skipped_strings(self):
+        """Total number of strings copied through by the skip rules."""
+        return sum(self.skipped.values())
+
+    @property
+    def dedup_savings(self):
+        """Fraction of strings not sent because the same text appears elsewhere."""
+        return 1 - self.unique_strings / self.strings if self.strings else 0.0
+
+    def to_dict(self):
+        """Return the metrics as a JSON-serializable dictionary. Safe to call from any thread."""
+        with self.lock:
+            return self._to_dict()
+
+    def _to_dict(self):
+        return {
+            "strings": self.strings,
+            "unique_strings": self.unique_strings,
+            "dedup_savings": round(self.dedup_savings, 4),
+            "skipped": {
+                "strings": self.skipped_strings,
+                "characters": self.skipped_characters,
+                "rules": dict(self.skipped),
+            },
+            "requests": self.requests,
+            "retries": self.retries,
+            "characters_billed": self.characters_billed,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": round(self.cache_hit_rate, 4),
+            "phases": {phase: round(seconds, 3) for phase, seconds in self.phases.items()},
+            "languages": {code: metrics.to_dict() for code, metrics in self.languages.items()},
+        }
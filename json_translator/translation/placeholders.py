@@ -0,0 +1,66 @@
+"""Placeholder masking for JSON Translator.
+
+Interpolation variables, printf-style conversions and inline HTML tags are
+replaced with numbered tokens before translation, so "Hello {name}" and
+"Hello {user}" are translated (and cached) as the same text, and the
+backend can't translate or mangle the variables. The original placeholders
+are put back into each translation afterwards.
+"""
+
+import re
+
+# Placeholders masked before translation
+PLACEHOLDER_PATTERN = re.compile(
+    # {{name}}, as used by Handlebars, Mustache and i18next
+    r"\{\{[^{}]*\}\}"
+    # {name}, {0} and ICU arguments without nested messages, e.g. {count, number}
+    r"|\{\s*[\w.$-]+\s*(?:,[^{}]*)?\}"
+    # %s, %d, %1$s, %(name)s
+    r"|%(?:\(\w+\)|\d+\$)?[-+#0]*\d*(?:\.\d+)?[sdifeEgGxXoc]"
+    # Inline HTML tags
+    r"|</?[A-Za-z][^<>]*>"
+)
+
+# Canonical tokens sent to the backend in place of the placeholders
+TOKEN_PATTERN = re.compile(r"\{(\d+)\}")
+
+
+def mask_placeholders(text):
+    """Replace the placeholders of a text with numbered tokens.
+
+    Args:
+        text (str): Source text
+
+    Returns:
+        tuple: Masked text, and the placeholders in token order
+    """
+    placeholders = []
+
+    def replace(match):
+        placeholders.append(match.group(0))
+        return f"{{{len(placeholders) - 1}}}"
+
+    return PLACEHOLDER_PATTERN.sub(replace, text), placeholders
+
+
+def restore_placeholders(text, placeholders):
+    """Put the original placeholders back into a translated text.
+
+    Args:
+        text (str): Translated masked text
+        placeholders (list): Placeholders returned by mask_placeholders
+
+    Returns:
+        tuple: Restored text, and whether every token was found exactly once
+    """
+    found = []
+
+    def replace(match):
+        token = int(match.group(1))
+        if token >= len(placeholders):
+            return match.group(0)
+        found.append(token)
+        return placeholders[token]
+
+    restored = TOKEN_PATTERN.sub(replace, text)
+    return restored, sorted(found) == list(range(len(placeholders)))
@@ -0,0 +1,110 @@
+"""Dry-run translation plans for JSON Translator.
+
+A plan is built from the work units translate_json would send, after
+extraction, deduplication, reuse of previous translations, the journal and
+the translation cache, so it counts exactly the requests and characters a
+real run would send. Its duration is estimated from the request latencies
+of a past run report, when one is given.
+"""
+
+import json
+
+from json_translator.translation.metrics import percentile
+
+# Seconds per request assumed when no past latency is known
+DEFAULT_REQUEST_LATENCY = 0.5
+
+# Google Cloud Translation price in USD per million characters
+DEFAULT_PRICE_PER_MILLION = 20.0
+
+
+def load_past_latencies(report_path):
+    """Read the median request latency of each language from a run report.
+
+    Args:
+        report_path (str): Path of a report written with --report
+
+    Returns:
+        dict: Median latency in seconds by language code, for the languages that sent requests
+    """
+    with open(report_path, "r", encoding="utf-8") as file:
+        report = json.load(file)
+
+    latencies = {}
+    for code, language in (report.get("languages") or {}).items():
+        if language.get("requests") and language.get("latency"):
+            latencies[code] = float(language["latency"]["p50"])
+    return latencies
+
+
+def build_translation_plan(work_units, metrics, target_languages, concurrency, backend_name=None,
+                           past_latencies=None, price_per_million=DEFAULT_PRICE_PER_MILLION):
+    """Build the plan of a run from the work units it would send.
+
+    The duration assumes the requests of all languages share the worker
+    pool, each taking the past median latency of its language, or of all
+    languages for a language without history.
+
+    Args:
+        work_units (list): WorkUnits planned by translate_json
+        metrics (TranslationMetrics): Metrics filled by translate_json while planning
+        target_languages (list): Target language codes
+        concurrency (int): Maximum number of requests in flight
+        backend_name (str, optional): Name of the translation backend
+        past_latencies (dict, optional): Median request latency in seconds by language code
+        price_per_million (float): Price per million billed characters
+
+    Returns:
+        dict: JSON-serializable plan
+    """
+    past_latencies = past_latencies or {}
+    default_latency = (percentile(list(past_latencies.values()), 50) if past_latencies
+                       else DEFAULT_REQUEST_LATENCY)
+
+    languages = {}
+    for code in target_languages:
+        language_metrics = metrics.language(code)
+        languages[code] = {
+            "reused": language_metrics.reused,
+            "unverified": language_metrics.unverified,
+            "resumed": language_metrics.resumed,
+            "cached": language_metrics.cached,
+            "pending": 0,
+            "requests": 0,
+            "characters": 0,
+            "request_latency": round(past_latencies.get(code, default_latency), 3),
+        }
+
+    request_seconds = []
+    pending = {code: set() for code in target_languages}
+    for unit in work_units:
+        language = languages[unit.language]
+        language["requests"] += 1
+        language["characters"] += unit.characters
+        pending[unit.language].update(segment.index for segment in unit.segments)
+        request_seconds.append(past_latencies.get(unit.language, default_latency))
+    for code, language in languages.items():
+        language["pending"] = len(pending[code])
+        language["estimated_cost"] = round(language["characters"] * price_per_million / 1_000_000, 2)
+
+    # The pool runs `concurrency` requests at a time, and no faster than its slowest request
+    workers = max(1, concurrency)
+    estimated_seconds = max(sum(request_seconds) / workers, max(request_seconds)) if request_seconds else 0.0
+
+    characters = sum(language["characters"] for language in languages.values())
+    return {
+        "backend": backend_name,
+        "strings": metrics.strings,
+        "unique_strings": metrics.unique_strings,
+        "dedup_savings": round(metrics.dedup_savings, 4),
+        "skipped_strings": metrics.skipped_strings,
+        "skipped_characters": metrics.skipped_characters,
+        "requests": len(work_units),
+        "characters": characters,
+        "estimated_cost": round(characters * price_per_million / 1_000_000, 2),
+        "price_per_million": price_per_million,
+        "concurrency": workers,
+        "latency_source": "report" if past_latencies else "default",
+        "estimated_seconds": round(estimated_seconds, 1),
+        "languages": languages,
+    }
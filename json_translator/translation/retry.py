@@ -0,0 +1,83 @@
+"""Retrying failed translation requests for JSON Translator."""
+
+import random
+import time
+
+# Retry settings used when none are given on the command line
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 30.0
+
+# HTTP status codes worth retrying: timeouts, rate limits and server errors
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+def get_status_code(error):
+    """Return the HTTP status code carried by an exception, if any.
+
+    Understands googleapiclient, google-api-core and requests exceptions.
+
+    Args:
+        error (Exception): Exception raised by a backend
+
+    Returns:
+        int or None: HTTP status code
+    """
+    for attribute in ("status_code", "code"):
+        value = getattr(error, attribute, None)
+        if isinstance(value, int):
+            return value
+    for attribute in ("resp", "response"):
+        response = getattr(error, attribute, None)
+        for status_attribute in ("status", "status_code"):
+            value = getattr(response, status_attribute, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def is_retryable_error(error):
+    """Check whether a failed request may succeed when sent again.
+
+    Args:
+        error (Exception): Exception raised by a backend
+
+    Returns:
+        bool: True for transient errors, False for fatal ones
+    """
+    status_code = get_status_code(error)
+    if status_code is not None:
+        return status_code in RETRYABLE_STATUS_CODES
+    # Connection resets, timeouts and other network errors
+    return isinstance(error, OSError)
+
+
+def call_with_retry(func, max_retries=DEFAULT_MAX_RETRIES, base_delay=DEFAULT_BASE_DELAY,
+                    max_delay=DEFAULT_MAX_DELAY, on_retry=None):
+    """Call a function, retrying transient errors with jittered exponential backoff.
+
+    Args:
+        func (callable): Function to call without arguments
+        max_retries (int): Maximum number of retries after the first attempt
+        base_delay (float): Upper bound of the first delay in seconds
+        max_delay (float): Upper bound of any delay in seconds
+        on_retry (callable, optional): Called with (attempt, exception) before each retry
+
+    Returns:
+        The return value of ``func``
+
+    Raises:
+        Exception: The last error, once it is fatal or retries are exhausted
+    """
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= max_retries or not is_retryable_error(e):
+                raise
+            attempt += 1
+            if on_retry is not None:
+                on_retry(attempt, e)
+            # "Full jitter": spread retries evenly up to the backoff ceiling
+            time.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1))))
@@ -0,0 +1,121 @@
+"""Concurrent scheduling of translation work for JSON Translator."""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from json_translator.translation.batching import plan_batches
+
+# Default number of batches in flight at once
+DEFAULT_CONCURRENCY = 8
+
+# A single batch of segments to translate into one language, and the number
+# of characters it is billed for
+WorkUnit = namedtuple("WorkUnit", ["language", "segments", "texts", "characters"])
+
+
+def plan_work_units(pending, segments, max_batch_size, max_batch_chars):
+    """Split the translation of texts into (language, batch) work units.
+
+    Languages with the same pending texts share one packing, planned once;
+    their work units share the same segment and text lists. Billed characters
+    are counted once per packed batch.
+
+    Args:
+        pending (dict): Indices of the texts still to translate, by language code
+        segments (list): Segments of each extracted text
+        max_batch_size (int): Maximum number of segments per batch
+        max_batch_chars (int): Maximum number of characters per batch
+
+    Returns:
+        list: List of WorkUnit, grouped by language in the given order
+    """
+    # Batches and their texts by pending indices, usually the same for every language
+    planned = {}
+    work_units = []
+    for language, indices in pending.items():
+        key = tuple(indices)
+        batches = planned.get(key)
+        if batches is None:
+            language_segments = [segment for index in indices for segment in segments[index]]
+            batches = planned[key] = []
+            for batch in plan_batches(language_segments, max_batch_size, max_batch_chars):
+                texts = [segment.text for segment in batch]
+                batches.append((batch, texts, sum(map(len, texts))))
+        work_units.extend(WorkUnit(language, batch, texts, characters) for batch, texts, characters in batches)
+    return work_units
+
+
+def run_work_units(units, execute, on_success, on_failure, concurrency=DEFAULT_CONCURRENCY, executor=None):
+    """Run work units on a bounded worker pool.
+
+    ``execute`` runs on the worker threads. ``on_success`` and ``on_failure``
+    always run on the calling thread, one at a time, so they can update shared
+    state and progress bars without locking. When ``on_failure`` returns
+    True, the remaining units of the same language are skipped.
+
+    A long-running caller can pass its own executor, so the worker threads
+    (and the backend clients they hold) are reused from one call to the
+    next; it is left running and ``concurrency`` is ignored.
+
+    Args:
+        units (list): Work units to run
+        execute (callable): Function taking a WorkUnit and returning its result
+        on_success (callable): Called with (unit, result) for each successful unit
+        on_failure (callable): Called with (unit, exception) for each failed unit; returns
+            True to give up on the unit's language
+        concurrency (int): Maximum number of units running at the same time
+        executor (ThreadPoolExecutor, optional): Worker pool to run the units on
+
+    Returns:
+        set: Language codes that were given up on
+    """
+    failed_languages = set()
+
+    # Run inline when no parallelism is requested
+    if executor is None and concurrency <= 1:
+        for unit in units:
+            if unit.language in failed_languages:
+                continue
+            try:
+                result = execute(unit)
+            except Exception as e:
+                if on_failure(unit, e):
+                    failed_languages.add(unit.language)
+                continue
+            on_success(unit, result)
+        return failed_languages
+
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+    futures = {}
+    try:
+        for unit in units:
+            futures[executor.submit(execute, unit)] = unit
+
+        for future in as_completed(futures):
+            unit = futures[future]
+            if unit.language in failed_languages:
+                continue
+            try:
+                result = future.result()
+            except Exception as e:
+                if on_failure(unit, e):
+                    failed_languages.add(unit.language)
+                    # Drop the queued batches of the failed language
+                    for other_future, other_unit in futures.items():
+                        if other_unit.language == unit.language:
+                            other_future.cancel()
+                continue
+            on_success(unit, result)
+    except BaseException:
+        # Don't wait for queued batches when interrupted (e.g. Ctrl-C)
+        for future in futures:
+            future.cancel()
+        if owns_executor:
+            executor.shutdown(wait=False)
+        raise
+    if owns_executor:
+        executor.shutdown()
+
+    return failed_languages
@@ -0,0 +1,104 @@
+"""Rules for strings that are copied through without translation.
+
+Some string values have nothing to translate: URLs, email addresses, hex
+colours, numbers, ISO dates, empty strings. Others are kept in English on
+purpose, such as brand names. Leaves matched by a rule keep their source
+text and are never sent to the backend.
+
+Rules are compiled once into a few regular expressions, so checking a leaf
+costs at most one match per kind of rule.
+"""
+
+import fnmatch
+import re
+
+# Built-in detectors, matched against the whole value (surrounding whitespace allowed)
+BUILTIN_DETECTORS = {
+    "empty": r"",
+    "url": r"(?:[A-Za-z][A-Za-z0-9+.-]*://|www\.)\S+",
+    "email": r"(?:mailto:)?[\w.+-]+@[\w-]+(?:\.[\w-]+)+",
+    "color": r"#(?:[0-9A-Fa-f]{3,4}|[0-9A-Fa-f]{6}|[0-9A-Fa-f]{8})",
+    "number": r"[-+]?(?:\d{1,3}(?:[,\s]\d{3})+|\d+)(?:[.,]\d+)?%?",
+    "date": r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?"
+            r"|\d{2}:\d{2}(?::\d{2})?",
+}
+
+# Rule names reported for the configurable rules
+ONLY_KEYS_RULE = "only-keys"
+SKIP_KEYS_RULE = "skip-keys"
+SKIP_VALUES_RULE = "skip-values"
+
+
+def _compile_any(patterns):
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+def _compile_globs(globs):
+    if not globs:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(glob)})" for glob in globs))
+
+
+class SkipRules:
+    """Compiled rules deciding which string leaves are not translated."""
+
+    def __init__(self, detectors=tuple(BUILTIN_DETECTORS), only_keys=None, skip_keys=None,
+                 skip_values=None, translate_values=None):
+        """Compile the rules.
+
+        Args:
+            detectors (iterable): Names of the built-in detectors to use
+            only_keys (list, optional): Key path globs; when given, other leaves are skipped
+            skip_keys (list, optional): Key path globs of leaves to skip, e.g. "brand.*"
+            skip_values (list, optional): Regular expressions; leaves whose value contains a match are skipped
+            translate_values (list, optional): Regular expressions; leaves whose value contains a match
+                are translated even if a built-in detector matches them
+
+        Raises:
+            ValueError: For an unknown detector name
+            re.error: For an invalid regular expression
+        """
+        unknown = [name for name in detectors if name not in BUILTIN_DETECTORS]
+        if unknown:
+            raise ValueError(f"Unknown detectors: {', '.join(unknown)}")
+
+        self._detectors = None
+        if detectors:
+            alternatives = "|".join(f"(?P<{name}>{BUILTIN_DETECTORS[name]})" for name in detectors)
+            self._detectors = re.compile(rf"\s*(?:{alternatives})\s*")
+        self._only_keys = _compile_globs(only_keys)
+        self._skip_keys = _compile_globs(skip_keys)
+        self._skip_values = _compile_any(skip_values)
+        self._translate_values = _compile_any(translate_values)
+
+    @property
+    def uses_paths(self):
+        """Whether the rules need the key path of each leaf."""
+        return self._only_keys is not None or self._skip_keys is not None
+
+    def match(self, text, path=None):
+        """Find the rule skipping a leaf.
+
+        Args:
+            text (str): Value of the leaf
+            path (str, optional): Dotted key path of the leaf, needed when uses_paths is True
+
+        Returns:
+            str or None: Name of the matching rule, or None if the leaf is translated
+        """
+        if path is not None:
+            if self._only_keys is not None and not self._only_keys.match(path):
+                return ONLY_KEYS_RULE
+            if self._skip_keys is not None and self._skip_keys.match(path):
+                return SKIP_KEYS_RULE
+        if self._skip_values is not None and self._skip_values.search(text):
+            return SKIP_VALUES_RULE
+        if self._translate_values is not None and self._translate_values.search(text):
+            return None
+        if self._detectors is not None:
+            match = self._detectors.fullmatch(text)
+            if match:
+                return match.lastgroup
+        return None
@@ -0,0 +1,190 @@
+"""Streaming translation of large JSON files for JSON Translator.
+
+The input file is parsed incrementally and its strings are translated in
+chunks. Each chunk is written to every language's output file as soon as it
+is translated, in the original key order, so memory use depends on the
+chunk size rather than on the size of the file.
+"""
+
+import os
+from rich.console import Console
+
+from json_translator.translation.incremental import get_snapshot_path
+from json_translator.translation.retry import DEFAULT_MAX_RETRIES
+from json_translator.translation.scheduler import DEFAULT_CONCURRENCY
+from json_translator.utils.json_stream import JsonStreamWriter, iter_json_events
+
+# Initialize console
+console = Console(width=100, highlight=True)
+
+# Number of strings translated at a time
+DEFAULT_CHUNK_SIZE = 10000
+
+# Parser events kept in memory per string before a chunk is flushed anyway
+_EVENTS_PER_STRING = 8
+
+
+def translate_json_stream(input_file, output_files, target_languages, backend, chunk_size=DEFAULT_CHUNK_SIZE,
+                          concurrency=DEFAULT_CONCURRENCY, cache=None, max_retries=DEFAULT_MAX_RETRIES,
+                          failed_paths=None, quiet=False, metrics=None, journal=None, skip_rules=None):
+    """Translate a JSON file chunk by chunk, writing the output files as it goes.
+
+    Output files are written to a temporary file first and only replace the
+    existing files once the whole input has been translated. A snapshot of
+    the source is stored next to each output file for incremental runs.
+
+    Args:
+        input_file (str): Path to the JSON file to translate
+        output_files (dict): Output file path by language code
+        target_languages (list): Target language codes
+        backend (TranslationBackend): Translation backend
+        chunk_size (int): Number of strings translated at a time
+        concurrency (int): Maximum number of batches translated at the same time
+        cache (TranslationCache, optional): Translation memory to read from and write to
+        max_retries (int): Maximum number of retries of a batch after a transient error
+        failed_paths (dict, optional): Filled with the paths that could not be translated, by language code
+        quiet (bool): Don't show progress
+        metrics (TranslationMetrics, optional): Metrics to add the counters of the run to
+        journal (TranslationJournal, optional): Checkpoint journal to resume from and append to
+        skip_rules (SkipRules, optional): Rules for the strings to copy through without translating
+
+    Returns:
+        list: Language codes whose output file was written
+    """
+    # Imported here so the command line can read DEFAULT_CHUNK_SIZE without loading the translator
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+    from json_translator.translation.translator import format_path, translate_json
+
+    # Translations and source snapshots, written side by side
+    targets = {}
+    for lang in target_languages:
+        output_file = output_files[lang]
+        snapshot_file = get_snapshot_path(output_file)
+        os.makedirs(os.path.dirname(snapshot_file), exist_ok=True)
+        targets[lang] = [output_file, snapshot_file]
+
+    files = []
+    writers = {}
+    try:
+        for lang, (output_file, snapshot_file) in targets.items():
+            files.append(open(output_file + ".tmp", "w", encoding="utf-8"))
+            output_writer = JsonStreamWriter(files[-1], indent=2)
+            files.append(open(snapshot_file + ".tmp", "w", encoding="utf-8"))
+            snapshot_writer = JsonStreamWriter(files[-1], indent=None)
+            writers[lang] = (output_writer, snapshot_writer)
+
+        translated_counts = dict.fromkeys(target_languages, 0)
+        string_count = 0
+
+        # Events of the current chunk; strings to translate are replaced by
+        # ("leaf", index) where index points into texts and paths
+        events = []
+        texts = []
+        paths = []
+
+        # Path of the current value
+        path = []
+        in_map = []
+
+        with Progress(
+            SpinnerColumn(style="green"),
+            TextColumn("[bold blue]{task.description}"),
+            TextColumn("[bold]{task.completed}[/bold] strings"),
+            TimeElapsedColumn(),
+            console=console,
+            disable=quiet
+        ) as progress:
+            tasks = {
+                lang: progress.add_task(f"[bold green]Translating to {lang}...", total=None)
+                for lang in target_languages
+            }
+
+            def flush():
+                nonlocal string_count
+                string_count += len(texts)
+                chunk_failed = {}
+                results = {}
+                if texts:
+                    results = translate_json(texts, target_languages, concurrency=concurrency, cache=cache,
+                                             backend=backend, max_retries=max_retries,
+                                             failed_paths=chunk_failed, quiet=True, metrics=metrics,
+                                             journal=journal)
+
+                for lang in target_languages:
+                    translated = results.get(lang, texts)
+                    failed_indices = {failed_path[0] for failed_path in chunk_failed.get(lang, [])}
+                    translated_counts[lang] += len(texts) - len(failed_indices)
+                    if failed_paths is not None and failed_indices:
+                        failed_paths.setdefault(lang, []).extend(paths[i] for i in sorted(failed_indices))
+
+                    output_writer, snapshot_writer = writers[lang]
+                    for event, value in events:
+                        if event == "leaf":
+                            output_writer.write_event("string", translated[value])
+                            # Untranslated strings are left out of the snapshot so they are retried
+                            snapshot_writer.write_event("null" if value in failed_indices else "string",
+                                                        None if value in failed_indices else texts[value])
+                        else:
+                            output_writer.write_event(event, value)
+                            snapshot_writer.write_event(event, value)
+                    progress.update(tasks[lang], advance=len(texts))
+
+                events.clear()
+                texts.clear()
+                paths.clear()
+
+            def skip_string(text, text_path):
+                # Skipped strings are written through like any other value
+                rule = skip_rules.match(text, format_path(text_path) if skip_rules.uses_paths else None)
+                if rule is not None and metrics is not None:
+                    metrics.record_skip(rule, len(text))
+                return rule is not None
+
+            for event, value in iter_json_events(input_file):
+                if event == "map_key":
+                    path[-1] = value
+                elif event in ("end_map", "end_array"):
+                    path.pop()
+                    in_map.pop()
+                elif in_map and not in_map[-1]:
+                    # Next item of an array
+                    path[-1] += 1
+
+                if event in ("start_map", "start_array"):
+                    in_map.append(event == "start_map")
+                    path.append(None if event == "start_map" else -1)
+                elif event == "string" and in_map and (skip_rules is None or not skip_string(value, path)):
+                    events.append(("leaf", len(texts)))
+                    texts.append(value)
+                    paths.append(list(path))
+                    if len(texts) >= chunk_size:
+                        flush()
+                    continue
+
+                events.append((event, value))
+                if len(events) >= chunk_size * _EVENTS_PER_STRING:
+                    flush()
+
+            flush()
+
+        for file in files:
+            file.close()
+    except BaseException:
+        for file in files:
+            file.close()
+            os.remove(file.name)
+        raise
+
+    # Replace the output files, dropping languages where nothing could be translated
+    completed_languages = []
+    for lang, target_files in targets.items():
+        failed = string_count and not translated_counts[lang]
+        for target_file in target_files:
+            if failed:
+                os.remove(target_file + ".tmp")
+            else:
+                os.replace(target_file + ".tmp", target_file)
+        if not failed:
+            completed_languages.append(lang)
+
+    return completed_languages
@@ -1,74 +1,375 @@
 """Translation functionality for JSON Translator."""
 
-import copy
+import time
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, TaskProgressColumn
-from google.cloud import translate_v2 as translate
+
+from json_translator.translation.backends import create_backend
+from json_translator.translation.batching import Segment, join_parts, split_text
+from json_translator.translation.incremental import find_reusable_translation
+from json_translator.translation.leaf_index import LeafIndex
+from json_translator.translation.metrics import TranslationMetrics
+from json_translator.translation.placeholders import mask_placeholders, restore_placeholders
+from json_translator.translation.retry import DEFAULT_MAX_RETRIES, call_with_retry, is_retryable_error
+from json_translator.translation.scheduler import (
+    DEFAULT_CONCURRENCY,
+    plan_work_units,
+    run_work_units
+)
 
 # Initialize console
 console = Console(width=100, highlight=True)
 
+# Language of the input files
+SOURCE_LANGUAGE = "en"
+
+# Number of untranslated paths listed in warnings
+MAX_REPORTED_PATHS = 10
+
+
+def format_path(path):
+    """Format a JSON path for display.
+    
+    Args:
+        path (list): Keys and list indices leading to a value
+        
+    Returns:
+        str: Dotted path, e.g. "buttons.save" or "items.0"
+    """
+    return ".".join(str(p) for p in path)
+
 
-def translate_json(data, target_languages, api_key=None):
+def format_path_list(paths):
+    """Format a list of JSON paths for display, showing at most MAX_REPORTED_PATHS.
+    
+    Args:
+        paths (list): Paths to show
+        
+    Returns:
+        str: One dotted path per line
+    """
+    shown_paths = "\n".join(format_path(path) for path in paths[:MAX_REPORTED_PATHS])
+    if len(paths) > MAX_REPORTED_PATHS:
+        shown_paths += f"\n... and {len(paths) - MAX_REPORTED_PATHS} more"
+    return shown_paths
+
+
+def translate_json(data, target_languages, api_key=None, concurrency=DEFAULT_CONCURRENCY, cache=None,
+                   previous=None, backend=None, max_retries=DEFAULT_MAX_RETRIES, failed_paths=None,
+                   quiet=False, metrics=None, executor=None, journal=None, plan=None,
+                   on_language_done=None, skip_rules=None, skip_path_start=0):
     """Translate all values in a JSON dictionary to multiple languages, including nested objects.
     
+    Each distinct text is translated once and written back to every path
+    where it appears. Placeholders such as "{name}", "%s" and inline HTML
+    tags are masked first, so texts differing only in their placeholders
+    are translated once, and restored in each translation; translations
+    that lose or duplicate a placeholder keep the source text. Texts are
+    packed into batches within the backend's request limits; texts too
+    long for one request are split at sentence boundaries and reassembled.
+    Batches for all languages are sent on a bounded worker pool, with the
+    same result as translating one batch at a time.
+    
+    Batches failing with a transient error are retried with backoff. Strings
+    that still can't be translated keep their source text; a language is
+    only dropped when none of its strings could be translated.
+    
+    Leaves matched by the skip rules, such as URLs or numbers, keep their
+    source text and are never sent.
+    
+    When a translation cache is given, only the texts missing from it are
+    sent. When a journal is given, every completed batch is appended to it,
+    and the translations it already holds from an interrupted run are used
+    first. When previous translations are given, translations of unchanged
+    texts are kept and only added or changed texts are translated.
+    
+    When on_language_done is given, each language's document is handed to
+    it as soon as the language's last batch completes and is not kept, so
+    only the languages in flight are held in memory.
+    
+    When a plan list is given, nothing is sent: the work units a real run
+    would send are added to it and no translations are returned.
+    
     Args:
         data (dict): JSON data to translate
         target_languages (list or str): Target language code(s)
         api_key (str, optional): Google Translate API key
+        concurrency (int): Maximum number of batches translated at the same time
+        cache (TranslationCache, optional): Translation memory to read from and write to
+        previous (dict, optional): PreviousTranslation by language code, for incremental runs
+        backend (TranslationBackend, optional): Translation backend, Google Translate by default
+        max_retries (int): Maximum number of retries of a batch after a transient error
+        failed_paths (dict, optional): Filled with the paths that could not be translated, by language code
+        quiet (bool): Don't show progress and informational messages; errors are still shown
+        metrics (TranslationMetrics, optional): Metrics to add the counters of this call to
+        executor (ThreadPoolExecutor, optional): Worker pool to reuse instead of starting one for this call
+        journal (TranslationJournal, optional): Checkpoint journal to resume from and append to
+        plan (list, optional): Filled with the planned WorkUnits instead of sending them
+        on_language_done (callable, optional): Called with (language code, translated data) for each
+            completed language, on the calling thread
+        skip_rules (SkipRules, optional): Rules for the leaves to copy through without translating
+        skip_path_start (int): Number of leading keys left out of the paths the skip rules match,
+            e.g. 1 when each top-level key holds a separate document
         
     Returns:
-        dict: Dictionary of translated data by language code
+        dict: Dictionary of translated data by language code, or of the values returned
+        by on_language_done when given
     """
     # Convert single language to list for consistent handling
     if isinstance(target_languages, str):
         target_languages = [target_languages]
     
-    # Configure the client
-    if api_key:
-        try:
-            from googleapiclient.discovery import build
-            service = build('translate', 'v2', developerKey=api_key)
-            use_api_key = True
-            console.print("[bold green]✓[/bold green] Using Google Translate API with provided key")
-        except ImportError:
-            console.print(Panel("[bold yellow]Warning:[/bold yellow] googleapiclient not installed. Falling back to application default credentials.", 
-                               border_style="yellow", title="Warning"))
-            client = translate.Client()
-            use_api_key = False
-    else:
-        client = translate.Client()
-        use_api_key = False
-        console.print("[bold blue]ℹ[/bold blue] Using Google Cloud application default credentials")
+    # Configure the backend
+    if backend is None:
+        backend = create_backend("google", api_key, quiet=quiet)
+
+    if metrics is None:
+        metrics = TranslationMetrics()
     
-    # Extract all translatable strings from the JSON (including nested objects)
+    # Index all translatable strings from the JSON (including nested objects).
+    # Each distinct masked text is kept once, along with every leaf it appears at.
+    phase_started = time.perf_counter()
+    leaves = LeafIndex(data)
     texts_to_translate = []
-    text_paths = []
+    text_leaves = []
+    text_indices = {}
+    # Placeholders of each leaf, None for the leaves without any
+    leaf_placeholders = [None] * len(leaves.texts)
+    skipped_count = 0
+    for leaf, text in enumerate(leaves.texts):
+        if skip_rules is not None:
+            path = format_path(leaves.path(leaf)[skip_path_start:]) if skip_rules.uses_paths else None
+            rule = skip_rules.match(text, path)
+            if rule is not None:
+                # Keep the source text, which every language starts from
+                metrics.record_skip(rule, len(text))
+                skipped_count += 1
+                continue
+        masked_text, placeholders = mask_placeholders(text)
+        if placeholders:
+            leaf_placeholders[leaf] = placeholders
+        index = text_indices.get(masked_text)
+        if index is None:
+            index = text_indices[masked_text] = len(texts_to_translate)
+            texts_to_translate.append(masked_text)
+            text_leaves.append([])
+        text_leaves[index].append(leaf)
     
-    def extract_texts(obj, path=[]):
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                new_path = path + [key]
-                if isinstance(value, (dict, list)):
-                    extract_texts(value, new_path)
-                elif isinstance(value, str):
-                    texts_to_translate.append(value)
-                    text_paths.append(new_path)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                new_path = path + [i]
-                if isinstance(item, (dict, list)):
-                    extract_texts(item, new_path)
-                elif isinstance(item, str):
-                    texts_to_translate.append(item)
-                    text_paths.append(new_path)
+    # Leaf of each text found at a single leaf without placeholders, where its translation is
+    # stored as is; None for the texts that go through set_translation
+    direct_leaves = [
+        index_leaves[0] if len(index_leaves) == 1 and leaf_placeholders[index_leaves[0]] is None else None
+        for index_leaves in text_leaves
+    ]
+
+    metrics.strings += len(leaves.texts) - skipped_count
+    metrics.unique_strings += len(texts_to_translate)
+    if leaves.texts and not quiet:
+        skipped_text = f"[bold]{skipped_count}[/bold] skipped by rules, " if skipped_count else ""
+        considered_count = len(leaves.texts) - skipped_count
+        duplicate_ratio = 1 - len(texts_to_translate) / considered_count if considered_count else 0.0
+        console.print(f"[bold blue]ℹ[/bold blue] Found [bold]{len(leaves.texts)}[/bold] strings, {skipped_text}"
+                      f"[bold]{len(texts_to_translate)}[/bold] unique ([bold]{duplicate_ratio:.0%}[/bold] deduplicated)")
     
-    extract_texts(data)
+    # Leaf values for each language, starting from the source text
+    translations = {lang: list(leaves.texts) for lang in target_languages}
+    # Leaves whose translation lost or duplicated a placeholder, by language
+    mismatched_leaves = {lang: set() for lang in target_languages}
+
+    def set_translation(language, index, translated_text):
+        # Write the translation to every leaf sharing the same text, with the leaf's own placeholders.
+        # Returns False if the placeholders couldn't be restored.
+        values = translations[language]
+        complete = True
+        for leaf in text_leaves[index]:
+            placeholders = leaf_placeholders[leaf]
+            if placeholders is None:
+                values[leaf] = translated_text
+                continue
+            restored_text, restored = restore_placeholders(translated_text, placeholders)
+            if restored:
+                values[leaf] = restored_text
+            else:
+                # Keep the source text rather than a translation with broken placeholders
+                values[leaf] = leaves.texts[leaf]
+                mismatched_leaves[language].add(leaf)
+                complete = False
+        return complete
+
+    metrics.add_time("extract", time.perf_counter() - phase_started)
+
+    # Keep unchanged translations from the previous run, fill in cached
+    # translations and collect the texts still to translate
+    phase_started = time.perf_counter()
+    pending = {}
+    known_counts = {}
+    reused_count = 0
+    unverified_count = 0
+    # Paths of the leaves, built once for the lookups in every language's previous translation
+    leaf_paths = [leaves.path(leaf) for leaf in range(len(leaves.texts))] if previous else None
+    for lang in target_languages:
+        previous_translation = (previous or {}).get(lang)
+        if previous_translation is None:
+            missing = list(range(len(texts_to_translate)))
+        else:
+            missing = []
+            values = translations[lang]
+            language_reused = 0
+            language_unverified = 0
+            for index, index_leaves in enumerate(text_leaves):
+                # Existing translations by leaf, and whether any was kept without a snapshot to check it against
+                reusable = {}
+                unverified = False
+                for leaf in index_leaves:
+                    translation, verified = find_reusable_translation(previous_translation, leaves.texts[leaf],
+                                                                      leaf_paths[leaf])
+                    if translation is not None:
+                        reusable[leaf] = translation
+                        unverified = unverified or not verified
+                if not reusable:
+                    missing.append(index)
+                    continue
+                if len(reusable) < len(index_leaves):
+                    # Leaves where the text is new take the translation of the same source text elsewhere
+                    reusable_texts = {leaves.texts[leaf]: translation for leaf, translation in reusable.items()}
+                    if any(leaves.texts[leaf] not in reusable_texts for leaf in index_leaves):
+                        missing.append(index)
+                        continue
+                    for leaf in index_leaves:
+                        reusable.setdefault(leaf, reusable_texts[leaves.texts[leaf]])
+                for leaf, translation in reusable.items():
+                    values[leaf] = translation
+                language_reused += 1
+                language_unverified += unverified
+            reused_count += language_reused
+            unverified_count += language_unverified
+            metrics.language(lang).reused += language_reused
+            metrics.language(lang).unverified += language_unverified
+
+        # Translations completed before an interrupted run stopped
+        if journal is not None:
+            journaled = journal.get_many([texts_to_translate[i] for i in missing], lang)
+            still_missing = []
+            for index in missing:
+                text = texts_to_translate[index]
+                if text in journaled:
+                    set_translation(lang, index, journaled[text])
+                    metrics.language(lang).resumed += 1
+                else:
+                    still_missing.append(index)
+            missing = still_missing
+
+        cached = {}
+        if cache is not None:
+            cached = cache.get_many([texts_to_translate[i] for i in missing], SOURCE_LANGUAGE, lang, backend.name)
+        pending[lang] = []
+        for index in missing:
+            text = texts_to_translate[index]
+            if text in cached:
+                set_translation(lang, index, cached[text])
+                metrics.language(lang).cached += 1
+            else:
+                pending[lang].append(index)
+        if cache is not None:
+            metrics.language(lang).cache_misses += len(pending[lang])
+        known_counts[lang] = len(texts_to_translate) - len(pending[lang])
+    metrics.add_time("lookup", time.perf_counter() - phase_started)
+
+    if previous and not quiet:
+        console.print(f"[bold blue]ℹ[/bold blue] Kept [bold]{reused_count}[/bold] unchanged translations from existing output files")
+    if unverified_count:
+        # Shown even in quiet runs: a changed source text may be kept with its stale translation
+        console.print(Panel(f"[bold yellow]{unverified_count} translations were kept from output files without a "
+                            f"source snapshot,[/bold yellow] so changes to their source text since they were "
+                            f"translated can't be detected. Run once without --incremental to translate them again.",
+                            border_style="yellow", title="Unverified Translations"))
     
-    # Create a deep copy of the original data to modify for each language
-    translations = {lang: copy.deepcopy(data) for lang in target_languages}
+    # Split texts too long for a single request into parts
+    phase_started = time.perf_counter()
+    segments = []
+    separators = {}
+    for index, text in enumerate(texts_to_translate):
+        if len(text) <= backend.max_batch_chars:
+            segments.append([Segment(index, None, text)])
+        else:
+            parts, separators[index] = split_text(text, backend.max_batch_chars)
+            segments.append([Segment(index, part, part_text) for part, part_text in enumerate(parts)])
+    translated_parts = {lang: {} for lang in target_languages}
+    # Number of pending texts translated, by language
+    translated_counts = {lang: 0 for lang in target_languages}
+
+    # Pack the (language, batch) work units
+    work_units = plan_work_units(pending, segments, backend.max_batch_size, backend.max_batch_chars)
+    metrics.add_time("plan", time.perf_counter() - phase_started)
+
+    # Dry run: stop before sending anything
+    if plan is not None:
+        plan.extend(work_units)
+        return {}
     
+    # Number of work units of each language still to complete
+    remaining_units = {lang: 0 for lang in target_languages}
+    for unit in work_units:
+        remaining_units[unit.language] += 1
+    # Work units translated, by id; only looked at for languages with untranslated texts
+    applied_units = set()
+    # Direct leaf of each segment of a batch, for whole texts only, by id of the batch's
+    # segment list, which languages with the same pending texts share
+    batch_leaves = {}
+    translated_documents = {}
+
+    def finish_language(language):
+        # Keep a partially translated language, with the source text for the strings that failed,
+        # and build its document. A language where nothing could be translated is dropped.
+        values = translations.pop(language)
+        mismatched = sorted(mismatched_leaves[language])
+        if mismatched:
+            metrics.language(language).placeholder_mismatches += len(mismatched)
+            paths = [leaves.path(leaf) for leaf in mismatched]
+            if failed_paths is not None:
+                failed_paths.setdefault(language, []).extend(paths)
+            if not quiet:
+                console.print(Panel(f"[bold yellow]{len(paths)} translations to {language} lost or duplicated "
+                                    f"placeholders and keep their source text:[/bold yellow]\n{format_path_list(paths)}",
+                                    border_style="yellow", title="Placeholder Mismatch"))
+
+        untranslated = []
+        if translated_counts[language] < len(pending[language]):
+            # The texts of the batches that failed or were skipped, found from the batches
+            # rather than tracked one text at a time
+            untranslated = sorted({segment.index for unit in work_units
+                                   if unit.language == language and id(unit) not in applied_units
+                                   for segment in unit.segments})
+        if untranslated:
+            metrics.language(language).failed += len(untranslated)
+            paths = [leaves.path(leaf) for index in untranslated for leaf in text_leaves[index]]
+            if failed_paths is not None:
+                failed_paths.setdefault(language, []).extend(paths)
+
+            if not known_counts[language] and not translated_counts[language]:
+                return
+
+            if not quiet:
+                console.print(Panel(f"[bold yellow]{len(paths)} strings could not be translated to {language} "
+                                    f"and keep their source text:[/bold yellow]\n{format_path_list(paths)}",
+                                    border_style="yellow", title="Partial Translation"))
+
+        # Build the translated document from the leaf values
+        materialize_started = time.perf_counter()
+        document = leaves.materialize(values)
+        metrics.add_time("materialize", time.perf_counter() - materialize_started)
+        if on_language_done is None:
+            translated_documents[language] = document
+        else:
+            # Hand the document over; only what the callback returns is kept
+            translated_documents[language] = on_language_done(language, document)
+
+    def complete_unit(unit):
+        remaining_units[unit.language] -= 1
+        if on_language_done is not None and not remaining_units[unit.language]:
+            finish_language(unit.language)
+
     # Track progress with enhanced progress bar
     with Progress(
         SpinnerColumn(style="green"),
@@ -78,70 +379,122 @@ def translate_json(data, target_languages, api_key=None):
         TextColumn("[bold]{task.completed}/{task.total}"),
         TimeElapsedColumn(),
         console=console,
-        expand=True
+        expand=True,
+        disable=quiet
     ) as progress:
         # Create a task for each language
         tasks = {
             lang: progress.add_task(
                 f"[bold green]Translating to {lang}...", 
-                total=len(texts_to_translate)
+                total=len(texts_to_translate),
+                completed=known_counts[lang]
             ) for lang in target_languages
         }
 
-        # Process each language
-        for target_language in target_languages:
-            # Batch translate for efficiency (100 at a time)
-            batch_size = 100
-            for i in range(0, len(texts_to_translate), batch_size):
-                batch = texts_to_translate[i : i + batch_size]
-                try:
-                    if use_api_key:
-                        result = service.translations().list(
-                            q=batch,
-                            target=target_language,
-                            source='en'
-                        ).execute()
-                        
-                        translations_result = result.get('translations', [])
-                        
-                        # Store results
-                        for j, translation in enumerate(translations_result):
-                            index = i + j
-                            path = text_paths[index]
-                            
-                            # Navigate to the correct position in the translated_data
-                            target = translations[target_language]
-                            for p in path[:-1]:
-                                target = target[p]
-                            
-                            # Update the value
-                            target[path[-1]] = translation['translatedText']
-                    else:
-                        results = client.translate(
-                            batch, target_language=target_language, source_language="en"
-                        )
-                        
-                        # Store results
-                        for j, result in enumerate(results):
-                            index = i + j
-                            path = text_paths[index]
-                            
-                            # Navigate to the correct position in the translated_data
-                            target = translations[target_language]
-                            for p in path[:-1]:
-                                target = target[p]
-                            
-                            # Update the value
-                            target[path[-1]] = result["translatedText"]
-
-                    # Update progress bar for this language
-                    progress.update(tasks[target_language], advance=len(batch))
-
-                except Exception as e:
-                    console.print(Panel(f"[bold red]Translation error for {target_language}:[/bold red] {str(e)}", 
-                                       border_style="red", title="Error"))
-                    # Continue with other languages instead of exiting
-                    translations.pop(target_language, None)
-                    break
-
-    return translations 
\ No newline at end of file
+        def send(unit):
+            request_started = time.perf_counter()
+            try:
+                return backend.translate_batch(unit.texts, unit.language, SOURCE_LANGUAGE)
+            finally:
+                metrics.record_request(unit.language, time.perf_counter() - request_started)
+
+        def execute(unit):
+            translated_texts = call_with_retry(
+                lambda: send(unit),
+                max_retries=max_retries,
+                on_retry=lambda attempt, error: metrics.record_retry(unit.language)
+            )
+            if len(translated_texts) != len(unit.texts):
+                raise ValueError(f"Expected {len(unit.texts)} translations, got {len(translated_texts)}")
+            return translated_texts
+
+        def apply_batch(unit, translated_texts):
+            apply_started = time.perf_counter()
+            language = unit.language
+            values = translations[language]
+            # Store results, caching only translations that kept their placeholders
+            cacheable = [] if cache is not None or journal is not None else None
+            segment_leaves = batch_leaves.get(id(unit.segments))
+            if segment_leaves is None:
+                segment_leaves = batch_leaves[id(unit.segments)] = [
+                    direct_leaves[segment.index] if segment.part is None else None for segment in unit.segments
+                ]
+            completed = 0
+            for segment, leaf, translated_text in zip(unit.segments, segment_leaves, translated_texts):
+                if leaf is not None:
+                    # A whole text at a single leaf without placeholders, by far the most common case
+                    values[leaf] = translated_text
+                    completed += 1
+                    if cacheable is not None:
+                        cacheable.append((segment.text, translated_text))
+                    continue
+
+                index = segment.index
+                if segment.part is not None:
+                    # Reassemble split texts once all of their parts are translated
+                    parts = translated_parts[language].setdefault(index, {})
+                    parts[segment.part] = translated_text
+                    if len(parts) <= len(separators[index]):
+                        continue
+                    del translated_parts[language][index]
+                    translated_text = join_parts([parts[part] for part in range(len(parts))], separators[index])
+                completed += 1
+                stored = set_translation(language, index, translated_text)
+                if stored and cacheable is not None:
+                    cacheable.append((texts_to_translate[index], translated_text))
+
+            if cache is not None:
+                cache.put_many(cacheable, SOURCE_LANGUAGE, language, backend.name)
+            if journal is not None:
+                journal.record(cacheable, language)
+
+            translated_counts[language] += completed
+            applied_units.add(id(unit))
+            language_metrics = metrics.language(language)
+            language_metrics.translated += completed
+            language_metrics.characters_billed += unit.characters
+            metrics.finish(language)
+
+            # Update progress bar for this language
+            progress.update(tasks[language], advance=completed)
+            metrics.add_time("apply", time.perf_counter() - apply_started)
+            complete_unit(unit)
+
+        def report_failure(unit, error):
+            metrics.finish(unit.language)
+
+            if is_retryable_error(error):
+                # Keep going with the other batches; the failed strings keep their source text
+                console.print(Panel(f"[bold yellow]A batch of {len(unit.texts)} strings for {unit.language} failed "
+                                    f"after {max_retries} retries:[/bold yellow] {str(error)}",
+                                    border_style="yellow", title="Warning"))
+                complete_unit(unit)
+                return False
+
+            console.print(Panel(f"[bold red]Translation error for {unit.language}:[/bold red] {str(error)}", 
+                               border_style="red", title="Error"))
+            progress.update(tasks[unit.language], description=f"[bold red]Failed {unit.language}")
+            # The language's remaining batches are skipped
+            if on_language_done is not None:
+                finish_language(unit.language)
+            # Continue with other languages instead of exiting
+            return True
+
+        # Languages with nothing left to translate are complete already
+        if on_language_done is not None:
+            for lang in target_languages:
+                if not remaining_units[lang]:
+                    finish_language(lang)
+
+        # Translate (language, batch) work units on a bounded worker pool
+        phase_started = time.perf_counter()
+        metrics.start(target_languages)
+        run_work_units(work_units, execute, apply_batch, report_failure, concurrency, executor)
+        metrics.add_time("translate", time.perf_counter() - phase_started)
+
+    # Languages still open: all of them unless handed over as they completed
+    for lang in target_languages:
+        if lang in translations:
+            finish_language(lang)
+
+    return {lang: translated_documents[lang] for lang in target_languages if lang in translated_documents}
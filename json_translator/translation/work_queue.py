@@ -0,0 +1,319 @@
+"""File-backed work queue for sharing one translation job between processes.
+
+A coordinator plans the batches of a job, exactly as translate_json would
+send them, into a SQLite file on a filesystem the workers share. Each
+worker claims one batch at a time under a lease, translates it through its
+own backend and writes the translations back. A batch whose worker crashed
+is claimed again once its lease expires. When every batch is done, the
+outputs are assembled by running translate_json with a backend that
+answers from the queue, so splitting, placeholders, reuse and saving work
+as in a normal run.
+"""
+
+import json
+import os
+import threading
+import time
+
+from json_translator.translation.backends import BackendError, TranslationBackend
+
+# Seconds a claimed batch stays reserved for its worker
+DEFAULT_LEASE_SECONDS = 300
+
+# Claims of a batch before it is marked as failed
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Batch states
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+# Seconds to wait for another process holding the write lock
+_BUSY_TIMEOUT = 30
+
+# Keep bulk queries under SQLite's host parameter limit
+_QUERY_CHUNK_SIZE = 500
+
+
+class WorkQueue:
+    """Batches of a translation job and their translations, in a SQLite file in WAL mode.
+
+    Every thread gets its own connection, so a queue can be shared by the
+    threads of a worker. Claims are made in write transactions, so two
+    workers never hold the same batch under a live lease.
+    """
+
+    def __init__(self, path, create=False):
+        """Open a work queue.
+
+        Args:
+            path (str): Queue file path
+            create (bool): Create a new queue; the file must not exist yet
+
+        Raises:
+            FileExistsError: When creating a queue over an existing file
+            FileNotFoundError: When opening a queue that doesn't exist
+        """
+        if create and os.path.exists(path):
+            raise FileExistsError(f"Work queue '{path}' already exists")
+        if not create and not os.path.exists(path):
+            raise FileNotFoundError(f"Work queue '{path}' not found")
+
+        self.path = path
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._metadata = None
+
+        if create:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            connection = self._connection()
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS job (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS batches (
+                    id INTEGER PRIMARY KEY,
+                    language TEXT NOT NULL,
+                    texts TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    owner TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    error TEXT
+                );
+                CREATE INDEX IF NOT EXISTS batches_status ON batches (status);
+                CREATE TABLE IF NOT EXISTS results (
+                    language TEXT NOT NULL,
+                    source_text TEXT NOT NULL,
+                    translated_text TEXT NOT NULL,
+                    PRIMARY KEY (language, source_text)
+                );
+                """
+            )
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Imported on first use, so commands that don't translate start faster
+            import sqlite3
+
+            # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE
+            connection = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT, isolation_level=None,
+                                         check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def add_batches(self, work_units, metadata):
+        """Store the batches of a job and its metadata.
+
+        Args:
+            work_units (list): WorkUnits planned by translate_json
+            metadata (dict): JSON-serializable description of the job, including the backend
+                name, source language and request limits the batches were planned with
+        """
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany("INSERT OR REPLACE INTO job (key, value) VALUES (?, ?)",
+                                   [(key, json.dumps(value)) for key, value in metadata.items()])
+            connection.executemany(
+                "INSERT INTO batches (language, texts, status) VALUES (?, ?, ?)",
+                [(unit.language, json.dumps(unit.texts, ensure_ascii=False), PENDING) for unit in work_units],
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self._metadata = None
+
+    @property
+    def metadata(self):
+        """Description of the job stored by the coordinator."""
+        if self._metadata is None:
+            rows = self._connection().execute("SELECT key, value FROM job")
+            self._metadata = {key: json.loads(value) for key, value in rows}
+        return self._metadata
+
+    def claim(self, owner, lease_seconds=DEFAULT_LEASE_SECONDS, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        """Claim the next pending batch, or a batch whose lease expired.
+
+        A batch whose lease expired after max_attempts claims is marked as
+        failed instead of being claimed again.
+
+        Args:
+            owner (str): Identifier of the claiming worker
+            lease_seconds (float): Seconds the batch stays reserved for the worker
+            max_attempts (int): Maximum number of claims of a batch
+
+        Returns:
+            tuple or None: (batch id, language code, texts), or None if no batch can be claimed now
+        """
+        connection = self._connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "UPDATE batches SET status = ?, error = 'Lease expired'"
+                " WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (FAILED, LEASED, now, max_attempts),
+            )
+            row = connection.execute(
+                "SELECT id, language, texts FROM batches"
+                " WHERE status = ? OR (status = ? AND lease_expires < ?) ORDER BY id LIMIT 1",
+                (PENDING, LEASED, now),
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE batches SET status = ?, owner = ?, lease_expires = ?, attempts = attempts + 1"
+                    " WHERE id = ?",
+                    (LEASED, owner, now + lease_seconds, row[0]),
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        if row is None:
+            return None
+        return row[0], row[1], json.loads(row[2])
+
+    def complete(self, batch_id, language, pairs):
+        """Store the translations of a claimed batch and mark it as done.
+
+        The translations are kept even if the lease expired meanwhile; a
+        worker that claimed the batch again writes the same ones.
+
+        Args:
+            batch_id (int): Batch id returned by claim
+            language (str): Target language code
+            pairs (iterable): (source text, translated text) tuples
+        """
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                "INSERT OR REPLACE INTO results (language, source_text, translated_text) VALUES (?, ?, ?)",
+                [(language, text, translated_text) for text, translated_text in pairs],
+            )
+            connection.execute("UPDATE batches SET status = ?, lease_expires = NULL, error = NULL WHERE id = ?",
+                               (DONE, batch_id))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def release(self, batch_id, owner, error, retry=True, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        """Give back a claimed batch that could not be translated.
+
+        Args:
+            batch_id (int): Batch id returned by claim
+            owner (str): Identifier of the worker holding the batch
+            error (str): Error message recorded with the batch
+            retry (bool): Let the batch be claimed again if it has attempts left
+            max_attempts (int): Maximum number of claims of a batch
+        """
+        self._connection().execute(
+            "UPDATE batches SET status = CASE WHEN ? AND attempts < ? THEN ? ELSE ? END,"
+            " lease_expires = NULL, error = ? WHERE id = ? AND owner = ? AND status = ?",
+            (retry, max_attempts, PENDING, FAILED, error, batch_id, owner, LEASED),
+        )
+
+    def counts(self):
+        """Count the batches in each state.
+
+        Returns:
+            dict: Number of batches by state, for every state
+        """
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        for status, count in self._connection().execute("SELECT status, COUNT(*) FROM batches GROUP BY status"):
+            counts[status] = count
+        return counts
+
+    def next_lease_expiry(self):
+        """Return when the first live lease expires.
+
+        Returns:
+            float or None: Unix time, or None if no batch is leased
+        """
+        row = self._connection().execute(
+            "SELECT MIN(lease_expires) FROM batches WHERE status = ?", (LEASED,)
+        ).fetchone()
+        return row[0]
+
+    def failed_batches(self):
+        """List the batches marked as failed.
+
+        Returns:
+            list: (batch id, language code, number of texts, error) tuples
+        """
+        rows = self._connection().execute(
+            "SELECT id, language, texts, error FROM batches WHERE status = ? ORDER BY id", (FAILED,)
+        )
+        return [(batch_id, language, len(json.loads(texts)), error) for batch_id, language, texts, error in rows]
+
+    def get_translations(self, texts, language):
+        """Look up the translations workers wrote for several texts.
+
+        Args:
+            texts (iterable): Source texts
+            language (str): Target language code
+
+        Returns:
+            dict: Translated text by source text, for the translated texts only
+        """
+        texts = list(dict.fromkeys(texts))
+        found = {}
+        for i in range(0, len(texts), _QUERY_CHUNK_SIZE):
+            chunk = texts[i : i + _QUERY_CHUNK_SIZE]
+            rows = self._connection().execute(
+                "SELECT source_text, translated_text FROM results"
+                f" WHERE language = ? AND source_text IN ({','.join('?' * len(chunk))})",
+                [language] + chunk,
+            )
+            found.update(rows)
+        return found
+
+    def close(self):
+        """Close the connections of every thread."""
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._local = threading.local()
+
+
+class QueueResultsBackend(TranslationBackend):
+    """Backend answering from the translations written to a work queue.
+
+    It takes the name and request limits the batches were planned with,
+    so long texts are split into the same parts and the translations are
+    cached as if the original backend had returned them.
+    """
+
+    def __init__(self, queue):
+        """Create the backend.
+
+        Args:
+            queue (WorkQueue): Work queue holding the translations
+        """
+        metadata = queue.metadata
+        self._queue = queue
+        self.name = metadata["backend"]
+        self.max_batch_size = metadata["max_batch_size"]
+        self.max_batch_chars = metadata["max_batch_chars"]
+
+    def translate_batch(self, texts, target_language, source_language):
+        found = self._queue.get_translations(texts, target_language)
+        missing = sum(1 for text in texts if text not in found)
+        if missing:
+            # Reported as unavailable, so the batch's strings keep their source text
+            # and the rest of the language is still assembled
+            raise BackendError(f"No translation of {missing} strings in the work queue", status_code=503)
+        return [found[text] for text in texts]
@@ -0,0 +1,139 @@
+"""Worker processes translating the batches of a shared work queue."""
+
+import os
+import socket
+import threading
+import time
+from rich.console import Console
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, TaskProgressColumn
+
+from json_translator.translation.metrics import TranslationMetrics
+from json_translator.translation.retry import DEFAULT_MAX_RETRIES, call_with_retry, is_retryable_error
+from json_translator.translation.scheduler import DEFAULT_CONCURRENCY
+from json_translator.translation.work_queue import DEFAULT_LEASE_SECONDS, DEFAULT_MAX_ATTEMPTS, DONE, FAILED
+
+# Initialize console
+console = Console(width=100, highlight=True)
+
+# Longest wait in seconds before looking for claimable batches again
+POLL_INTERVAL = 5.0
+
+
+def get_default_worker_id():
+    """Return an identifier for this worker process.
+
+    Returns:
+        str: "<host name>-<process id>"
+    """
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def run_worker(queue, backend, worker_id=None, concurrency=DEFAULT_CONCURRENCY, max_retries=DEFAULT_MAX_RETRIES,
+               lease_seconds=DEFAULT_LEASE_SECONDS, max_attempts=DEFAULT_MAX_ATTEMPTS, metrics=None, quiet=False):
+    """Translate batches claimed from a work queue until every batch is done or failed.
+
+    Each of the worker's threads claims one batch at a time. Batches
+    failing with a transient error after their retries go back to the
+    queue for another attempt; fatal errors fail the batch at once. While
+    other workers hold the last batches, the worker waits, and takes over
+    any batch whose lease expires.
+
+    Args:
+        queue (WorkQueue): Work queue to claim batches from
+        backend (TranslationBackend): Translation backend
+        worker_id (str, optional): Identifier of the worker, the host name and process id by default
+        concurrency (int): Number of batches translated at the same time
+        max_retries (int): Maximum number of retries of a batch after a transient error
+        lease_seconds (float): Seconds a claimed batch stays reserved for the worker
+        max_attempts (int): Maximum number of claims of a batch
+        metrics (TranslationMetrics, optional): Metrics to add the requests of this worker to
+        quiet (bool): Don't show progress; errors are still shown
+
+    Returns:
+        int: Number of batches translated by this worker
+    """
+    if worker_id is None:
+        worker_id = get_default_worker_id()
+    if metrics is None:
+        metrics = TranslationMetrics()
+    source_language = queue.metadata["source_language"]
+    completed_batches = []
+
+    with Progress(
+        SpinnerColumn(style="green"),
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(bar_width=40, complete_style="green", finished_style="green"),
+        TaskProgressColumn(),
+        TextColumn("[bold]{task.completed}/{task.total}"),
+        TimeElapsedColumn(),
+        console=console,
+        expand=True,
+        disable=quiet
+    ) as progress:
+        counts = queue.counts()
+        task = progress.add_task("[bold green]Translating batches...", total=sum(counts.values()),
+                                 completed=counts[DONE] + counts[FAILED])
+
+        lock = threading.Lock()
+
+        def send(language, texts):
+            request_started = time.perf_counter()
+            try:
+                return backend.translate_batch(texts, language, source_language)
+            finally:
+                metrics.record_request(language, time.perf_counter() - request_started)
+
+        def work():
+            while True:
+                claimed = queue.claim(worker_id, lease_seconds, max_attempts)
+                if claimed is None:
+                    # Wait for the batches held by other workers, in case one of them stops
+                    lease_expires = queue.next_lease_expiry()
+                    if lease_expires is None:
+                        return
+                    time.sleep(min(max(lease_expires - time.time(), 0.0) + 0.1, POLL_INTERVAL))
+                    continue
+
+                batch_id, language, texts = claimed
+                try:
+                    translated_texts = call_with_retry(
+                        lambda: send(language, texts),
+                        max_retries=max_retries,
+                        on_retry=lambda attempt, error: metrics.record_retry(language)
+                    )
+                    if len(translated_texts) != len(texts):
+                        raise ValueError(f"Expected {len(texts)} translations, got {len(translated_texts)}")
+                except Exception as e:
+                    retry = is_retryable_error(e)
+                    queue.release(batch_id, worker_id, str(e), retry=retry, max_attempts=max_attempts)
+                    console.print(Panel(f"[bold yellow]Batch {batch_id} of {len(texts)} strings for {language} "
+                                        f"failed{'; it goes back to the queue' if retry else ''}:[/bold yellow] {str(e)}",
+                                        border_style="yellow", title="Warning"))
+                else:
+                    queue.complete(batch_id, language, zip(texts, translated_texts))
+                    with lock:
+                        language_metrics = metrics.language(language)
+                        language_metrics.translated += len(texts)
+                        language_metrics.characters_billed += sum(len(text) for text in texts)
+                        completed_batches.append(batch_id)
+                finally:
+                    metrics.finish(language)
+
+                # Show the progress of every worker
+                counts = queue.counts()
+                progress.update(task, completed=counts[DONE] + counts[FAILED])
+
+        metrics.start(sorted(queue.metadata["target_languages"]))
+        threads = [threading.Thread(target=work, name=f"worker-{i}", daemon=True) for i in range(max(1, concurrency))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            # Join with a timeout, so Ctrl-C isn't blocked; an interrupted worker's
+            # batches are claimed again when their leases expire
+            while thread.is_alive():
+                thread.join(0.5)
+        counts = queue.counts()
+        progress.update(task, completed=counts[DONE] + counts[FAILED])
+
+    return len(completed_batches)
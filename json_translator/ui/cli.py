@@ -4,36 +4,267 @@ import argparse
 import os
 import sys
 from rich.console import Console
+from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.text import Text
 
+from json_translator.utils.file_operations import find_json_files
+from json_translator.utils.language_registry import (
+    DEFAULT_LANGUAGES_TTL_DAYS,
+    get_languages_file_path,
+    load_language_registry,
+    write_languages_file
+)
 from json_translator.utils.language_utils import (
     get_available_languages,
     validate_language_codes,
     display_language_info
 )
 from json_translator.ui.display import display_available_languages
+from json_translator.translation.backends import BACKEND_NAMES, create_backend
+from json_translator.translation.planner import DEFAULT_PRICE_PER_MILLION
+from json_translator.translation.retry import DEFAULT_MAX_RETRIES
+from json_translator.translation.scheduler import DEFAULT_CONCURRENCY
+from json_translator.translation.skip_rules import BUILTIN_DETECTORS
+from json_translator.translation.streaming import DEFAULT_CHUNK_SIZE
+from json_translator.translation.cache import (
+    DEFAULT_MAX_AGE_DAYS,
+    DEFAULT_MAX_ENTRIES,
+    get_default_cache_dir,
+    open_translation_cache
+)
 
 # Initialize console
 console = Console(width=100, highlight=True)
 
 
+def add_translation_arguments(parser):
+    """Add the backend and request options to an argument parser.
+    
+    Args:
+        parser (argparse.ArgumentParser): Parser to add the options to
+    """
+    parser.add_argument("--key", help="Google Translate API Key")
+    parser.add_argument("--backend", choices=BACKEND_NAMES, default="google",
+                        help="Translation backend; 'rest' calls the Google v2 REST API directly with an API key, "
+                             "'pseudo' pseudo-localizes offline (default: %(default)s)")
+    parser.add_argument("--gzip", action="store_true",
+                        help="Send gzip-compressed request bodies with the rest backend")
+    parser.add_argument("--pseudo-latency", type=float, default=0.0,
+                        help="Simulated seconds per request for the pseudo backend")
+    parser.add_argument("--pseudo-error-rate", type=float, default=0.0,
+                        help="Fraction of requests failing with the pseudo backend, between 0 and 1")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Maximum number of translation requests in flight (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--max-retries", type=int, default=DEFAULT_MAX_RETRIES,
+                        help=f"Maximum number of retries of a failed request (default: {DEFAULT_MAX_RETRIES})")
+
+
+def add_skip_rule_arguments(parser):
+    """Add the options selecting the strings copied through without translation.
+    
+    Args:
+        parser (argparse.ArgumentParser): Parser to add the options to
+    """
+    parser.add_argument("--skip-detectors", default="all",
+                        help=f"Built-in detectors of strings with nothing to translate, 'all' or 'none' "
+                             f"({', '.join(BUILTIN_DETECTORS)}; default: %(default)s)")
+    parser.add_argument("--skip-keys", action="append", metavar="GLOB",
+                        help="Keep the strings at key paths matching this glob untranslated, e.g. 'brand.*' (repeatable)")
+    parser.add_argument("--only-keys", action="append", metavar="GLOB",
+                        help="Only translate the strings at key paths matching this glob (repeatable)")
+    parser.add_argument("--skip-values", action="append", metavar="REGEX",
+                        help="Keep the strings matching this regular expression untranslated (repeatable)")
+    parser.add_argument("--translate-values", action="append", metavar="REGEX",
+                        help="Translate the strings matching this regular expression even if a detector "
+                             "matches them (repeatable)")
+
+
+def add_cache_arguments(parser):
+    """Add the translation cache options to an argument parser.
+    
+    Args:
+        parser (argparse.ArgumentParser): Parser to add the options to
+    """
+    parser.add_argument("--cache-dir",
+                        help="Directory of the translation cache (default: $XDG_CACHE_HOME/json-translator "
+                             "or ~/.cache/json-translator)")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the translation cache")
+    parser.add_argument("--refresh-cache", action="store_true",
+                        help="Ignore cached translations and overwrite them with fresh ones")
+    parser.add_argument("--cache-max-entries", type=int, default=DEFAULT_MAX_ENTRIES,
+                        help=f"Maximum number of cached translations (default: {DEFAULT_MAX_ENTRIES})")
+    parser.add_argument("--cache-max-age", type=float, default=DEFAULT_MAX_AGE_DAYS,
+                        help=f"Maximum age of cached translations in days (default: {DEFAULT_MAX_AGE_DAYS})")
+    parser.add_argument("--languages-ttl", type=float, default=DEFAULT_LANGUAGES_TTL_DAYS,
+                        help=f"Days before the supported languages are fetched from the backend again "
+                             f"(default: {DEFAULT_LANGUAGES_TTL_DAYS})")
+
+
 def parse_arguments():
     """Parse command line arguments.
     
     Returns:
         argparse.Namespace: Parsed arguments
     """
-    parser = argparse.ArgumentParser(description="Translate JSON language files to multiple languages")
+    parser = argparse.ArgumentParser(description="Translate JSON language files to multiple languages",
+                                     epilog="Run 'json-translator serve --help' for the translation service "
+                                            "and 'json-translator worker --help' for work queue workers.")
     parser.add_argument("--input", help="Input JSON file path")
+    parser.add_argument("--input-dir",
+                        help="Translate every JSON file of a directory in one run, into <output>/<lang>/<file>")
+    parser.add_argument("--glob", default="**/*.json",
+                        help="Files of --input-dir to translate, relative to it (default: %(default)s)")
     parser.add_argument("--output", help="Output directory path for translated files")
-    parser.add_argument("--key", help="Google Translate API Key")
     parser.add_argument("--target", help="Target language codes (comma-separated, e.g., fr,es,de)")
     parser.add_argument("--list-languages", action="store_true", help="List available language codes and exit")
+    parser.add_argument("--update-languages", action="store_true",
+                        help="Fetch the supported languages from the backend now instead of when they expire")
+    parser.add_argument("--batch", "--yes", "-y", dest="batch", action="store_true",
+                        help="Run without prompts, previews or progress output; requires --input and --target")
+    parser.add_argument("--report", help="Write a JSON report of the run to this file")
+    parser.add_argument("--prometheus",
+                        help="Write the run metrics to this file in the Prometheus text format (e.g. for the node_exporter textfile collector)")
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument("--plan", nargs="?", const="-", metavar="FILE",
+                       help="Dry run: estimate requests, characters, cost and duration without translating, "
+                            "and write the plan as JSON to FILE (default: standard output)")
+    modes.add_argument("--enqueue", metavar="QUEUE",
+                       help="Plan the batches into a new work queue file for 'json-translator worker' processes "
+                            "instead of translating")
+    modes.add_argument("--merge", metavar="QUEUE",
+                       help="Assemble the outputs from the translations of a work queue; use the same input, "
+                            "targets and options as --enqueue")
+    parser.add_argument("--latency-report", metavar="REPORT",
+                        help="Estimate the duration of --plan from the request latencies of a past --report")
+    parser.add_argument("--price-per-million", type=float, default=DEFAULT_PRICE_PER_MILLION,
+                        help=f"Price per million characters used by --plan (default: {DEFAULT_PRICE_PER_MILLION})")
+    parser.add_argument("--max-characters", type=int,
+                        help="With --plan, exit with status 2 if the run would send more characters than this")
+    add_translation_arguments(parser)
+    add_skip_rule_arguments(parser)
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted run from its journal, only translating what is left")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only translate strings added or changed since the existing output files were written")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Save each language as soon as it is translated and release it from memory; "
+                             "saving is confirmed up front and the preview only shows samples")
+    parser.add_argument("--stream", action="store_true",
+                        help="Translate and save the input chunk by chunk without loading it whole (no preview)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Number of strings translated at a time with --stream (default: {DEFAULT_CHUNK_SIZE})")
+    add_cache_arguments(parser)
 
     return parser.parse_args()
 
 
+def parse_serve_arguments(argv):
+    """Parse the arguments of the serve command.
+    
+    Args:
+        argv (list): Arguments following "serve"
+        
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    from json_translator.service import DEFAULT_BATCH_WINDOW
+
+    parser = argparse.ArgumentParser(prog="json-translator serve",
+                                     description="Run a translation service that keeps the backend and cache warm "
+                                                 "and translates jobs from many clients together")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on (default: %(default)s)")
+    parser.add_argument("--socket", help="Listen on this Unix socket instead of a TCP port")
+    parser.add_argument("--batch-window", type=float, default=DEFAULT_BATCH_WINDOW,
+                        help=f"Seconds to wait for more jobs before translating the queued ones together "
+                             f"(default: {DEFAULT_BATCH_WINDOW})")
+    parser.add_argument("--quiet", action="store_true", help="Don't log requests")
+    add_translation_arguments(parser)
+    add_skip_rule_arguments(parser)
+    add_cache_arguments(parser)
+    # The service never prompts
+    parser.set_defaults(batch=True)
+
+    return parser.parse_args(argv)
+
+
+def parse_worker_arguments(argv):
+    """Parse the arguments of the worker command.
+    
+    Args:
+        argv (list): Arguments following "worker"
+        
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    from json_translator.translation.work_queue import DEFAULT_LEASE_SECONDS, DEFAULT_MAX_ATTEMPTS
+
+    parser = argparse.ArgumentParser(prog="json-translator worker",
+                                     description="Translate the batches of a work queue created with --enqueue; "
+                                                 "run as many workers as needed on machines sharing the queue file")
+    parser.add_argument("queue", help="Work queue file path")
+    parser.add_argument("--worker-id", help="Identifier of this worker (default: <host name>-<process id>)")
+    parser.add_argument("--lease", type=float, default=DEFAULT_LEASE_SECONDS,
+                        help=f"Seconds a claimed batch stays reserved before another worker may take it over "
+                             f"(default: {DEFAULT_LEASE_SECONDS})")
+    parser.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS,
+                        help=f"Claims of a batch before it is marked as failed (default: {DEFAULT_MAX_ATTEMPTS})")
+    parser.add_argument("--quiet", action="store_true", help="Don't show progress")
+    add_translation_arguments(parser)
+    parser.add_argument("--cache-dir",
+                        help="Directory of the saved supported languages (default: $XDG_CACHE_HOME/json-translator "
+                             "or ~/.cache/json-translator)")
+    parser.add_argument("--languages-ttl", type=float, default=DEFAULT_LANGUAGES_TTL_DAYS,
+                        help=f"Days before the supported languages are fetched from the backend again "
+                             f"(default: {DEFAULT_LANGUAGES_TTL_DAYS})")
+    # Workers never prompt
+    parser.set_defaults(batch=True)
+
+    return parser.parse_args(argv)
+
+
+def load_supported_languages(args, backend=None):
+    """Load the supported languages saved in the cache directory.
+    
+    With a backend, they are fetched from it first when they are missing or
+    older than --languages-ttl days.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        backend (TranslationBackend, optional): Backend to fetch the supported languages from
+        
+    Returns:
+        LanguageRegistry: Registry of the supported languages
+    """
+    return load_language_registry(args.cache_dir or get_default_cache_dir(), backend=backend,
+                                  ttl_days=args.languages_ttl)
+
+
+def update_supported_languages(args):
+    """Fetch the supported languages from the selected backend (--update-languages).
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+    """
+    api_key = get_api_key(args) if args.backend in ("google", "rest") else None
+    backend = get_translation_backend(args, api_key, load_languages=False)
+    try:
+        languages = backend.get_supported_languages()
+    except Exception as e:
+        console.print(Panel(f"[bold yellow]Warning:[/bold yellow] Could not fetch the supported languages: {str(e)}",
+                           border_style="yellow", title="Warning"))
+        return
+    if not languages:
+        console.print(f"[bold yellow]Warning:[/bold yellow] The {args.backend} backend has no list of supported languages")
+        return
+
+    write_languages_file(get_languages_file_path(args.cache_dir or get_default_cache_dir()), languages, backend.name)
+    registry = load_supported_languages(args)
+    if not args.batch:
+        console.print(f"[bold green]✓[/bold green] Fetched [bold]{len(registry)}[/bold] supported languages")
+
+
 def handle_list_languages_option(args):
     """Handle the --list-languages option.
     
@@ -59,6 +290,11 @@ def get_input_file(args):
     Returns:
         str: Input file path
     """
+    if not args.input and args.batch:
+        console.print(Panel("[bold red]Error:[/bold red] --input is required with --batch", 
+                           border_style="red", title="Error"))
+        sys.exit(1)
+
     input_file = args.input or Prompt.ask(
         Text("Enter input JSON file path", style="bold cyan")
     )
@@ -71,6 +307,32 @@ def get_input_file(args):
     return input_file
 
 
+def get_input_files(args):
+    """Get the JSON files of the input directory.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        
+    Returns:
+        list: File paths relative to the input directory
+    """
+    if not os.path.isdir(args.input_dir):
+        console.print(Panel(f"[bold red]Error:[/bold red] Directory '{args.input_dir}' not found", 
+                           border_style="red", title="File Error"))
+        sys.exit(1)
+
+    from json_translator.translation.incremental import SNAPSHOT_DIR_NAME
+
+    # Skip the source snapshots written next to translated files
+    input_files = find_json_files(args.input_dir, args.glob, exclude_dirs=[SNAPSHOT_DIR_NAME])
+    if not input_files:
+        console.print(Panel(f"[bold red]Error:[/bold red] No files matching '{args.glob}' in '{args.input_dir}'", 
+                           border_style="red", title="File Error"))
+        sys.exit(1)
+        
+    return input_files
+
+
 def get_target_languages(args):
     """Get target languages from arguments or prompt the user.
     
@@ -84,6 +346,10 @@ def get_target_languages(args):
     
     if args.target:
         target_languages = args.target.split(',')
+    elif args.batch:
+        console.print(Panel("[bold red]Error:[/bold red] --target is required with --batch", 
+                           border_style="red", title="Error"))
+        sys.exit(1)
     else:
         # Multi-select language prompt
         console.print(Text("\nAvailable languages:", style="bold cyan"))
@@ -136,7 +402,7 @@ def get_api_key(args):
     """
     api_key = args.key or os.environ.get("GOOGLE_TRANSLATE_API_KEY")
     
-    if not api_key:
+    if not api_key and not args.batch:
         api_key = Prompt.ask(
             Text("Enter Google Translate API key", style="bold cyan"),
             password=True,
@@ -147,13 +413,185 @@ def get_api_key(args):
     has_credentials_file = "GOOGLE_APPLICATION_CREDENTIALS" in os.environ
     if has_credentials_file and not api_key:
         credentials_path = os.environ["GOOGLE_APPLICATION_CREDENTIALS"]
-        if os.path.exists(credentials_path):
+        if os.path.exists(credentials_path) and not args.batch:
             console.print(Panel(f"[bold green]Using Google Application Credentials[/bold green]\nPath: {credentials_path}", 
                                border_style="green", title="Authentication"))
             
     return api_key
 
 
+def get_translation_backend(args, api_key=None, load_languages=True):
+    """Create the translation backend selected in the arguments.
+    
+    The backend's supported languages are fetched and saved as well when
+    the saved ones are missing or expired.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        api_key (str, optional): Google Translate API key
+        load_languages (bool): Fetch the supported languages from the backend when needed
+        
+    Returns:
+        TranslationBackend: Translation backend
+    """
+    if args.backend == "pseudo":
+        backend = create_backend("pseudo", quiet=args.batch, latency=args.pseudo_latency,
+                                 error_rate=args.pseudo_error_rate)
+    elif args.backend == "rest":
+        if not api_key:
+            console.print(Panel("[bold red]Error:[/bold red] The rest backend needs an API key (--key or GOOGLE_TRANSLATE_API_KEY)",
+                               border_style="red", title="Error"))
+            sys.exit(1)
+        backend = create_backend("rest", api_key, quiet=args.batch, compress=args.gzip)
+    else:
+        backend = create_backend(args.backend, api_key, quiet=args.batch)
+
+    if load_languages:
+        load_supported_languages(args, backend)
+    return backend
+
+
+def get_work_queue(path, create=False):
+    """Open a work queue, exiting with an error if it can't be used.
+    
+    Args:
+        path (str): Work queue file path
+        create (bool): Create a new queue
+        
+    Returns:
+        WorkQueue: Work queue
+    """
+    import sqlite3
+    from json_translator.translation.work_queue import WorkQueue
+
+    try:
+        queue = WorkQueue(path, create=create)
+        # Read the job up front, so a file that isn't a work queue fails here
+        queue.metadata
+    except (OSError, sqlite3.Error) as e:
+        console.print(Panel(f"[bold red]Error opening the work queue:[/bold red] {str(e)}",
+                           border_style="red", title="Error"))
+        sys.exit(1)
+    return queue
+
+
+def get_queue_backend(args):
+    """Create the backend assembling a run from the translations of the --merge work queue.
+    
+    Batches with missing translations are not retried, since asking again
+    won't find them.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        
+    Returns:
+        QueueResultsBackend: Backend answering from the work queue
+    """
+    from json_translator.translation.work_queue import DONE, FAILED, QueueResultsBackend
+
+    queue = get_work_queue(args.merge)
+    counts = queue.counts()
+    unfinished = sum(count for status, count in counts.items() if status not in (DONE, FAILED))
+    if unfinished:
+        console.print(Panel(f"[bold red]Error:[/bold red] {unfinished} of {sum(counts.values())} batches of "
+                            f"'{args.merge}' are not translated yet; wait for the workers to finish",
+                           border_style="red", title="Error"))
+        sys.exit(1)
+    if counts[FAILED]:
+        console.print(f"[bold yellow]Warning:[/bold yellow] {counts[FAILED]} batches of the work queue failed; "
+                      f"their strings keep their source text")
+
+    args.max_retries = 0
+    backend = QueueResultsBackend(queue)
+    if not args.batch:
+        console.print(f"[bold blue]ℹ[/bold blue] Merging [bold]{counts[DONE]}[/bold] translated batches "
+                      f"from [bold cyan]{args.merge}[/bold cyan]")
+    return backend
+
+
+def get_skip_rules(args):
+    """Compile the skip rules selected in the arguments.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        
+    Returns:
+        SkipRules: Compiled rules
+    """
+    import re
+    from json_translator.translation.skip_rules import SkipRules
+
+    if args.skip_detectors == "all":
+        detectors = list(BUILTIN_DETECTORS)
+    elif args.skip_detectors == "none":
+        detectors = []
+    else:
+        detectors = [name.strip() for name in args.skip_detectors.split(",") if name.strip()]
+
+    try:
+        return SkipRules(detectors, only_keys=args.only_keys, skip_keys=args.skip_keys,
+                         skip_values=args.skip_values, translate_values=args.translate_values)
+    except (ValueError, re.error) as e:
+        console.print(Panel(f"[bold red]Error in the skip rules:[/bold red] {str(e)}",
+                           border_style="red", title="Error"))
+        sys.exit(1)
+
+
+def get_translation_cache(args):
+    """Open the translation cache unless disabled in the arguments.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        
+    Returns:
+        TranslationCache or None: Translation cache, or None if caching is disabled
+    """
+    if args.no_cache:
+        return None
+    
+    return open_translation_cache(
+        args.cache_dir or get_default_cache_dir(),
+        max_entries=args.cache_max_entries,
+        max_age_days=args.cache_max_age,
+        refresh=args.refresh_cache
+    )
+
+
+def get_translation_journal(args, output_dir, input_path, backend):
+    """Open the checkpoint journal of a run, read back with --resume.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments
+        output_dir (str): Output directory path
+        input_path (str): Input file or directory path
+        backend (TranslationBackend): Translation backend
+        
+    Returns:
+        TranslationJournal or None: Journal, or None if it could not be opened or isn't needed
+    """
+    from json_translator.translation.journal import TranslationJournal, get_journal_path
+
+    # A dry run or a queued run only reads the journal it would resume from
+    if (args.plan or args.enqueue) and not args.resume:
+        return None
+
+    journal_path = get_journal_path(output_dir, input_path)
+    if not args.resume and os.path.exists(journal_path) and not args.batch:
+        console.print("[bold yellow]Warning:[/bold yellow] Discarding the journal of an interrupted run; "
+                      "use --resume to continue it instead")
+    try:
+        journal = TranslationJournal(journal_path, backend.name, resume=args.resume)
+    except OSError as e:
+        console.print(Panel(f"[bold yellow]Warning:[/bold yellow] Checkpoint journal disabled: {str(e)}",
+                           border_style="yellow", title="Warning"))
+        return None
+
+    if args.resume and not args.batch:
+        console.print(f"[bold blue]ℹ[/bold blue] Resuming with [bold]{len(journal)}[/bold] translations "
+                      f"from the journal of the interrupted run")
+    return journal
+
+
 def get_output_directory(args):
     """Get the output directory from arguments or prompt the user.
     
@@ -165,6 +603,8 @@ def get_output_directory(args):
     """
     if args.output:
         output_dir = args.output
+    elif args.batch:
+        output_dir = "translations"
     else:
         output_dir = Prompt.ask(
             Text("Enter output directory path", style="bold cyan"),
@@ -174,13 +614,16 @@ def get_output_directory(args):
     return output_dir
 
 
-def confirm_save_translations(output_dir):
+def confirm_save_translations(output_dir, assume_yes=False):
     """Ask the user to confirm saving translations.
     
     Args:
         output_dir (str): Output directory path
+        assume_yes (bool): Confirm without asking
         
     Returns:
         bool: True if the user confirms, False otherwise
     """
+    if assume_yes:
+        return True
     return Confirm.ask(Text(f"Save translations to {output_dir}?", style="bold cyan")) 
\ No newline at end of file
@@ -9,6 +9,9 @@ from rich import box
 # Initialize console
 console = Console(width=100, highlight=True)
 
+# Rows per page of the full comparison
+COMPARISON_PAGE_SIZE = 50
+
 
 def display_app_header():
     """Display the application header."""
@@ -29,40 +32,76 @@ def display_app_header():
     console.print()
 
 
-def display_comparison(original, translated, title="Translation Results"):
-    """Display a side-by-side comparison of original and translated text, including nested objects.
+def _get_value(document, path):
+    # Follow a path of keys and list indices in a document
+    value = document
+    for key in path:
+        value = value[key]
+    return value
+
+
+def get_comparison_rows(leaves, translated, start=0, stop=None):
+    """Get rows comparing original strings with their translations.
+    
+    Only the requested rows are looked up, so a preview of a large document
+    costs as much as the rows it shows.
     
     Args:
-        original (dict): Original JSON data
-        translated (dict): Translated JSON data
-        title (str): Title for the comparison table
+        leaves (LeafIndex): Index of the original data
+        translated (dict or list): Translated data, with the same structure as the original
+        start (int): First row
+        stop (int, optional): Row to stop at, all rows by default
+        
+    Returns:
+        list: (key path, original text, translated text) tuples
     """
+    stop = len(leaves) if stop is None else min(stop, len(leaves))
+    rows = []
+    for leaf in range(start, stop):
+        path = leaves.path(leaf)
+        try:
+            translated_text = _get_value(translated, path)
+        except (KeyError, IndexError, TypeError):
+            translated_text = ""
+        rows.append((".".join(str(key) for key in path), leaves.texts[leaf], str(translated_text)))
+    return rows
+
+
+def _display_rows(rows, title):
     table = Table(title=title, box=box.ROUNDED, expand=True)
     table.add_column("Key Path", style="cyan", no_wrap=True)
     table.add_column("Original (English)", style="green")
     table.add_column("Translated", style="yellow")
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
 
-    # Function to flatten nested dictionaries with path information
-    def flatten_dict(d, parent_key=''):
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}.{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(flatten_dict(v, new_key).items())
-            else:
-                items.append((new_key, v))
-        return dict(items)
-    
-    # Flatten both dictionaries
-    flat_original = flatten_dict(original)
-    flat_translated = flatten_dict(translated)
-    
-    # Add rows to the table
-    for key in flat_original.keys():
-        if key in flat_translated:
-            table.add_row(key, str(flat_original[key]), str(flat_translated[key]))
 
-    console.print(table)
+def display_comparison(original, translated, title="Translation Results", leaves=None, page_size=None):
+    """Display a side-by-side comparison of original and translated text, including nested objects and lists.
+    
+    Args:
+        original (dict): Original JSON data
+        translated (dict): Translated JSON data
+        title (str): Title for the comparison table
+        leaves (LeafIndex, optional): Index of the original data, to share between languages
+        page_size (int, optional): Show this many rows at a time, asking before each next page
+    """
+    from rich.prompt import Confirm
+    from json_translator.translation.leaf_index import LeafIndex
+
+    if leaves is None:
+        leaves = LeafIndex(original)
+    page_size = page_size or len(leaves)
+
+    start = 0
+    while True:
+        stop = min(start + page_size, len(leaves))
+        page_title = title if stop - start == len(leaves) else f"{title} ({start + 1}-{stop} of {len(leaves)})"
+        _display_rows(get_comparison_rows(leaves, translated, start, stop), page_title)
+        start = stop
+        if start >= len(leaves) or not Confirm.ask(Text("Show more?", style="bold cyan"), default=True):
+            break
 
 
 def display_available_languages(languages):
@@ -83,71 +122,130 @@ def display_available_languages(languages):
     console.print(table)
 
 
-def display_translation_sample(data, translations, sample_size=3):
+def get_translation_sample(leaves, translated_data, sample_size=3):
+    """Pick the first items of a translation for a preview.
+    
+    The sample is small, so it can be kept once the translated document is
+    saved and released.
+    
+    Args:
+        leaves (LeafIndex): Index of the original data
+        translated_data (dict): Translated data
+        sample_size (int): Number of items in the sample
+        
+    Returns:
+        tuple: (comparison rows, total number of items)
+    """
+    return get_comparison_rows(leaves, translated_data, 0, sample_size), len(leaves)
+
+
+def display_translation_sample(data, translations, sample_size=3, leaves=None):
     """Display a sample of translations for each language.
     
     Args:
         data (dict): Original data
         translations (dict): Dictionary of translated data by language code
         sample_size (int): Number of items to show in the sample
+        leaves (LeafIndex, optional): Index of the original data, built once for all languages if not given
+    """
+    from json_translator.translation.leaf_index import LeafIndex
+
+    if leaves is None:
+        leaves = LeafIndex(data)
+    display_translation_samples({
+        lang: get_translation_sample(leaves, translated_data, sample_size)
+        for lang, translated_data in translations.items()
+    })
+
+
+def display_translation_samples(samples):
+    """Display translation samples taken with get_translation_sample.
+    
+    Args:
+        samples (dict): Sample by language code
     """
     from json_translator.utils.language_utils import get_language_name
     
     console.print()
     
-    # For each language, show a sample comparison
-    for lang, translated_data in translations.items():
-        # For nested structures, we'll show a sample of flattened keys
-        def flatten_dict(d, parent_key=''):
-            items = []
-            for k, v in d.items():
-                new_key = f"{parent_key}.{k}" if parent_key else k
-                if isinstance(v, dict):
-                    items.extend(flatten_dict(v, new_key).items())
-                else:
-                    items.append((new_key, v))
-            return dict(items)
-        
-        flat_data = flatten_dict(data)
-        flat_translated = flatten_dict(translated_data)
-        
-        sample_size = min(sample_size, len(flat_data))
-        sample_keys = list(flat_data.keys())[:sample_size]
-        
-        # Create sample dictionaries for display
-        # We need to reconstruct nested dictionaries from the flattened keys
-        sample_original = {}
-        sample_translated = {}
-        
-        for key in sample_keys:
-            parts = key.split('.')
-            
-            # Build the nested structure for original data
-            current = sample_original
-            for i, part in enumerate(parts[:-1]):
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
-            current[parts[-1]] = flat_data[key]
-            
-            # Build the nested structure for translated data
-            current = sample_translated
-            for i, part in enumerate(parts[:-1]):
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
-            current[parts[-1]] = flat_translated[key]
-        
+    for lang, (rows, total) in samples.items():
         language_name = get_language_name(lang)
-        
-        display_comparison(
-            sample_original, 
-            sample_translated, 
-            f"{language_name} ({lang}) Preview ({sample_size} of {len(flat_data)} items)"
-        )
+        _display_rows(rows, f"{language_name} ({lang}) Preview ({len(rows)} of {total} items)")
         console.print()
 
 
+def display_cache_summary(cache):
+    """Display the translation cache hits and misses of a run.
+    
+    Args:
+        cache (TranslationCache or None): Translation cache, None if caching is disabled
+    """
+    if cache is not None:
+        console.print(f"[bold blue]ℹ[/bold blue] Translation cache: [bold]{cache.hits}[/bold] hits, [bold]{cache.misses}[/bold] misses")
+
+
+def display_metrics_summary(metrics):
+    """Display the requests, billed characters and request latency of a run.
+    
+    Args:
+        metrics (TranslationMetrics): Metrics collected while translating
+    """
+    from json_translator.translation.metrics import LatencyHistogram
+
+    if not metrics.requests:
+        return
+    latency = LatencyHistogram()
+    for language in metrics.languages.values():
+        latency.merge(language.latency)
+    console.print(f"[bold blue]ℹ[/bold blue] Sent [bold]{metrics.requests}[/bold] requests "
+                  f"([bold]{metrics.retries}[/bold] retries), [bold]{metrics.characters_billed}[/bold] characters billed, "
+                  f"latency p50 [bold]{latency.percentile(50):.2f}s[/bold] / p90 [bold]{latency.percentile(90):.2f}s[/bold]")
+
+
+def display_plan_summary(plan):
+    """Display the estimated requests, characters, cost and duration of a dry run.
+    
+    Args:
+        plan (dict): Plan built by build_translation_plan
+    """
+    table = Table(title="Translation Plan", box=box.ROUNDED)
+    table.add_column("Language", style="cyan")
+    table.add_column("Reused", justify="right")
+    table.add_column("Cached", justify="right")
+    table.add_column("To translate", justify="right")
+    table.add_column("Requests", justify="right")
+    table.add_column("Characters", justify="right", style="bold")
+    table.add_column("Cost", justify="right", style="green")
+    
+    for code, language in plan["languages"].items():
+        table.add_row(code, str(language["reused"] + language["resumed"]), str(language["cached"]),
+                      str(language["pending"]), str(language["requests"]), f"{language['characters']:,}",
+                      f"${language['estimated_cost']:.2f}")
+    table.add_row("[bold]Total[/bold]", "", "", "", f"[bold]{plan['requests']}[/bold]",
+                  f"{plan['characters']:,}", f"${plan['estimated_cost']:.2f}")
+    
+    console.print(table)
+    latency_source = "past run" if plan["latency_source"] == "report" else "default"
+    console.print(f"[bold blue]ℹ[/bold blue] [bold]{plan['strings']}[/bold] strings, [bold]{plan['unique_strings']}[/bold] unique, "
+                  f"[bold]{plan['skipped_strings']}[/bold] skipped by rules; "
+                  f"estimated duration [bold]{plan['estimated_seconds']:.0f}s[/bold] with {plan['concurrency']} requests "
+                  f"in flight ({latency_source} latency)")
+
+
+def display_save_summary(outcomes):
+    """Display how many saved files were left untouched because their content didn't change.
+    
+    Args:
+        outcomes (dict): Outcome of save_json_files by file path
+    """
+    from json_translator.utils.file_operations import UNCHANGED
+
+    unchanged = sum(1 for outcome in outcomes.values() if outcome == UNCHANGED)
+    if unchanged:
+        console.print(f"[bold blue]ℹ[/bold blue] [bold]{unchanged}[/bold] of [bold]{len(outcomes)}[/bold] files "
+                      f"were unchanged and left untouched")
+
+
 def display_success_message(saved_files):
     """Display a success message with the list of saved files.
     
@@ -1,14 +1,30 @@
 """File operation utilities for JSON Translator."""
 
+import glob
+import hashlib
 import json
 import sys
 import os
+import threading
 from rich.console import Console
 from rich.panel import Panel
 
+# orjson is optional; it is used to save files when it gives the same output as json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Initialize console
 console = Console(width=100, highlight=True)
 
+# Outcomes of write_json_file
+WRITTEN = "written"
+UNCHANGED = "unchanged"
+
+# Integers orjson can serialize
+_ORJSON_INT_RANGE = (-2 ** 63, 2 ** 64 - 1)
+
 
 def load_json_file(file_path):
     """Load JSON from a file.
@@ -28,9 +44,109 @@ def load_json_file(file_path):
         sys.exit(1)
 
 
+def _orjson_compatible(data):
+    # orjson matches json's output except for floats, non-string keys and large integers
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                if type(key) is not str:
+                    return False
+                stack.append(value)
+        elif isinstance(obj, list):
+            stack.extend(obj)
+        elif obj is None or type(obj) in (str, bool):
+            continue
+        elif type(obj) is int:
+            if not _ORJSON_INT_RANGE[0] <= obj <= _ORJSON_INT_RANGE[1]:
+                return False
+        else:
+            return False
+    return True
+
+
+def encode_json(data):
+    """Serialize JSON data the way files are saved: indented by 2 spaces, non-ASCII characters kept.
+    
+    Uses orjson when it is installed and gives the same bytes as json.
+    
+    Args:
+        data (dict): JSON data
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None and _orjson_compatible(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. lone surrogates; json reports them below
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_file_atomic(content, file_path):
+    """Write a file unless it already has the same content, replacing it atomically.
+    
+    The content is written to a temporary file next to the target, synced
+    to disk and renamed over it, so neither readers nor a crash ever leave
+    a partially written file.
+    
+    Args:
+        content (bytes): File content
+        file_path (str): Path of the file
+        
+    Returns:
+        str: WRITTEN, or UNCHANGED if the file already had this content
+        
+    Raises:
+        OSError: If the file could not be written
+    """
+    try:
+        if os.path.getsize(file_path) == len(content):
+            with open(file_path, "rb") as file:
+                if hashlib.sha256(file.read()).digest() == hashlib.sha256(content).digest():
+                    return UNCHANGED
+    except OSError:
+        pass  # Missing or unreadable; write it
+
+    temporary_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporary_path, "wb") as file:
+            file.write(content)
+            # Make the content durable before the rename, so a crash can't leave an empty file behind
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, file_path)
+    except OSError:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+    return WRITTEN
+
+
+def write_json_file(data, file_path):
+    """Save JSON to a file atomically, skipping the write if the file is unchanged.
+    
+    Args:
+        data (dict): JSON data to save
+        file_path (str): Path to save the file
+        
+    Returns:
+        str: WRITTEN or UNCHANGED
+        
+    Raises:
+        OSError, ValueError: If the data could not be serialized or written
+    """
+    return write_file_atomic(encode_json(data), file_path)
+
+
 def save_json_file(data, file_path):
     """Save JSON to a file.
     
+    The file is replaced atomically and left untouched if its content
+    would not change.
+    
     Args:
         data (dict): JSON data to save
         file_path (str): Path to save the file
@@ -39,8 +155,7 @@ def save_json_file(data, file_path):
         bool: True if successful, False otherwise
     """
     try:
-        with open(file_path, "w", encoding="utf-8") as file:
-            json.dump(data, file, ensure_ascii=False, indent=2)
+        write_json_file(data, file_path)
         return True
     except Exception as e:
         console.print(Panel(f"[bold red]Error saving file:[/bold red] {str(e)}", 
@@ -48,11 +163,39 @@ def save_json_file(data, file_path):
         return False
 
 
-def ensure_directory_exists(directory_path):
+def save_json_files(files, on_saved=None):
+    """Save several JSON files, reporting each failure without stopping.
+    
+    The files are saved one after the other: serializing holds the GIL, so
+    saving them from several threads is no faster.
+    
+    Args:
+        files (dict): JSON data to save by file path
+        on_saved (callable, optional): Called with (file path, outcome) after each file, where
+            the outcome is WRITTEN, UNCHANGED or None if the file could not be saved
+        
+    Returns:
+        dict: Outcome by file path
+    """
+    outcomes = {}
+    for file_path, data in files.items():
+        try:
+            outcomes[file_path] = write_json_file(data, file_path)
+        except Exception as e:
+            outcomes[file_path] = None
+            console.print(Panel(f"[bold red]Error saving file {file_path}:[/bold red] {str(e)}", 
+                               border_style="red", title="Error"))
+        if on_saved is not None:
+            on_saved(file_path, outcomes[file_path])
+    return outcomes
+
+
+def ensure_directory_exists(directory_path, quiet=False):
     """Ensure that a directory exists, create it if it doesn't.
     
     Args:
         directory_path (str): Path to the directory
+        quiet (bool): Don't report that the directory was created
         
     Returns:
         bool: True if the directory exists or was created successfully
@@ -60,10 +203,31 @@ def ensure_directory_exists(directory_path):
     if not os.path.exists(directory_path):
         try:
             os.makedirs(directory_path)
-            console.print(f"[bold green]✓[/bold green] Created output directory: [bold cyan]{directory_path}[/bold cyan]")
+            if not quiet:
+                console.print(f"[bold green]✓[/bold green] Created output directory: [bold cyan]{directory_path}[/bold cyan]")
             return True
         except Exception as e:
             console.print(Panel(f"[bold red]Error creating directory:[/bold red] {str(e)}", 
                                border_style="red", title="Error"))
             return False
-    return True 
\ No newline at end of file
+    return True
+
+
+def find_json_files(input_dir, pattern="**/*.json", exclude_dirs=()):
+    """Find the JSON files of a directory matching a glob pattern.
+    
+    Args:
+        input_dir (str): Directory to search
+        pattern (str): Glob pattern relative to the directory; ``**`` matches any number of subdirectories
+        exclude_dirs (iterable): Names of directories whose files are skipped, at any depth
+        
+    Returns:
+        list: Sorted file paths relative to the directory
+    """
+    exclude_dirs = set(exclude_dirs)
+    file_paths = []
+    for file_path in glob.glob(os.path.join(glob.escape(input_dir), pattern), recursive=True):
+        relative_path = os.path.relpath(file_path, input_dir)
+        if os.path.isfile(file_path) and exclude_dirs.isdisjoint(relative_path.split(os.sep)[:-1]):
+            file_paths.append(relative_path)
+    return sorted(file_paths)
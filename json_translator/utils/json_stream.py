@@ -0,0 +1,195 @@
+"""Streaming JSON reading and writing for JSON Translator.
+
+Documents are processed as a flat sequence of parser events, following the
+event names used by ijson: start_map, map_key, end_map, start_array,
+end_array, string, number, boolean and null. ijson is used for parsing when
+it is installed; otherwise a built-in incremental parser is used.
+"""
+
+import codecs
+import json
+import re
+from json.decoder import scanstring
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # ijson not installed, will use the built-in parser
+
+# Number of characters read from the input at a time
+READ_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(\.\d+)?([eE][-+]?\d+)?")
+_LITERALS = {"true": ("boolean", True), "false": ("boolean", False), "null": ("null", None)}
+
+
+def _iter_builtin_events(file):
+    buffer = ""
+    position = 0
+    eof = False
+    # True for objects, False for arrays
+    containers = []
+    expect_key = False
+
+    while True:
+        position = _WHITESPACE.match(buffer, position).end()
+        if position >= len(buffer) or (not eof and len(buffer) - position < 5):
+            # Refill the buffer, keeping the unparsed remainder
+            if eof:
+                if position >= len(buffer):
+                    break
+            else:
+                data = file.read(READ_SIZE)
+                eof = not data
+                buffer = buffer[position:] + data
+                position = 0
+                continue
+
+        char = buffer[position]
+        if char == '"':
+            try:
+                value, end = scanstring(buffer, position + 1)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # The string continues in the next chunk
+                data = file.read(READ_SIZE)
+                eof = not data
+                buffer = buffer[position:] + data
+                position = 0
+                continue
+            position = end
+            if expect_key:
+                expect_key = False
+                yield "map_key", value
+            else:
+                yield "string", value
+        elif char == "{":
+            position += 1
+            containers.append(True)
+            expect_key = True
+            yield "start_map", None
+        elif char == "[":
+            position += 1
+            containers.append(False)
+            yield "start_array", None
+        elif char in "}]":
+            if not containers or containers.pop() != (char == "}"):
+                raise ValueError(f"Unexpected '{char}' in JSON input")
+            position += 1
+            expect_key = False
+            yield ("end_map" if char == "}" else "end_array"), None
+        elif char == ",":
+            position += 1
+            expect_key = bool(containers) and containers[-1]
+        elif char == ":":
+            position += 1
+        else:
+            match = _NUMBER.match(buffer, position)
+            if match:
+                if match.end() == len(buffer) and not eof:
+                    # The number may continue in the next chunk
+                    data = file.read(READ_SIZE)
+                    eof = not data
+                    buffer = buffer[position:] + data
+                    position = 0
+                    continue
+                text = match.group()
+                position = match.end()
+                yield "number", float(text) if match.group(1) or match.group(2) else int(text)
+                continue
+            for literal, event in _LITERALS.items():
+                if buffer.startswith(literal, position):
+                    position += len(literal)
+                    yield event
+                    break
+            else:
+                raise ValueError(f"Invalid JSON input near: {buffer[position:position + 20]!r}")
+
+    if containers:
+        raise ValueError("Unexpected end of JSON input")
+
+
+def iter_json_events(file_path):
+    """Iterate over the parser events of a JSON file without loading it whole.
+
+    Args:
+        file_path (str): Path to the JSON file
+
+    Yields:
+        tuple: (event, value) pairs
+
+    Raises:
+        ValueError: For malformed JSON, whichever parser is used
+    """
+    with open(file_path, "rb") as file:
+        if ijson is not None:
+            try:
+                # ijson yields Decimal numbers by default; match json.load instead
+                yield from ijson.basic_parse(file, use_float=True)
+            except ijson.JSONError as e:
+                # Not a ValueError, unlike the errors of the built-in parser
+                raise ValueError(str(e)) from e
+        else:
+            yield from _iter_builtin_events(codecs.getreader("utf-8")(file))
+
+
+class JsonStreamWriter:
+    """Write a JSON document from parser events.
+
+    The output is the same as ``json.dump(data, file, ensure_ascii=False,
+    indent=indent)`` for the document the events describe.
+    """
+
+    def __init__(self, file, indent=2):
+        """Create a streaming writer.
+
+        Args:
+            file: File object opened for writing text
+            indent (int, optional): Indentation width, or None for a single line
+        """
+        self._file = file
+        self._indent = indent
+        self._item_separator = "," if indent is not None else ", "
+        # Number of items written so far in each open container
+        self._item_counts = []
+        self._after_key = False
+
+    def _begin_item(self):
+        if not self._item_counts:
+            return
+        if self._item_counts[-1]:
+            self._file.write(self._item_separator)
+        self._item_counts[-1] += 1
+        if self._indent is not None:
+            self._file.write("\n" + " " * (self._indent * len(self._item_counts)))
+
+    def _begin_value(self):
+        if self._after_key:
+            self._after_key = False
+        else:
+            self._begin_item()
+
+    def write_event(self, event, value=None):
+        """Write one parser event.
+
+        Args:
+            event (str): Event name
+            value: Event value, for map_key and scalar events
+        """
+        if event == "map_key":
+            self._begin_item()
+            self._file.write(json.dumps(value, ensure_ascii=False) + ": ")
+            self._after_key = True
+        elif event in ("start_map", "start_array"):
+            self._begin_value()
+            self._file.write("{" if event == "start_map" else "[")
+            self._item_counts.append(0)
+        elif event in ("end_map", "end_array"):
+            if self._item_counts.pop() and self._indent is not None:
+                self._file.write("\n" + " " * (self._indent * len(self._item_counts)))
+            self._file.write("}" if event == "end_map" else "]")
+        else:
+            self._begin_value()
+            self._file.write(json.dumps(value, ensure_ascii=False))
@@ -0,0 +1,187 @@
+"""Registry of the supported target languages for JSON Translator.
+
+The registry starts from a built-in list of languages with their native
+names. The full list of languages supported by the translation backend is
+fetched once and kept in a languages file in the cache directory, so later
+runs validate and name languages without a network call until the file is
+older than its time to live.
+"""
+
+import json
+import os
+import time
+
+from json_translator.utils.file_operations import write_file_atomic
+
+# Built-in languages, by code, with their native names
+BUILTIN_LANGUAGES = {
+    "en": "English",
+    "id": "Bahasa Indonesia",
+    "ms": "Bahasa Melayu",
+    "cs": "Čeština",
+    "da": "Dansk",
+    "de": "Deutsch",
+    "es": "Español",
+    "fil": "Filipino",
+    "fr": "Français",
+    "hr": "Hrvatski",
+    "it": "Italiano",
+    "nl": "Nederlands",
+    "no": "Norsk",
+    "pl": "Polski",
+    "pt": "Português",
+    "pt-BR": "Português (Brasileiro)",
+    "ro": "Romanian",
+    "sr": "Србија",
+    "ru": "Русский",
+    "fi": "Suomi",
+    "sv": "Svenska",
+    "tr": "Türkçe",
+    "vi": "Tiếng Việt",
+    "th": "ไทย",
+    "el": "Ελληνικά",
+    "ko": "한국어",
+    "ja": "日本語",
+    "zh": "中文",
+    "zh-TW": "繁體中文",
+    "ar": "Arabic",
+    "hi": "Hindi",
+}
+
+LANGUAGES_FILE_NAME = "languages.json"
+
+# Days before the languages fetched from the backend are fetched again
+DEFAULT_LANGUAGES_TTL_DAYS = 7
+
+
+class LanguageRegistry:
+    """Supported language codes and their names, with constant-time lookups."""
+
+    def __init__(self, languages):
+        """Create a registry.
+
+        Args:
+            languages (dict): Language name by code, in display order
+        """
+        self._names = dict(languages)
+        self.codes = list(self._names)
+
+    def __contains__(self, code):
+        return code in self._names
+
+    def __len__(self):
+        return len(self._names)
+
+    def get_name(self, code):
+        """Return the name of a language.
+
+        Args:
+            code (str): Language code
+
+        Returns:
+            str or None: Language name, or None for an unsupported code
+        """
+        return self._names.get(code)
+
+
+_registry = LanguageRegistry(BUILTIN_LANGUAGES)
+
+
+def get_language_registry():
+    """Return the registry of the supported languages.
+
+    Returns:
+        LanguageRegistry: Current registry
+    """
+    return _registry
+
+
+def get_languages_file_path(cache_dir):
+    """Return the path of the languages file in a cache directory.
+
+    Args:
+        cache_dir (str): Cache directory path
+
+    Returns:
+        str: Languages file path
+    """
+    return os.path.join(cache_dir, LANGUAGES_FILE_NAME)
+
+
+def read_languages_file(file_path, ttl_days=DEFAULT_LANGUAGES_TTL_DAYS):
+    """Read the languages fetched from a backend.
+
+    Args:
+        file_path (str): Languages file path
+        ttl_days (float): Maximum age of the file content in days
+
+    Returns:
+        tuple: (language name by code, True if older than ttl_days), or (None, True) if the
+        file is missing or unreadable
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as file:
+            content = json.load(file)
+        languages = {str(code): str(name) for code, name in content["languages"].items()}
+        expired = time.time() - float(content["fetched_at"]) > ttl_days * 86400
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None, True
+    return languages, expired
+
+
+def write_languages_file(file_path, languages, backend_name=None):
+    """Save the languages fetched from a backend.
+
+    Args:
+        file_path (str): Languages file path
+        languages (dict): Language name by code
+        backend_name (str, optional): Name of the backend the languages were fetched from
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    content = {"backend": backend_name, "fetched_at": time.time(), "languages": languages}
+    try:
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        write_file_atomic(json.dumps(content, indent=2, ensure_ascii=False).encode("utf-8"), file_path)
+    except OSError:
+        return False
+    return True
+
+
+def load_language_registry(cache_dir=None, backend=None, ttl_days=DEFAULT_LANGUAGES_TTL_DAYS):
+    """Rebuild the registry from the built-in languages and the languages file.
+
+    With a backend, the supported languages are fetched from it and saved
+    when the languages file is missing or expired. A
+    failed fetch keeps the languages already known. Built-in codes are
+    always supported and keep their native names.
+
+    Args:
+        cache_dir (str, optional): Directory of the languages file; nothing is read or saved without it
+        backend (TranslationBackend, optional): Backend to fetch the supported languages from
+        ttl_days (float): Maximum age of the languages file in days
+
+    Returns:
+        LanguageRegistry: The new registry
+    """
+    global _registry
+
+    file_path = get_languages_file_path(cache_dir) if cache_dir else None
+    fetched, expired = read_languages_file(file_path, ttl_days) if file_path else (None, True)
+
+    if backend is not None and expired:
+        try:
+            languages = backend.get_supported_languages()
+        except Exception:
+            languages = None
+        if languages:
+            fetched = languages
+            if file_path:
+                write_languages_file(file_path, languages, backend.name)
+
+    languages = dict(BUILTIN_LANGUAGES)
+    for code, name in (fetched or {}).items():
+        languages.setdefault(code, name)
+    _registry = LanguageRegistry(languages)
+    return _registry
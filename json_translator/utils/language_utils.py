@@ -4,6 +4,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
+from json_translator.utils.language_registry import get_language_registry
+
 # Initialize console
 console = Console(width=100, highlight=True)
 
@@ -17,44 +19,11 @@ def get_language_name(code):
     Returns:
         str: Full language name
     """
-    language_names = {
-        "en": "English",
-        "id": "Bahasa Indonesia",
-        "ms": "Bahasa Melayu",
-        "cs": "Čeština",
-        "da": "Dansk",
-        "de": "Deutsch",
-        "es": "Español",
-        "fil": "Filipino",
-        "fr": "Français",
-        "hr": "Hrvatski",
-        "it": "Italiano",
-        "nl": "Nederlands",
-        "no": "Norsk",
-        "pl": "Polski",
-        "pt": "Português",
-        "pt-BR": "Português (Brasileiro)",
-        "ro": "Romanian",
-        "sr": "Србија",
-        "ru": "Русский",
-        "fi": "Suomi",
-        "sv": "Svenska",
-        "tr": "Türkçe",
-        "vi": "Tiếng Việt",
-        "th": "ไทย",
-        "el": "Ελληνικά",
-        "ko": "한국어",
-        "ja": "日本語",
-        "zh": "中文",
-        "zh-TW": "繁體中文",
-        "ar": "Arabic",
-        "hi": "Hindi",
-    }
-    return language_names.get(code, f"Language code: {code}")
+    return get_language_registry().get_name(code) or f"Language code: {code}"
 
 
 def is_valid_language_code(code):
-    """Check if a language code is valid for Google Translate API.
+    """Check if a language code is supported by the translation backend.
     
     Args:
         code (str): Language code to check
@@ -62,13 +31,7 @@ def is_valid_language_code(code):
     Returns:
         bool: True if valid, False otherwise
     """
-    valid_languages = {
-        "en", "id", "ms", "cs", "da", "de", "es", "fil", "fr", "hr", "it",
-        "nl", "no", "pl", "pt", "pt-BR", "ro", "sr", "ru", "fi", "sv", "tr",
-        "vi", "th", "el", "ko", "ja", "zh", "zh-TW", "ar", "hi"
-        # Add more language codes as needed
-    }
-    return code in valid_languages
+    return code in get_language_registry()
 
 
 def get_available_languages():
@@ -77,11 +40,7 @@ def get_available_languages():
     Returns:
         list: List of supported language codes
     """
-    return [
-        "en", "id", "ms", "cs", "da", "de", "es", "fil", "fr", "hr", "it",
-        "nl", "no", "pl", "pt", "pt-BR", "ro", "sr", "ru", "fi", "sv", "tr",
-        "vi", "th", "el", "ko", "ja", "zh", "zh-TW", "ar", "hi"
-    ]
+    return list(get_language_registry().codes)
 
 
 def display_language_info(target_languages):
@@ -0,0 +1,109 @@
+"""Prometheus text format export of run metrics for JSON Translator.
+
+The file is meant for the node_exporter textfile collector, which reads
+every ``*.prom`` file of a directory, so it is replaced atomically.
+"""
+
+import os
+
+from json_translator.translation.metrics import LATENCY_PERCENTILES
+
+# Prefix of every metric name
+METRIC_PREFIX = "json_translator"
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def format_prometheus_metrics(metrics, labels=None):
+    """Format run metrics in the Prometheus text exposition format.
+
+    Safe to call while other threads record metrics.
+
+    Args:
+        metrics (TranslationMetrics): Metrics collected while translating
+        labels (dict, optional): Labels added to every sample, e.g. {"project": "web"}
+
+    Returns:
+        str: Metrics text
+    """
+    with metrics.lock:
+        return _format_prometheus_metrics(metrics, labels or {})
+
+
+def _format_prometheus_metrics(metrics, labels):
+    lines = []
+
+    def add(name, metric_type, help_text, samples):
+        lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {METRIC_PREFIX}_{name} {metric_type}")
+        for sample_labels, value, suffix in samples:
+            lines.append(f"{METRIC_PREFIX}_{name}{suffix}{_format_labels({**labels, **sample_labels})} {value}")
+
+    languages = sorted(metrics.languages.items())
+
+    def per_language(attribute):
+        return [({"language": code}, getattr(language, attribute), "") for code, language in languages]
+
+    add("strings", "gauge", "Strings found in the input.", [({}, metrics.strings, "")])
+    add("unique_strings", "gauge", "Distinct strings after deduplication.", [({}, metrics.unique_strings, "")])
+    add("skipped_strings", "gauge", "Strings copied through without translation, by skip rule.",
+        [({"rule": rule}, count, "") for rule, count in sorted(metrics.skipped.items())])
+    add("skipped_characters", "gauge", "Characters of the strings copied through without translation.",
+        [({}, metrics.skipped_characters, "")])
+    add("dedup_savings_ratio", "gauge", "Fraction of strings not sent thanks to deduplication.",
+        [({}, round(metrics.dedup_savings, 6), "")])
+    add("cache_hit_ratio", "gauge", "Fraction of translation cache lookups that found a translation.",
+        [({}, round(metrics.cache_hit_rate, 6), "")])
+    add("requests", "gauge", "Requests sent to the translation backend, including retries.", per_language("requests"))
+    add("retries", "gauge", "Requests retried after a transient error.", per_language("retries"))
+    add("characters_billed", "gauge", "Characters of the successfully translated batches.",
+        per_language("characters_billed"))
+    add("cache_hits", "gauge", "Strings found in the translation cache.", per_language("cached"))
+    add("cache_misses", "gauge", "Strings looked up in the translation cache and not found.",
+        per_language("cache_misses"))
+    add("translated_strings", "gauge", "Strings translated by the backend.", per_language("translated"))
+    add("failed_strings", "gauge", "Strings that could not be translated.", per_language("failed"))
+
+    latency_samples = []
+    for code, language in languages:
+        for percent in LATENCY_PERCENTILES:
+            latency_samples.append(({"language": code, "quantile": str(percent / 100)},
+                                    round(language.latency.percentile(percent), 6), ""))
+        latency_samples.append(({"language": code}, round(language.latency.sum, 6), "_sum"))
+        latency_samples.append(({"language": code}, language.latency.count, "_count"))
+    add("request_latency_seconds", "summary", "Latency of the requests sent to the translation backend.",
+        latency_samples)
+
+    add("phase_seconds", "gauge", "Seconds spent in each phase of the translation.",
+        [({"phase": phase}, round(seconds, 6), "") for phase, seconds in sorted(metrics.phases.items())])
+
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(metrics, file_path, labels=None):
+    """Write run metrics to a Prometheus textfile, replacing it atomically.
+
+    Args:
+        metrics (TranslationMetrics): Metrics collected while translating
+        file_path (str): Path of the textfile, usually ending in ``.prom``
+        labels (dict, optional): Labels added to every sample
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    temporary_path = file_path + ".tmp"
+    try:
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.write(format_prometheus_metrics(metrics, labels))
+        os.replace(temporary_path, file_path)
+        return True
+    except OSError:
+        return False
@@ -0,0 +1,86 @@
+"""Machine-readable run reports for JSON Translator."""
+
+from json_translator.translation.translator import format_path
+from json_translator.utils.file_operations import save_json_file
+
+
+def build_run_report(input_file, target_languages, metrics, translated_languages, saved_files,
+                     failed_paths=None, timings=None, cache=None, backend_name=None):
+    """Build a JSON-serializable report of a translation run.
+
+    Args:
+        input_file (str): Input file path
+        target_languages (list): Requested target language codes
+        metrics (TranslationMetrics): Metrics collected while translating
+        translated_languages (list): Language codes with at least one translated string
+        saved_files (dict): Saved output file path by language code
+        failed_paths (dict, optional): Paths that could not be translated, by language code
+        timings (dict, optional): Seconds spent in each phase of the run, by phase name
+        cache (TranslationCache, optional): Translation cache used for the run
+        backend_name (str, optional): Name of the translation backend
+
+    Returns:
+        dict: Run report
+    """
+    failed_paths = failed_paths or {}
+
+    languages = {}
+    for lang in target_languages:
+        if lang not in translated_languages:
+            status = "failed"
+        elif failed_paths.get(lang):
+            status = "partial"
+        else:
+            status = "success"
+        languages[lang] = {
+            "status": status,
+            **metrics.language(lang).to_dict(),
+            "output": saved_files.get(lang),
+            "failed_paths": [format_path(path) for path in failed_paths.get(lang, [])],
+        }
+
+    statuses = {language["status"] for language in languages.values()}
+    if statuses <= {"success"}:
+        status = "success"
+    elif statuses == {"failed"}:
+        status = "failed"
+    else:
+        status = "partial"
+
+    return {
+        "status": status,
+        "input": input_file,
+        "backend": backend_name,
+        "strings": metrics.strings,
+        "unique_strings": metrics.unique_strings,
+        "dedup_savings": round(metrics.dedup_savings, 4),
+        "skipped": {
+            "strings": metrics.skipped_strings,
+            "characters": metrics.skipped_characters,
+            "rules": dict(metrics.skipped),
+        },
+        "requests": metrics.requests,
+        "retries": metrics.retries,
+        "characters_billed": metrics.characters_billed,
+        "cache": {
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "hit_rate": round(metrics.cache_hit_rate, 4),
+        } if cache is not None else None,
+        "timings": {phase: round(seconds, 3) for phase, seconds in (timings or {}).items()},
+        "phases": {phase: round(seconds, 3) for phase, seconds in metrics.phases.items()},
+        "languages": languages,
+    }
+
+
+def write_run_report(report, file_path):
+    """Write a run report to a JSON file.
+
+    Args:
+        report (dict): Run report
+        file_path (str): Path to save the report
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return save_json_file(report, file_path)